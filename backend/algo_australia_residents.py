@@ -6,11 +6,14 @@ Hybrid approach: Smart recommendations for both Australian residents and interna
 NO visa/language filtering - focus on lifestyle, climate, work preferences matching
 """
 
+import heapq
 import json
 from typing import Dict, List, Tuple, Any, Optional
 import logging
 from pathlib import Path
 
+from core.contributions import ContributionRow
+
 class AustraliaResidentsAlgorithm:
     """
     Hybrid algorithm for Australian city recommendations.
@@ -332,17 +335,27 @@ class AustraliaResidentsAlgorithm:
         Calculate weighted score for a city based on adapted weights.
         Includes lifestyle bonus from filtering.
         """
+        return self.score_city_with_contributions(city, adapted_weights)[0]
+
+    def score_city_with_contributions(self, city: Dict, adapted_weights: Dict[str, float]) -> Tuple[float, ContributionRow]:
+        """
+        Same score as calculate_city_score, plus the per-criteria contribution
+        row (criteria -> (city score, score * weight)) built in the same pass.
+        """
         total_score = 0.0
+        contributions = {}
 
         for criteria, weight in adapted_weights.items():
             city_score = city['scores'].get(criteria, 0.0)
-            total_score += city_score * weight
+            weighted_contribution = city_score * weight
+            contributions[criteria] = (city_score, weighted_contribution)
+            total_score += weighted_contribution
 
         # Apply lifestyle bonus if applicable
         lifestyle_bonus = city.get('_lifestyle_bonus', 1.0)
         total_score *= lifestyle_bonus
 
-        return min(total_score, 1.0)  # Cap at 1.0
+        return min(total_score, 1.0), contributions  # Cap at 1.0
 
     def get_recommendations(self, questionnaire_responses: Dict, top_n: int = 3) -> Dict:
         """
@@ -373,19 +386,25 @@ class AustraliaResidentsAlgorithm:
             # Calculate scores for filtered cities
             scored_cities = []
             for city in filtered_cities:
-                score = self.calculate_city_score(city, adapted_weights)
-                scored_cities.append({
+                score, contributions = self.score_city_with_contributions(city, adapted_weights)
+                scored_cities.append(({
                     'city': city['name'],
                     'state': city['state'],
                     'score_percentage': score * 100,
                     'population': city['population'],
-                    'coordinates': city['coordinates'],
-                    'top_criteria': self.get_top_criteria_for_city(city, adapted_weights)
-                })
+                    'coordinates': city['coordinates']
+                }, city, contributions))
 
             # Sort by score and return top recommendations
-            scored_cities.sort(key=lambda x: x['score_percentage'], reverse=True)
-            top_recommendations = scored_cities[:top_n]
+            scored_cities.sort(key=lambda x: x[0]['score_percentage'], reverse=True)
+
+            # Criteria breakdown only for the returned cities, from the scoring row
+            top_recommendations = []
+            for recommendation, city, contributions in scored_cities[:top_n]:
+                recommendation['top_criteria'] = self.get_top_criteria_for_city(
+                    city, adapted_weights, contributions=contributions
+                )
+                top_recommendations.append(recommendation)
 
             self.logger.info(f"🇦🇺 Returning {len(top_recommendations)} Australia recommendations")
 
@@ -405,23 +424,25 @@ class AustraliaResidentsAlgorithm:
                 "recommendations": []
             }
 
-    def get_top_criteria_for_city(self, city: Dict, weights: Dict[str, float], top_n: int = 3) -> List[Dict]:
+    def get_top_criteria_for_city(self, city: Dict, weights: Dict[str, float], top_n: int = 3,
+                                  contributions: Optional[ContributionRow] = None) -> List[Dict]:
         """Get the top criteria that make this city appealing"""
-        criteria_scores = []
+        if contributions is None:
+            contributions = self.score_city_with_contributions(city, weights)[1]
 
-        for criteria, weight in weights.items():
-            city_score = city['scores'].get(criteria, 0.0)
-            weighted_contribution = city_score * weight
+        # Partial top-N selection by (displayed) contribution, no full sort
+        top_criteria = heapq.nlargest(
+            top_n, contributions.items(), key=lambda item: round(item[1][1] * 100, 2)
+        )
 
-            criteria_scores.append({
+        return [
+            {
                 'criteria': criteria.replace('_', ' ').title(),
                 'score': round(city_score * 100, 1),
                 'contribution': round(weighted_contribution * 100, 2)
-            })
-
-        # Sort by contribution and return top criteria
-        criteria_scores.sort(key=lambda x: x['contribution'], reverse=True)
-        return criteria_scores[:top_n]
+            }
+            for criteria, (city_score, weighted_contribution) in top_criteria
+        ]
 
     def get_health_check(self) -> Dict:
         """Health check for the algorithm"""
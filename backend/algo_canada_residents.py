@@ -8,12 +8,38 @@ OBJECTIF: Recommandations précises basées sur profils canadiens et réalités
 
 import json
 import logging
+import operator
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from core.contributions import match_threshold_rules
+
 # Configuration logging
 logger = logging.getLogger(__name__)
 
+# 🇨🇦 Forces/préoccupations: (critère, comparaison, seuil, libellé), dans l'ordre d'affichage
+CANADA_STRENGTH_RULES = (
+    ('cost_of_living', operator.gt, 0.7, "Coût de la vie abordable"),
+    ('housing_affordability', operator.gt, 0.6, "Logement accessible"),
+    ('job_market', operator.gt, 0.8, "Marché du travail dynamique"),
+    ('tech_industry', operator.gt, 0.7, "Secteur technologique développé"),
+    ('climate_rating', operator.gt, 0.7, "Climat agréable"),
+    ('public_transport', operator.gt, 0.7, "Excellent transport public"),
+    ('school_quality', operator.gt, 0.8, "Écoles de qualité supérieure"),
+    ('healthcare_access', operator.gt, 0.8, "Accès aux soins de santé excellent"),
+    ('cultural_scene', operator.gt, 0.7, "Scène culturelle vibrante"),
+    ('walkability', operator.gt, 0.7, "Quartiers très marchables"),
+)
+
+CANADA_CONCERN_RULES = (
+    ('cost_of_living', operator.lt, 0.4, "Coût de la vie élevé"),
+    ('housing_affordability', operator.lt, 0.3, "Logement très cher"),
+    ('climate_rating', operator.lt, 0.4, "Climat rigoureux"),
+    ('job_market', operator.lt, 0.6, "Marché du travail limité"),
+    ('public_transport', operator.lt, 0.5, "Transport public insuffisant"),
+    ('car_dependency', operator.lt, 0.4, "Dépendance élevée à la voiture"),
+)
+
 @dataclass
 class UserProfileCanada:
     """Profil utilisateur Canada avec pondérations spécifiquement canadiennes"""
@@ -39,6 +65,11 @@ class CanadaResidentsAlgorithm:
         self.cities_data = self.load_cities_data(cities_data_path)
         self.criteria_weights_base = self.get_base_criteria_weights_canada()
 
+        # Forces/préoccupations indépendantes du profil: évaluées une fois par ville
+        self.city_highlights = {}
+        for city in self.cities_data.get('cities', []):
+            self.city_highlights[city['id']] = self.get_city_highlights_canada(city)
+
     def load_cities_data(self, data_path: str) -> Dict:
         """Charge les données des 30 villes canadiennes"""
         try:
@@ -496,55 +527,20 @@ class CanadaResidentsAlgorithm:
 
     def get_city_strengths_canada(self, city_data: Dict, user_profile: UserProfileCanada) -> List[str]:
         """💪 Identifie les forces principales d'une ville canadienne"""
-
-        strengths = []
-        scores = city_data['scores']
-
-        # Forces basées sur les scores élevés
-        if scores.get('cost_of_living', 0) > 0.7:
-            strengths.append("Coût de la vie abordable")
-        if scores.get('housing_affordability', 0) > 0.6:
-            strengths.append("Logement accessible")
-        if scores.get('job_market', 0) > 0.8:
-            strengths.append("Marché du travail dynamique")
-        if scores.get('tech_industry', 0) > 0.7:
-            strengths.append("Secteur technologique développé")
-        if scores.get('climate_rating', 0) > 0.7:
-            strengths.append("Climat agréable")
-        if scores.get('public_transport', 0) > 0.7:
-            strengths.append("Excellent transport public")
-        if scores.get('school_quality', 0) > 0.8:
-            strengths.append("Écoles de qualité supérieure")
-        if scores.get('healthcare_access', 0) > 0.8:
-            strengths.append("Accès aux soins de santé excellent")
-        if scores.get('cultural_scene', 0) > 0.7:
-            strengths.append("Scène culturelle vibrante")
-        if scores.get('walkability', 0) > 0.7:
-            strengths.append("Quartiers très marchables")
-
-        return strengths[:4]  # Top 4 forces
+        return list(self.get_city_highlights_canada(city_data)[0])
 
     def get_city_concerns_canada(self, city_data: Dict, user_profile: UserProfileCanada) -> List[str]:
         """⚠️ Identifie les préoccupations potentielles d'une ville canadienne"""
-
-        concerns = []
-        scores = city_data['scores']
-
-        # Préoccupations basées sur les scores faibles
-        if scores.get('cost_of_living', 1.0) < 0.4:
-            concerns.append("Coût de la vie élevé")
-        if scores.get('housing_affordability', 1.0) < 0.3:
-            concerns.append("Logement très cher")
-        if scores.get('climate_rating', 1.0) < 0.4:
-            concerns.append("Climat rigoureux")
-        if scores.get('job_market', 1.0) < 0.6:
-            concerns.append("Marché du travail limité")
-        if scores.get('public_transport', 1.0) < 0.5:
-            concerns.append("Transport public insuffisant")
-        if scores.get('car_dependency', 1.0) < 0.4:
-            concerns.append("Dépendance élevée à la voiture")
-
-        return concerns[:3]  # Top 3 préoccupations
+        return list(self.get_city_highlights_canada(city_data)[1])
+
+    def get_city_highlights_canada(self, city_data: Dict) -> Tuple[List[str], List[str]]:
+        """📌 Forces/préoccupations d'une ville: règles à seuils fixes, précalculées par ville"""
+        highlights = self.city_highlights.get(city_data.get('id'))
+        if highlights is None:
+            scores = city_data['scores']
+            highlights = (match_threshold_rules(scores, CANADA_STRENGTH_RULES, 4),
+                          match_threshold_rules(scores, CANADA_CONCERN_RULES, 3))
+        return highlights
 
     def generate_recommendation_reason_canada(self, city_data: Dict, user_profile: UserProfileCanada) -> str:
         """📝 Génère une raison personnalisée pour une recommandation canadienne"""
@@ -8,10 +8,14 @@ OBJECTIF: Recommandations précises basées sur profils français et priorités
 
 import json
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+from core.contributions import (
+    ContributionRow, important_criteria, score_with_contributions, top_contributions, weak_criteria
+)
+
 # Configuration logging
 logger = logging.getLogger(__name__)
 
@@ -288,23 +292,11 @@ class FranceResidentsAlgorithm:
 
     def calculate_city_score_france(self, city_data: Dict, user_profile: UserProfileFrance) -> float:
         """🧮 Calcule le score total d'une ville française pour un profil utilisateur"""
+        return self.score_city_with_contributions_france(city_data, user_profile)[0]
 
-        total_score = 0.0
-        total_weight = 0.0
-
-        for criterion, city_value in city_data['scores'].items():
-            if criterion in user_profile.criteria_weights:
-                weight = user_profile.criteria_weights[criterion]
-
-                # Score pondéré pour ce critère
-                criterion_score = city_value * weight
-                total_score += criterion_score
-                total_weight += weight
-
-        # Score normalisé (0.0 à 1.0)
-        normalized_score = total_score / total_weight if total_weight > 0 else 0.0
-
-        return normalized_score
+    def score_city_with_contributions_france(self, city_data: Dict, user_profile: UserProfileFrance) -> Tuple[float, ContributionRow]:
+        """🧮 Score normalisé + ligne de contribution par critère (une seule passe)"""
+        return score_with_contributions(city_data['scores'], user_profile.criteria_weights)
 
     def apply_france_bonuses(self, city_data: Dict, base_score: float, user_profile: UserProfileFrance) -> float:
         """🚀 Applique des bonus/malus spécifiquement français"""
@@ -389,19 +381,23 @@ class FranceResidentsAlgorithm:
 
         # Calculer score pour chaque ville française
         for city in self.cities_data['cities']:
-            base_score = self.calculate_city_score_france(city, user_profile)
+            base_score, contributions = self.score_city_with_contributions_france(city, user_profile)
             final_score = self.apply_france_bonuses(city, base_score, user_profile)
 
             city_scores.append({
                 'city_data': city,
                 'base_score': base_score,
                 'final_score': final_score,
-                'score_percentage': round(final_score * 100, 1)
+                'score_percentage': round(final_score * 100, 1),
+                'contributions': contributions
             })
 
         # Trier par score final
         city_scores.sort(key=lambda x: x['final_score'], reverse=True)
 
+        # Critères importants du profil: calculés une fois pour tout le TOP N
+        concern_criteria = important_criteria(user_profile.criteria_weights, 1.2)
+
         # Retourner TOP N avec informations détaillées
         top_recommendations = []
         for i, city_score in enumerate(city_scores[:top_n]):
@@ -412,52 +408,43 @@ class FranceResidentsAlgorithm:
                 'score_percentage': city_score['score_percentage'],
                 'population': city_score['city_data']['population'],
                 'coordinates': city_score['city_data']['coordinates'],
-                'top_strengths': self.get_city_strengths_france(city_score['city_data'], user_profile),
-                'potential_concerns': self.get_city_concerns_france(city_score['city_data'], user_profile),
+                'top_strengths': self.get_city_strengths_france(city_score['city_data'], user_profile,
+                                                                city_score['contributions']),
+                'potential_concerns': self.get_city_concerns_france(city_score['city_data'], user_profile,
+                                                                    city_score['contributions'], concern_criteria),
                 'why_recommended': self.generate_recommendation_reason_france(city_score['city_data'], user_profile)
             }
             top_recommendations.append(recommendation)
 
         return top_recommendations
 
-    def get_city_strengths_france(self, city_data: Dict, user_profile: UserProfileFrance) -> List[str]:
+    def get_city_strengths_france(self, city_data: Dict, user_profile: UserProfileFrance,
+                                  contributions: Optional[ContributionRow] = None) -> List[str]:
         """💪 Identifie les points forts d'une ville française pour ce profil"""
-        strengths = []
-        scores = city_data['scores']
-        weights = user_profile.criteria_weights
-
-        # Trouve les critères avec meilleur score ET importance pour l'utilisateur
-        weighted_criteria = []
-        for criterion, score in scores.items():
-            if criterion in weights:
-                weighted_importance = score * weights[criterion]
-                weighted_criteria.append((criterion, score, weighted_importance))
-
-        # Top 3 critères pondérés
-        top_criteria = sorted(weighted_criteria, key=lambda x: x[2], reverse=True)[:3]
-
-        for criterion, score, _ in top_criteria:
-            if score > 0.8:  # Seulement les vraiment excellents
-                strength_text = self.get_criterion_description_france(criterion, score)
-                strengths.append(strength_text)
-
-        return strengths[:3]  # Max 3 points forts
-
-    def get_city_concerns_france(self, city_data: Dict, user_profile: UserProfileFrance) -> List[str]:
+        if contributions is None:
+            contributions = self.score_city_with_contributions_france(city_data, user_profile)[1]
+
+        # Top 3 critères pondérés (score ET importance pour l'utilisateur)
+        return [
+            self.get_criterion_description_france(criterion, score)
+            for criterion, score, _ in top_contributions(contributions, 3)
+            if score > 0.8  # Seulement les vraiment excellents
+        ]
+
+    def get_city_concerns_france(self, city_data: Dict, user_profile: UserProfileFrance,
+                                 contributions: Optional[ContributionRow] = None,
+                                 concern_criteria: Optional[List[str]] = None) -> List[str]:
         """⚠️ Identifie les points d'attention d'une ville française pour ce profil"""
-        concerns = []
-        scores = city_data['scores']
-        weights = user_profile.criteria_weights
-
-        # Critères importants pour l'utilisateur mais faibles pour la ville
-        for criterion, weight in weights.items():
-            if weight > 1.2 and criterion in scores:  # Critère important
-                score = scores[criterion]
-                if score < 0.5:  # Score faible
-                    concern_text = self.get_concern_description_france(criterion, score)
-                    concerns.append(concern_text)
-
-        return concerns[:2]  # Max 2 préoccupations
+        if contributions is None:
+            contributions = self.score_city_with_contributions_france(city_data, user_profile)[1]
+        if concern_criteria is None:
+            concern_criteria = important_criteria(user_profile.criteria_weights, 1.2)
+
+        # Critères importants pour l'utilisateur mais faibles pour la ville (max 2)
+        return [
+            self.get_concern_description_france(criterion, score)
+            for criterion, score in weak_criteria(contributions, concern_criteria, 0.5, 2)
+        ]
 
     def generate_recommendation_reason_france(self, city_data: Dict, user_profile: UserProfileFrance) -> str:
         """📝 Génère une explication personnalisée française"""
@@ -6,8 +6,10 @@ Author: Revolutionary Team | Version: 1.0.0 - Japan Domestic Matching
 OBJECTIF: Recommandations précises basées sur profils japonais et réalités régionales
 """
 
+import heapq
 import json
 import logging
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
@@ -334,8 +336,8 @@ class JapanResidentsAlgorithm:
 
     def get_city_strengths(self, city: Dict, top_n: int = 3) -> List[Dict]:
         """Identifie les points forts d'une ville"""
-        scores = city['scores']
-        sorted_criteria = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Sélection partielle des top_n scores (pas de tri complet de la ligne)
+        top_criteria = heapq.nlargest(top_n, city['scores'].items(), key=itemgetter(1))
 
         criteria_names = {
             'job_market': 'Marché de l\'emploi',
@@ -352,7 +354,7 @@ class JapanResidentsAlgorithm:
                 'criterion': criteria_names.get(criterion, criterion),
                 'score': round(score * 100)
             }
-            for criterion, score in sorted_criteria[:top_n] if score >= 0.7
+            for criterion, score in top_criteria if score >= 0.7
         ]
 
     def generate_match_explanation(self, city: Dict, user_profile: UserProfileJapan) -> str:
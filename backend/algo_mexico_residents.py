@@ -14,7 +14,7 @@ Garantit 3 villes minimum avec filtrage intelligent
 import json
 import logging
 import os
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 
 class MexicoResidentsAlgorithm:
@@ -23,14 +23,15 @@ class MexicoResidentsAlgorithm:
     Méthode scientifique avec zones géographiques et scoring sur 27 critères JSON
     """
 
-    def __init__(self):
+    def __init__(self, cities_data_path: Optional[str] = None):
         """Initialise l'algorithme avec les données JSON"""
         self.version = "2.0.0"
 
         # Chargement des données JSON (27 critères)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        data_file = os.path.join(current_dir, "data_v2", "villes_mexico_residents.json")
-        self.cities_data = self.load_cities_data(data_file)
+        if cities_data_path is None:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            cities_data_path = os.path.join(current_dir, "data_v2", "villes_mexico_residents.json")
+        self.cities_data = self.load_cities_data(cities_data_path)
 
         # 🗺️ ZONES GÉOGRAPHIQUES MEXICAINES (basées sur les questions JS)
 
@@ -461,15 +462,22 @@ class MexicoResidentsAlgorithm:
         return reasons[:4]  # Limiter à 4 raisons maximum
 
 
-# Instance globale pour l'API
-mexico_algorithm = MexicoResidentsAlgorithm()
+# Instance partagée pour l'API, construite au premier appel (pas à l'import)
+_mexico_algorithm: Optional[MexicoResidentsAlgorithm] = None
+
+def get_mexico_algorithm() -> MexicoResidentsAlgorithm:
+    """Instance partagée de l'algorithme Mexique (chargement paresseux)"""
+    global _mexico_algorithm
+    if _mexico_algorithm is None:
+        _mexico_algorithm = MexicoResidentsAlgorithm()
+    return _mexico_algorithm
 
 def get_mexico_recommendations(questionnaire_responses: Dict, top_n: int = 3) -> Dict:
     """
     🇲🇽 API function for Mexico recommendations
     Interface standardisée pour l'intégration main.py
     """
-    return mexico_algorithm.get_recommendations(questionnaire_responses, top_n)
+    return get_mexico_algorithm().get_recommendations(questionnaire_responses, top_n)
 
 def get_mexico_cities() -> List[Dict]:
     """
@@ -482,14 +490,14 @@ def get_mexico_cities() -> List[Dict]:
         "region": city['region'],
         "population": city['population'],
         "description": city.get('description', '')
-    } for city in mexico_algorithm.cities_data]
+    } for city in get_mexico_algorithm().cities_data]
 
 def get_mexico_criteria() -> List[str]:
     """
     🇲🇽 API function to get all Mexican criteria
     Interface pour récupérer la liste des critères
     """
-    return list(mexico_algorithm.criteria_weights_base.keys())
+    return list(get_mexico_algorithm().criteria_weights_base.keys())
 
 if __name__ == "__main__":
     # Test de l'algorithme
@@ -9,12 +9,40 @@ INCLUSIVITÉ: Algorithme neutre pour résidents ET expats potentiels
 
 import json
 import logging
+import operator
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from core.contributions import match_threshold_rules
+
 # Configuration logging
 logger = logging.getLogger(__name__)
 
+# 🇲🇦 Forces/préoccupations: (critère, comparaison, seuil, libellé), dans l'ordre d'affichage
+MOROCCO_STRENGTH_RULES = (
+    ('cost_of_living', operator.gt, 0.75, "Coût de la vie abordable"),
+    ('job_opportunities', operator.gt, 0.8, "Marché du travail dynamique"),
+    ('safety_security', operator.gt, 0.85, "Excellente sécurité"),
+    ('cultural_scene', operator.gt, 0.85, "Richesse culturelle exceptionnelle"),
+    ('beach_access', operator.gt, 0.85, "Accès plages de qualité"),
+    ('mountain_access', operator.gt, 0.85, "Proximité montagne Atlas/Rif"),
+    ('international_connectivity', operator.gt, 0.8, "Connectivité internationale"),
+    ('european_proximity_advantage', operator.gt, 0.8, "Proximité stratégique Europe"),
+    ('traditional_markets_souks', operator.gt, 0.85, "Souks authentiques et vivants"),
+    ('berber_culture_presence', operator.gt, 0.8, "Riche patrimoine amazigh"),
+    ('education_quality', operator.gt, 0.85, "Excellence éducative"),
+    ('healthcare_quality', operator.gt, 0.8, "Qualité des soins médicaux"),
+)
+
+MOROCCO_CONCERN_RULES = (
+    ('cost_of_living', operator.lt, 0.6, "Coût de la vie élevé"),
+    ('air_quality', operator.lt, 0.7, "Qualité de l'air à surveiller"),
+    ('public_transport', operator.lt, 0.6, "Transport public limité"),
+    ('job_opportunities', operator.lt, 0.6, "Marché du travail restreint"),
+    ('tech_scene', operator.lt, 0.5, "Écosystème tech peu développé"),
+    ('nightlife', operator.lt, 0.6, "Vie nocturne limitée"),
+)
+
 @dataclass
 class UserProfileMorocco:
     """Profil utilisateur Maroc avec pondérations spécifiquement marocaines"""
@@ -43,6 +71,11 @@ class MoroccoResidentsAlgorithm:
         self.cities_data = self.load_cities_data(cities_data_path)
         self.criteria_weights_base = self.get_base_criteria_weights_morocco()
 
+        # Forces/préoccupations indépendantes du profil: évaluées une fois par ville
+        self.city_highlights = {}
+        for city in self.cities_data.get('cities', []):
+            self.city_highlights[city['id']] = self.get_city_highlights_morocco(city)
+
     def load_cities_data(self, data_path: str) -> Dict:
         """Charge les données des 25 villes marocaines"""
         try:
@@ -456,60 +489,20 @@ class MoroccoResidentsAlgorithm:
 
     def get_city_strengths_morocco(self, city_data: Dict, user_profile: UserProfileMorocco) -> List[str]:
         """💪 Identifie les forces principales d'une ville marocaine"""
-
-        strengths = []
-        scores = city_data['scores']
-        city_name = city_data['name']
-
-        # Forces basées sur scores élevés et spécificités Maroc
-        if scores.get('cost_of_living', 0) > 0.75:
-            strengths.append("Coût de la vie abordable")
-        if scores.get('job_opportunities', 0) > 0.8:
-            strengths.append("Marché du travail dynamique")
-        if scores.get('safety_security', 0) > 0.85:
-            strengths.append("Excellente sécurité")
-        if scores.get('cultural_scene', 0) > 0.85:
-            strengths.append("Richesse culturelle exceptionnelle")
-        if scores.get('beach_access', 0) > 0.85:
-            strengths.append("Accès plages de qualité")
-        if scores.get('mountain_access', 0) > 0.85:
-            strengths.append("Proximité montagne Atlas/Rif")
-        if scores.get('international_connectivity', 0) > 0.8:
-            strengths.append("Connectivité internationale")
-        if scores.get('european_proximity_advantage', 0) > 0.8:
-            strengths.append("Proximité stratégique Europe")
-        if scores.get('traditional_markets_souks', 0) > 0.85:
-            strengths.append("Souks authentiques et vivants")
-        if scores.get('berber_culture_presence', 0) > 0.8:
-            strengths.append("Riche patrimoine amazigh")
-        if scores.get('education_quality', 0) > 0.85:
-            strengths.append("Excellence éducative")
-        if scores.get('healthcare_quality', 0) > 0.8:
-            strengths.append("Qualité des soins médicaux")
-
-        return strengths[:4]  # Max 4 forces principales
+        return list(self.get_city_highlights_morocco(city_data)[0])
 
     def get_city_concerns_morocco(self, city_data: Dict, user_profile: UserProfileMorocco) -> List[str]:
         """⚠️ Identifie les défis potentiels d'une ville marocaine"""
-
-        concerns = []
-        scores = city_data['scores']
-
-        # Préoccupations basées sur scores faibles
-        if scores.get('cost_of_living', 1.0) < 0.6:
-            concerns.append("Coût de la vie élevé")
-        if scores.get('air_quality', 1.0) < 0.7:
-            concerns.append("Qualité de l'air à surveiller")
-        if scores.get('public_transport', 1.0) < 0.6:
-            concerns.append("Transport public limité")
-        if scores.get('job_opportunities', 1.0) < 0.6:
-            concerns.append("Marché du travail restreint")
-        if scores.get('tech_scene', 1.0) < 0.5:
-            concerns.append("Écosystème tech peu développé")
-        if scores.get('nightlife', 1.0) < 0.6:
-            concerns.append("Vie nocturne limitée")
-
-        return concerns[:3]  # Max 3 préoccupations
+        return list(self.get_city_highlights_morocco(city_data)[1])
+
+    def get_city_highlights_morocco(self, city_data: Dict) -> Tuple[List[str], List[str]]:
+        """📌 Forces/préoccupations d'une ville: règles à seuils fixes, précalculées par ville"""
+        highlights = self.city_highlights.get(city_data.get('id'))
+        if highlights is None:
+            scores = city_data['scores']
+            highlights = (match_threshold_rules(scores, MOROCCO_STRENGTH_RULES, 4),
+                          match_threshold_rules(scores, MOROCCO_CONCERN_RULES, 3))
+        return highlights
 
     def generate_recommendation_reason_morocco(self, city_data: Dict, user_profile: UserProfileMorocco) -> str:
         """✨ Génère raison personnalisée pour recommandation ville marocaine"""
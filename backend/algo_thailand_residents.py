@@ -9,13 +9,38 @@ Inclusive algorithm for Thailand residents seeking new cities within Thailand
 
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import operator
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from core.contributions import match_threshold_rules
+
 # Configuration logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 🇹🇭 Forces/préoccupations: (critère, comparaison, seuil, libellé), dans l'ordre d'affichage
+THAILAND_STRENGTH_RULES = (
+    ('street_food_culture', operator.ge, 0.95, "Paradise culinaire street food"),
+    ('beach_access', operator.ge, 0.9, "Accès plages paradisiaques"),
+    ('mountain_access', operator.ge, 0.9, "Accès montagne exceptionnel"),
+    ('cultural_scene', operator.ge, 0.9, "Richesse culturelle temples/heritage"),
+    ('tropical_climate_adaptation', operator.ge, 0.9, "Infrastructure tropical parfaite"),
+    ('cost_of_living', operator.ge, 0.9, "Très économique"),
+    ('business_environment', operator.ge, 0.85, "Écosystème business dynamique"),
+    ('safety_security', operator.ge, 0.9, "Sécurité excellente"),
+    ('nature_access', operator.ge, 0.9, "Nature/parcs nationaux proches"),
+)
+
+THAILAND_CONCERN_RULES = (
+    ('air_quality', operator.lt, 0.6, "Qualité air dégradée"),
+    ('cost_of_living', operator.lt, 0.6, "Coût de la vie élevé"),
+    ('public_transport', operator.lt, 0.6, "Transport public limité"),
+    ('job_opportunities', operator.lt, 0.6, "Marché emploi restreint"),
+    ('healthcare_quality', operator.lt, 0.7, "Qualité santé moyenne"),
+    ('international_connectivity', operator.lt, 0.6, "Connectivité internationale limitée"),
+)
+
 @dataclass
 class UserProfileThailand:
     """🇹🇭 Profil utilisateur Thailand avec critères inclusifs"""
@@ -41,6 +66,12 @@ class ThailandResidentsAlgorithm:
         self.version = "1.0.0"  # ⚠️ OBLIGATOIRE pour health check
         self.cities_data = self.load_cities_data(cities_data_path)
         self.criteria_weights_base = self.get_base_criteria_weights_thailand()
+
+        # Forces/préoccupations indépendantes du profil: évaluées une fois par ville
+        self.city_highlights = {}
+        for city in self.cities_data.get('cities', []):
+            self.city_highlights[city['id']] = self.get_city_highlights_thailand(city)
+
         logger.info(f"🇹🇭 ThailandResidentsAlgorithm v{self.version} initialisé")
 
     def load_cities_data(self, data_path: str) -> Dict:
@@ -384,54 +415,20 @@ class ThailandResidentsAlgorithm:
 
     def get_city_strengths_thailand(self, city_data: Dict, user_profile: UserProfileThailand) -> List[str]:
         """💪 Identifie les forces principales d'une ville thailand"""
-
-        strengths = []
-        scores = city_data['scores']
-        city_name = city_data['name']
-
-        # Strengths génériques par score élevé
-        if scores.get('street_food_culture', 0) >= 0.95:
-            strengths.append("Paradise culinaire street food")
-        if scores.get('beach_access', 0) >= 0.9:
-            strengths.append("Accès plages paradisiaques")
-        if scores.get('mountain_access', 0) >= 0.9:
-            strengths.append("Accès montagne exceptionnel")
-        if scores.get('cultural_scene', 0) >= 0.9:
-            strengths.append("Richesse culturelle temples/heritage")
-        if scores.get('tropical_climate_adaptation', 0) >= 0.9:
-            strengths.append("Infrastructure tropical parfaite")
-        if scores.get('cost_of_living', 0) >= 0.9:
-            strengths.append("Très économique")
-        if scores.get('business_environment', 0) >= 0.85:
-            strengths.append("Écosystème business dynamique")
-        if scores.get('safety_security', 0) >= 0.9:
-            strengths.append("Sécurité excellente")
-        if scores.get('nature_access', 0) >= 0.9:
-            strengths.append("Nature/parcs nationaux proches")
-
-        return strengths[:4]  # Top 4 strengths
+        return list(self.get_city_highlights_thailand(city_data)[0])
 
     def get_city_concerns_thailand(self, city_data: Dict, user_profile: UserProfileThailand) -> List[str]:
         """⚠️ Identifie les préoccupations potentielles d'une ville thailand"""
-
-        concerns = []
-        scores = city_data['scores']
-
-        # Concerns par scores faibles
-        if scores.get('air_quality', 1.0) < 0.6:
-            concerns.append("Qualité air dégradée")
-        if scores.get('cost_of_living', 1.0) < 0.6:
-            concerns.append("Coût de la vie élevé")
-        if scores.get('public_transport', 1.0) < 0.6:
-            concerns.append("Transport public limité")
-        if scores.get('job_opportunities', 1.0) < 0.6:
-            concerns.append("Marché emploi restreint")
-        if scores.get('healthcare_quality', 1.0) < 0.7:
-            concerns.append("Qualité santé moyenne")
-        if scores.get('international_connectivity', 1.0) < 0.6:
-            concerns.append("Connectivité internationale limitée")
-
-        return concerns[:3]  # Top 3 concerns
+        return list(self.get_city_highlights_thailand(city_data)[1])
+
+    def get_city_highlights_thailand(self, city_data: Dict) -> Tuple[List[str], List[str]]:
+        """📌 Forces/préoccupations d'une ville: règles à seuils fixes, précalculées par ville"""
+        highlights = self.city_highlights.get(city_data.get('id'))
+        if highlights is None:
+            scores = city_data['scores']
+            highlights = (match_threshold_rules(scores, THAILAND_STRENGTH_RULES, 4),
+                          match_threshold_rules(scores, THAILAND_CONCERN_RULES, 3))
+        return highlights
 
     def generate_recommendation_reason_thailand(self, city_data: Dict, user_profile: UserProfileThailand) -> str:
         """📝 Génère raison personnalisée pour recommandation thailand"""
@@ -8,12 +8,38 @@ OBJECTIF: Recommandations précises basées sur profils britanniques et réalit
 
 import json
 import logging
+import operator
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+from core.contributions import match_threshold_rules
+
 # Configuration logging
 logger = logging.getLogger(__name__)
 
+# 🇬🇧 Forces/préoccupations: (critère, comparaison, seuil, libellé), dans l'ordre d'affichage
+UK_STRENGTH_RULES = (
+    ('cost_of_living', operator.gt, 0.7, "Coût de la vie raisonnable"),
+    ('housing_affordability', operator.gt, 0.6, "Logement abordable"),
+    ('job_market', operator.gt, 0.8, "Marché du travail dynamique"),
+    ('tech_industry', operator.gt, 0.7, "Secteur tech développé"),
+    ('public_transport', operator.gt, 0.8, "Excellents transports publics"),
+    ('school_quality', operator.gt, 0.8, "Écoles de qualité supérieure"),
+    ('healthcare_access', operator.gt, 0.8, "Excellent accès NHS"),
+    ('cultural_scene', operator.gt, 0.8, "Scène culturelle vibrante"),
+    ('walkability', operator.gt, 0.8, "Très marchable"),
+    ('university_access', operator.gt, 0.8, "Proximité universités prestigieuses"),
+)
+
+UK_CONCERN_RULES = (
+    ('cost_of_living', operator.lt, 0.4, "Coût de la vie élevé"),
+    ('housing_affordability', operator.lt, 0.4, "Logement très cher"),
+    ('council_tax', operator.lt, 0.5, "Council tax élevé"),
+    ('job_market', operator.lt, 0.6, "Marché du travail limité"),
+    ('public_transport', operator.lt, 0.6, "Transport public insuffisant"),
+    ('climate_rating', operator.lt, 0.5, "Climat difficile"),
+)
+
 @dataclass
 class UserProfileUK:
     """Profil utilisateur UK avec pondérations spécifiquement britanniques"""
@@ -40,6 +66,11 @@ class UKResidentsAlgorithm:
         self.cities_data = self.load_cities_data(cities_data_path)
         self.criteria_weights_base = self.get_base_criteria_weights_uk()
 
+        # Forces/préoccupations indépendantes du profil: évaluées une fois par ville
+        self.city_highlights = {}
+        for city in self.cities_data.get('cities', []):
+            self.city_highlights[city['id']] = self.get_city_highlights_uk(city)
+
     def load_cities_data(self, data_path: str) -> Dict:
         """Charge les données des 30 villes britanniques"""
         try:
@@ -486,55 +517,20 @@ class UKResidentsAlgorithm:
 
     def get_city_strengths_uk(self, city_data: Dict, user_profile: UserProfileUK) -> List[str]:
         """💪 Identifie les forces principales d'une ville britannique"""
-
-        strengths = []
-        scores = city_data['scores']
-
-        # Forces basées sur les scores élevés et spécificités UK
-        if scores.get('cost_of_living', 0) > 0.7:
-            strengths.append("Coût de la vie raisonnable")
-        if scores.get('housing_affordability', 0) > 0.6:
-            strengths.append("Logement abordable")
-        if scores.get('job_market', 0) > 0.8:
-            strengths.append("Marché du travail dynamique")
-        if scores.get('tech_industry', 0) > 0.7:
-            strengths.append("Secteur tech développé")
-        if scores.get('public_transport', 0) > 0.8:
-            strengths.append("Excellents transports publics")
-        if scores.get('school_quality', 0) > 0.8:
-            strengths.append("Écoles de qualité supérieure")
-        if scores.get('healthcare_access', 0) > 0.8:
-            strengths.append("Excellent accès NHS")
-        if scores.get('cultural_scene', 0) > 0.8:
-            strengths.append("Scène culturelle vibrante")
-        if scores.get('walkability', 0) > 0.8:
-            strengths.append("Très marchable")
-        if scores.get('university_access', 0) > 0.8:
-            strengths.append("Proximité universités prestigieuses")
-
-        return strengths[:4]  # Top 4 forces
+        return list(self.get_city_highlights_uk(city_data)[0])
 
     def get_city_concerns_uk(self, city_data: Dict, user_profile: UserProfileUK) -> List[str]:
         """⚠️ Identifie les préoccupations potentielles d'une ville britannique"""
-
-        concerns = []
-        scores = city_data['scores']
-
-        # Préoccupations basées sur les scores faibles et problématiques UK
-        if scores.get('cost_of_living', 1.0) < 0.4:
-            concerns.append("Coût de la vie élevé")
-        if scores.get('housing_affordability', 1.0) < 0.4:
-            concerns.append("Logement très cher")
-        if scores.get('council_tax', 1.0) < 0.5:
-            concerns.append("Council tax élevé")
-        if scores.get('job_market', 1.0) < 0.6:
-            concerns.append("Marché du travail limité")
-        if scores.get('public_transport', 1.0) < 0.6:
-            concerns.append("Transport public insuffisant")
-        if scores.get('climate_rating', 1.0) < 0.5:
-            concerns.append("Climat difficile")
-
-        return concerns[:3]  # Top 3 préoccupations
+        return list(self.get_city_highlights_uk(city_data)[1])
+
+    def get_city_highlights_uk(self, city_data: Dict) -> Tuple[List[str], List[str]]:
+        """📌 Forces/préoccupations d'une ville: règles à seuils fixes, précalculées par ville"""
+        highlights = self.city_highlights.get(city_data.get('id'))
+        if highlights is None:
+            scores = city_data['scores']
+            highlights = (match_threshold_rules(scores, UK_STRENGTH_RULES, 4),
+                          match_threshold_rules(scores, UK_CONCERN_RULES, 3))
+        return highlights
 
     def generate_recommendation_reason_uk(self, city_data: Dict, user_profile: UserProfileUK) -> str:
         """📝 Génère une raison personnalisée pour une recommandation britannique"""
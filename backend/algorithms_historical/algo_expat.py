@@ -12,6 +12,8 @@ OBJECTIF : TOP 3 villes parfaitement adaptées au profil utilisateur
 import json
 import os
 
+from core.tracing import span, traced
+
 class AlgorithmeExpat:
 
     def __init__(self):
@@ -76,9 +78,11 @@ class AlgorithmeExpat:
                 })
 
         # Trier par score et retourner TOP 3
-        scores_villes.sort(key=lambda x: x['score'], reverse=True)
+        with span('expat.sorting'):
+            scores_villes.sort(key=lambda x: x['score'], reverse=True)
         return scores_villes[:3]
 
+    @traced('expat.scoring')
     def calculer_score_ville(self, reponses_user, ville):
         """Calcule le score de compatibilité total d'une ville"""
 
@@ -274,6 +278,7 @@ class AlgorithmeExpat:
     # 🚫 LOGIQUE DE BON SENS - FILTRAGE INTELLIGENT
     # ===============================================
 
+    @traced('expat.filters')
     def appliquer_logique_bon_sens(self, reponses_user, ville, score):
         """Applique la logique de bon sens pour éviter les incohérences"""
 
@@ -307,6 +312,7 @@ class AlgorithmeExpat:
     # 🗄️ CHARGEMENT DES DONNÉES
     # ===============================================
 
+    @traced('expat.load_cities')
     def charger_donnees_villes(self, country):
         """Charge les données des villes depuis le JSON"""
 
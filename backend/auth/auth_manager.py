@@ -19,8 +19,6 @@ Architecture:
 - PaywallManager: Restrictions premium
 """
 
-import jwt
-import bcrypt
 import redis
 import json
 import uuid
@@ -28,11 +26,16 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, Any
 from flask import current_app, request
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
 import secrets
 import re
 
+from core.lazy_imports import lazy_import
+
+# Importés à la première inscription / connexion / vérification (inutiles au trafic anonyme)
+jwt = lazy_import('jwt')
+bcrypt = lazy_import('bcrypt')
+sendgrid = lazy_import('sendgrid')
+
 logger = logging.getLogger(__name__)
 
 class AuthManager:
@@ -371,7 +374,14 @@ class EmailVerification:
 
     def __init__(self, sendgrid_api_key: str):
         self.sendgrid_api_key = sendgrid_api_key
-        self.client = SendGridAPIClient(api_key=sendgrid_api_key) if sendgrid_api_key else None
+        self._client = None
+
+    @property
+    def client(self):
+        """Client SendGrid créé au premier envoi"""
+        if self._client is None and self.sendgrid_api_key:
+            self._client = sendgrid.SendGridAPIClient(api_key=self.sendgrid_api_key)
+        return self._client
 
     def send_verification_email(self, email: str, name: str, verification_token: str) -> bool:
         """Envoyer email de vérification"""
@@ -419,7 +429,7 @@ class EmailVerification:
             </div>
             """
 
-            message = Mail(
+            message = sendgrid.Mail(
                 from_email='noreply@zineinsight.com',
                 to_emails=email,
                 subject='🚀 Vérifiez votre compte ZineInsight Revolutionary',
@@ -444,8 +454,8 @@ def init_auth_manager(app):
     secret_key = app.config.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     sendgrid_key = app.config.get('SENDGRID_API_KEY')
 
-    # Redis client
-    redis_client = redis.Redis(
+    # Redis client (REDIS_CLIENT: client fourni, ex: substitut local du banc de charge)
+    redis_client = app.config.get('REDIS_CLIENT') or redis.Redis(
         host=app.config.get('REDIS_HOST', 'localhost'),
         port=app.config.get('REDIS_PORT', 6379),
         decode_responses=True
@@ -37,8 +37,8 @@ freemium_manager = None
 def init_paywall_manager():
     """Initialiser le PaywallManager"""
     global paywall_manager, freemium_manager
-    paywall_manager = PaywallManager()
     auth_manager = get_auth_manager()
+    paywall_manager = PaywallManager(auth_manager.redis_client)
     freemium_manager = FreemiumManager(auth_manager.redis_client, auth_manager)
     return paywall_manager
 
@@ -628,7 +628,7 @@ def social_login():
     """Authentification via providers sociaux (Google, Microsoft, Apple)"""
     try:
         data = request.get_json()
-        logger.info(f"Social login request: {data}")
+        logger.debug("Social login request fields: %s", list(data or {}))
 
         if not data:
             return jsonify({"success": False, "error": "Données requises"}), 400
@@ -0,0 +1,16 @@
+"""
+🏋️ BENCHMARKS - BANC DE CHARGE ET MICRO-BENCHMARKS IN-PROCESS
+=============================================================
+- corpus.py: corpus de questionnaires figé (corpus.json)
+- local_redis.py: substitut Redis en mémoire
+- load_test.py: rejoue le corpus via le client de test Flask et un serveur
+  WSGI local, rapporte débit / p50 / p99 / mémoire, applique les seuils
+  (thresholds.json)
+- algorithms.py: chronomètre chaque algorithme de scoring (single, batch,
+  cold start) et vérifie le top-N contre le corpus doré (golden/)
+- startup.py: démarrage à froid dans un interpréteur neuf (-X importtime,
+  phases de create_app, imports différés)
+
+Lancement: cd backend && python -m benchmarks.load_test
+           cd backend && python -m benchmarks.algorithms
+"""
@@ -0,0 +1,438 @@
+"""
+⏱️ ALGORITHMS - MICRO-BENCHMARKS ET CORPUS DORÉ DES ALGORITHMES DE SCORING
+==========================================================================
+Toute optimisation d'un algorithme doit prouver deux choses: il est plus
+rapide, et il classe les villes / offres exactement pareil.
+
+Algorithmes couverts (corpus.json, mêmes questionnaires à chaque run):
+- *ResidentsAlgorithm: un par pays du registre (COUNTRY_ALGORITHMS)
+- AlgorithmeExpat (parcours international) et AlgorithmeRevolutionnaire
+- SkillGraphAlgorithm et WealthAlgorithm
+
+Trois chemins chronométrés par algorithme:
+- single: un questionnaire sur une instance chaude (caches de résultat
+  vidés hors chronométrage) → p50 / p99 / moyenne en µs
+- batch: tout le corpus enchaîné → questionnaires par seconde (meilleur run)
+- cold: construction d'une instance (chargement des données) + premier appel
+
+Corpus doré (golden/<algorithme>.json): top-N (nom, score) de chaque
+questionnaire. Les noms doivent correspondre rang par rang (permutation
+admise entre ex æquo), les scores à la tolérance près.
+
+Résultats écrits en JSON (results/, ignoré par git) pour comparer les runs:
+--compare un run précédent, --max-slowdown pour échouer sur régression.
+
+Usage (depuis backend/):
+    python -m benchmarks.algorithms
+    python -m benchmarks.algorithms --target 'residents:*' --rounds 10
+    python -m benchmarks.algorithms --compare benchmarks/results/algorithms-20250101-120000.json
+    python -m benchmarks.algorithms --update-golden   # Après un changement de résultats VOULU
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import importlib
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.corpus import CORPUS_PATH, load_corpus
+from core.country_registry import COUNTRY_ALGORITHMS, DEFAULT_DATA_DIR
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(BENCHMARKS_DIR, 'golden')
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+
+DEFAULT_TOP_N = 5
+DEFAULT_TOLERANCE = 0.1  # Un pas d'arrondi des pourcentages de compatibilité
+
+# Point d'entrée des algorithmes résidents (défaut: get_recommendations), cf. services/residents
+RESIDENTS_METHODS = {
+    'usa': 'get_top_recommendations',
+    'france': 'get_top_recommendations_france',
+    'canada': 'get_top_recommendations_canada'
+}
+
+_NAME_KEYS = ('city', 'id', 'name', 'title')
+_SCORE_KEYS = ('score_percentage', 'compatibility_score', 'compatibility', 'score')
+
+
+# ===============================
+# 🎯 ALGORITHMES MESURÉS
+# ===============================
+
+class AlgorithmTarget:
+    """Algorithme mesuré: construction, appel, signature comparable et remise à zéro des caches"""
+
+    def __init__(self, name: str, factory: Callable[[], Any], run: Callable[[Any, Dict], Any],
+                 questionnaires: List[Dict], signature: Callable[[Any, int], Any],
+                 reset: Optional[Callable[[Any], None]] = None):
+        self.name = name
+        self.factory = factory
+        self.run = run
+        self.questionnaires = questionnaires
+        self.signature = signature
+        self.reset = reset or (lambda instance: None)
+
+
+def ranking(result: Any, top_n: int) -> List[List]:
+    """Top-N [nom, score] d'une sortie de recommandation (liste ou dict 'recommendations')"""
+    items = result
+    if isinstance(result, dict):
+        items = result.get('recommendations', result.get('career_recommendations', []))
+    top = []
+    for item in (items or [])[:top_n]:
+        name = next((item[key] for key in _NAME_KEYS if key in item), None)
+        score = next((item[key] for key in _SCORE_KEYS if isinstance(item.get(key), (int, float))), None)
+        top.append([name, score])
+    return top
+
+
+def wealth_signature(result: Dict, top_n: int) -> Dict:
+    """Sorties chiffrées de l'analyse patrimoniale (pas de classement de villes)"""
+    return {
+        'wealth_score': result['wealth_analysis']['current_wealth_score'],
+        'target_net_worth': result['freedom_targets']['target_net_worth'],
+        'freedom_age': result['freedom_targets']['freedom_age'],
+        'years_to_freedom': result['timeline_analysis']['years_to_freedom'],
+        'monthly_savings_needed': result['timeline_analysis']['monthly_savings_needed'],
+        'recommendations': [rec.get('name') for rec in result['wealth_recommendations'][:top_n]]
+    }
+
+
+def _residents_target(code: str, questionnaires: List[Dict]) -> AlgorithmTarget:
+    spec = COUNTRY_ALGORITHMS[code]
+    method = RESIDENTS_METHODS.get(code, 'get_recommendations')
+
+    def factory():
+        algorithm_class = getattr(importlib.import_module(spec.module), spec.class_name)
+        return algorithm_class(str(DEFAULT_DATA_DIR / spec.data_file))
+
+    return AlgorithmTarget(
+        f"residents:{code}", factory,
+        lambda algorithm, answers: getattr(algorithm, method)(answers, top_n=DEFAULT_TOP_N),
+        questionnaires, ranking
+    )
+
+
+def _revolutionnaire_factory():
+    from algorithms_historical.algo import AlgorithmeRevolutionnaire
+
+    algorithm = AlgorithmeRevolutionnaire()
+    if not (algorithm.data_dir / algorithm.countries['world']).exists():
+        # Arborescence essentiels/data absente hors serveur: dataset monde de data_v2
+        algorithm.data_dir = DEFAULT_DATA_DIR
+        algorithm.countries = {'world': 'villes_world.json'}
+    return algorithm
+
+
+def _expat_factory():
+    from algorithms_historical.algo_expat import AlgorithmeExpat
+    return AlgorithmeExpat()
+
+
+def _skillgraph_factory():
+    from services.skillgraph.algorithm import SkillGraphAlgorithm
+    return SkillGraphAlgorithm()
+
+
+def _wealth_factory():
+    from services.wealth.algorithm import WealthAlgorithm
+    return WealthAlgorithm()
+
+
+def build_targets(corpus: Dict) -> List[AlgorithmTarget]:
+    questionnaires = corpus['questionnaires']
+    targets = [_residents_target(code, questionnaires[code]) for code in COUNTRY_ALGORITHMS if code in questionnaires]
+    targets += [
+        AlgorithmTarget('expat', _expat_factory,
+                        lambda algorithm, answers: algorithm.calculer_recommandations(answers, country='world'),
+                        questionnaires['world'], ranking),
+        AlgorithmTarget('revolutionnaire', _revolutionnaire_factory,
+                        lambda algorithm, answers: algorithm.analyser(answers, 'world'),
+                        corpus['revolutionnaire'], ranking),
+        AlgorithmTarget('skillgraph', _skillgraph_factory,
+                        lambda algorithm, payload: algorithm.analyze(payload['questionnaire'], payload['country']),
+                        corpus['career'], ranking, reset=lambda algorithm: algorithm.cache.clear()),
+        AlgorithmTarget('wealth', _wealth_factory,
+                        lambda algorithm, payload: algorithm.analyze(payload['questionnaire'], payload['country']),
+                        corpus['wealth'], wealth_signature, reset=lambda algorithm: algorithm.pipeline.clear())
+    ]
+    return targets
+
+
+# ===============================
+# 📏 CHRONOMÉTRAGE
+# ===============================
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    rank = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def time_single(target: AlgorithmTarget, instance, rounds: int) -> Dict:
+    latencies = []
+    for _ in range(rounds):
+        for answers in target.questionnaires:
+            target.reset(instance)
+            started = time.perf_counter_ns()
+            target.run(instance, answers)
+            latencies.append(time.perf_counter_ns() - started)
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'p50_us': round(_percentile(latencies, 0.50) / 1e3, 1),
+        'p99_us': round(_percentile(latencies, 0.99) / 1e3, 1),
+        'mean_us': round(statistics.fmean(latencies) / 1e3, 1)
+    }
+
+
+def time_batch(target: AlgorithmTarget, instance, rounds: int) -> Dict:
+    durations = []
+    for _ in range(rounds):
+        target.reset(instance)
+        started = time.perf_counter()
+        for answers in target.questionnaires:
+            target.run(instance, answers)
+        durations.append(time.perf_counter() - started)
+    best = min(durations)
+    return {
+        'questionnaires': len(target.questionnaires),
+        'best_s': round(best, 4),
+        'throughput_qps': round(len(target.questionnaires) / best, 1) if best else 0.0
+    }
+
+
+def time_cold(target: AlgorithmTarget, runs: int) -> Dict:
+    construct_ms, first_call_ms = [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        instance = target.factory()
+        built = time.perf_counter()
+        target.run(instance, target.questionnaires[0])
+        construct_ms.append((built - started) * 1000)
+        first_call_ms.append((time.perf_counter() - built) * 1000)
+    return {
+        'runs': runs,
+        'construct_ms': round(statistics.median(construct_ms), 2),
+        'first_call_ms': round(statistics.median(first_call_ms), 2)
+    }
+
+
+# ===============================
+# 🥇 CORPUS DORÉ
+# ===============================
+
+def golden_path(target_name: str) -> str:
+    return os.path.join(GOLDEN_DIR, f"{target_name.replace(':', '_')}.json")
+
+
+def _close(expected, actual, tolerance: float) -> bool:
+    if isinstance(expected, (int, float)) and isinstance(actual, (int, float)):
+        return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=tolerance)
+    return expected == actual
+
+
+def compare_ranking(expected: List[List], actual: List[List], tolerance: float) -> Optional[str]:
+    """None si identique; permutation admise entre entrées ex æquo (scores à la tolérance près)"""
+    if len(expected) != len(actual):
+        return f"top-{len(expected)} expected, got {len(actual)} entries"
+    for rank, ((name, score), (actual_name, actual_score)) in enumerate(zip(expected, actual), 1):
+        if not _close(score, actual_score, tolerance):
+            return f"rank {rank}: score {score} → {actual_score}"
+        if actual_name != name:
+            tied = {other for other, other_score in expected if _close(score, other_score, tolerance)}
+            if actual_name not in tied:
+                return f"rank {rank}: {name} → {actual_name}"
+    return None
+
+
+def compare_signature(expected, actual, tolerance: float) -> Optional[str]:
+    if isinstance(expected, list):
+        return compare_ranking(expected, actual, tolerance)
+    for key, value in expected.items():
+        if not _close(value, actual.get(key), tolerance):
+            return f"{key}: {value} → {actual.get(key)}"
+    return None
+
+
+def check_golden(target: AlgorithmTarget, instance, top_n: int, tolerance: float,
+                 corpus_seed: int, update: bool) -> Dict:
+    signatures = []
+    for answers in target.questionnaires:
+        target.reset(instance)
+        signatures.append(target.signature(target.run(instance, answers), top_n))
+    # Aller-retour JSON: mêmes types que le fichier doré (tuples → listes)
+    signatures = json.loads(json.dumps(signatures, default=str))
+
+    path = golden_path(target.name)
+    if update:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'target': target.name, 'top_n': top_n, 'corpus_seed': corpus_seed,
+                       'cases': signatures}, f, ensure_ascii=False, indent=1)
+        return {'status': 'updated', 'cases': len(signatures)}
+
+    if not os.path.exists(path):
+        return {'status': 'missing', 'cases': 0}
+    with open(path, encoding='utf-8') as f:
+        golden = json.load(f)
+    if golden.get('corpus_seed') != corpus_seed or golden.get('top_n') != top_n \
+            or len(golden['cases']) != len(signatures):
+        return {'status': 'stale', 'cases': len(golden['cases'])}
+
+    mismatches = []
+    for index, (expected, actual) in enumerate(zip(golden['cases'], signatures)):
+        difference = compare_signature(expected, actual, tolerance)
+        if difference:
+            mismatches.append(f"case {index}: {difference}")
+    return {
+        'status': 'mismatch' if mismatches else 'ok',
+        'cases': len(signatures),
+        'mismatches': mismatches[:10],
+        'mismatch_count': len(mismatches)
+    }
+
+
+# ===============================
+# 🚀 EXÉCUTION
+# ===============================
+
+def benchmark_target(target: AlgorithmTarget, rounds: int, cold_runs: int, top_n: int,
+                     tolerance: float, corpus_seed: int, update_golden: bool) -> Dict:
+    cold = time_cold(target, cold_runs)
+    instance = target.factory()
+    for answers in target.questionnaires:  # Passe de chauffe (imports paresseux, caches internes)
+        target.run(instance, answers)
+    return {
+        'single': time_single(target, instance, rounds),
+        'batch': time_batch(target, instance, rounds),
+        'cold': cold,
+        'golden': check_golden(target, instance, top_n, tolerance, corpus_seed, update_golden)
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=BENCHMARKS_DIR, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def compare_runs(results: Dict, previous: Dict, max_slowdown: Optional[float]) -> List[str]:
+    """Affiche les écarts avec un run précédent → liste des régressions au-delà de max_slowdown"""
+    regressions = []
+    print(f"\n📊 Compared to {previous.get('git_commit') or '?'} ({previous.get('created_at')}):")
+    for name, current in results['targets'].items():
+        before = previous.get('targets', {}).get(name)
+        if before is None:
+            continue
+        p50_change = current['single']['p50_us'] / before['single']['p50_us'] - 1 if before['single']['p50_us'] else 0
+        qps_change = current['batch']['throughput_qps'] / before['batch']['throughput_qps'] - 1 \
+            if before['batch']['throughput_qps'] else 0
+        cold_change = current['cold']['construct_ms'] / before['cold']['construct_ms'] - 1 \
+            if before['cold']['construct_ms'] else 0
+        print(f"  {name:<20} p50 {p50_change:+7.1%}   batch {qps_change:+7.1%}   cold {cold_change:+7.1%}")
+        if max_slowdown is not None and (p50_change > max_slowdown or qps_change < -max_slowdown):
+            regressions.append(f"{name}: p50 {p50_change:+.1%}, batch throughput {qps_change:+.1%}")
+    return regressions
+
+
+def print_report(results: Dict):
+    header = (f"{'algorithm':<20} {'p50 µs':>10} {'p99 µs':>10} {'batch q/s':>10} "
+              f"{'build ms':>9} {'1st ms':>8}  golden")
+    print(header)
+    print('-' * len(header))
+    for name, result in results['targets'].items():
+        golden = result['golden']
+        status = golden['status'] + (f" ({golden['mismatch_count']})" if golden.get('mismatch_count') else '')
+        print(f"{name:<20} {result['single']['p50_us']:>10} {result['single']['p99_us']:>10} "
+              f"{result['batch']['throughput_qps']:>10} {result['cold']['construct_ms']:>9} "
+              f"{result['cold']['first_call_ms']:>8}  {status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Micro-benchmarks et corpus doré des algorithmes de scoring')
+    parser.add_argument('--target', action='append', help='motif fnmatch (répétable), ex: residents:*')
+    parser.add_argument('--rounds', type=int, default=5, help='passes du corpus pour single et batch')
+    parser.add_argument('--cold-runs', type=int, default=3)
+    parser.add_argument('--top-n', type=int, default=DEFAULT_TOP_N)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='écart absolu admis sur les scores dorés')
+    parser.add_argument('--update-golden', action='store_true', help='réécrit les fichiers dorés')
+    parser.add_argument('--corpus', default=CORPUS_PATH)
+    parser.add_argument('--output', help=f"fichier de résultats (défaut: {RESULTS_DIR}/algorithms-<date>.json)")
+    parser.add_argument('--no-save', action='store_true')
+    parser.add_argument('--compare', help='résultats JSON d\'un run précédent')
+    parser.add_argument('--max-slowdown', type=float,
+                        help='avec --compare: échec si p50 ou débit batch se dégradent de plus (ex: 0.15)')
+    parser.add_argument('--log-level', default='ERROR')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper())
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    corpus = load_corpus(args.corpus)
+    targets = build_targets(corpus)
+    if args.target:
+        targets = [t for t in targets if any(fnmatch.fnmatchcase(t.name, p) for p in args.target)]
+    if not targets:
+        parser.error('no algorithm matches')
+
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'rounds': args.rounds, 'cold_runs': args.cold_runs, 'top_n': args.top_n,
+                   'tolerance': args.tolerance, 'corpus_seed': corpus.get('seed')},
+        'targets': {}
+    }
+    for target in targets:
+        print(f"⏱️ {target.name}...", file=sys.stderr)
+        # Sorties console des algorithmes historiques (print) hors du rapport
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            results['targets'][target.name] = benchmark_target(
+                target, args.rounds, args.cold_runs, args.top_n, args.tolerance,
+                corpus.get('seed'), args.update_golden)
+
+    print_report(results)
+
+    if not args.no_save:
+        output = args.output or os.path.join(RESULTS_DIR, f"algorithms-{datetime.now():%Y%m%d-%H%M%S}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=1)
+        print(f"\n💾 Results saved to {output}")
+
+    failures = []
+    for name, result in results['targets'].items():
+        golden = result['golden']
+        if golden['status'] in ('mismatch', 'missing', 'stale'):
+            failures.append(f"{name}: golden {golden['status']}" +
+                            (f" - {golden['mismatches'][0]}" if golden.get('mismatches') else ''))
+    if args.compare:
+        with open(args.compare) as f:
+            failures += compare_runs(results, json.load(f), args.max_slowdown)
+
+    if failures:
+        print(f"\n❌ {len(failures)} check(s) failed:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print('\n✅ Golden outputs reproduced' + (' (updated)' if args.update_golden else ''))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+📚 CORPUS - QUESTIONNAIRES REJOUÉS PAR LE BANC DE CHARGE
+=========================================================
+Corpus figé (corpus.json) pour que deux runs mesurent la même charge,
+partagé par le banc de charge (load_test) et les micro-benchmarks
+(algorithms):
+
+- Questionnaires pays: réponses tirées des options réelles des
+  questionnaires du frontend (frontend/zscore/js/questions-data-*.js),
+  plus le parcours international (questions-data.js → world); les
+  combinaisons contradictoires (aucune ville par conception) sont corrigées
+- AlgorithmeRevolutionnaire: priorités (critères des données) et budget
+- /api/career, /api/wealth: réponses libres composées du vocabulaire
+  reconnu par les algorithmes (secteurs, niveaux, priorités, épargne...)
+- /api/wealth/timeline: paramètres de simulation plausibles
+- Auth: comptes de test (inscription → vérification → connexion → profil)
+
+Régénération (tirage déterministe, graine fixe):
+    cd backend && python -m benchmarks.corpus
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUESTIONS_DIR = os.path.join(os.path.dirname(BACKEND_DIR), 'frontend', 'zscore', 'js')
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus.json')
+
+DEFAULT_SEED = 2024
+DEFAULT_PER_COUNTRY = 32
+DEFAULT_PER_SERVICE = 32
+DEFAULT_USERS = 8
+
+# Fichier de questions → pays
+QUESTION_FILES = {
+    'france': 'questions-data-fr-residents.js',
+    'usa': 'questions-data-usa-residents.js',
+    'canada': 'questions-data-ca-residents.js',
+    'brazil': 'questions-data-br-residents.js',
+    'uk': 'questions-data-uk-residents.js',
+    'germany': 'questions-data-de-residents.js',
+    'spain': 'questions-data-es-residents.js',
+    'japan': 'questions-data-jp-residents.js',
+    'thailand': 'questions-data-th-residents.js',
+    'morocco': 'questions-data-ma-residents.js',
+    'australia': 'questions-data-au-residents.js',
+    'mexico': 'questions-data-mx-residents.js',
+    'world': 'questions-data.js'
+}
+
+# Pays servis par /api/<pays>-residents/recommendations (world: /api/calculate)
+RESIDENTS_COUNTRIES = [country for country in QUESTION_FILES if country != 'world']
+
+# Corps enveloppés comme le frontend (analysis.js, adaptAnswersFor*): clé → préfixe des réponses
+WRAPPED_PAYLOADS = {
+    'mexico': ('preferences', 'mexico_'),
+    'morocco': ('preferences', 'morocco_'),
+    'thailand': ('responses', 'thailand_')
+}
+# Brésil: questions du frontend → champs attendus par l'algorithme (adaptAnswersForBrazil)
+BRAZIL_FIELDS = {
+    'brazil_regional_preference': 'brazil_region_preference',
+    'brazil_lifestyle_priority': 'brazil_main_priority',
+    'brazil_work_environment': 'brazil_work_situation',
+    'brazil_budget_range': 'brazil_monthly_budget',
+    'brazil_climate_preference': 'brazil_climate_preference',
+    'brazil_housing_preference': 'brazil_housing_preference',
+    'brazil_transport_style': 'brazil_transport_preference',
+    'brazil_social_scene': 'brazil_lifestyle_scene',
+    'brazil_culture_priorities': 'brazil_safety_vs_culture',
+    'brazil_language_comfort': 'brazil_age_profile',
+    'brazil_safety_priorities': 'brazil_family_situation',
+    'brazil_food_culture': 'brazil_deal_breaker'
+}
+BRAZIL_DEFAULTS = {'brazil_main_priority': 'lifestyle_upgrade', 'brazil_monthly_budget': 'budget_balanced'}
+
+_QUESTION_TOKEN = re.compile(r'"?(id|type|value)"?\s*:\s*["\']([^"\']+)["\']')
+
+# Vocabulaire des réponses libres (cf. CAREER_KEYWORDS, WEALTH_KEYWORDS)
+CAREER_SECTORS = ['tech', 'finance', 'healthcare', 'education', 'consulting',
+                  'marketing', 'engineering', 'sales', 'design', 'operations']
+CAREER_LEVELS = ['junior developer, entry level', 'intermediate, 4 years of experience',
+                 'senior engineer', 'team lead', 'manager of a small team', 'débutant en reconversion']
+CAREER_PRIORITIES = ['growth and career évolution', 'better salary', 'remote work from home',
+                     'startup innovation', 'flexibility', 'salaire et télétravail']
+MARKETS = ['france', 'usa', 'canada', 'uk', 'germany', 'spain']
+SAVINGS_ANSWERS = ['I save a lot, high savings rate', "j'épargne peu, c'est difficile",
+                   'I invest a little every month', 'épargne régulière, beaucoup']
+LIFESTYLE_ANSWERS = ['simple and modest lifestyle', 'luxury travel, premium', 'basic needs', 'confortable']
+RETIREMENT_ANSWERS = ['retire early', 'partir tôt', 'retire late', 'at the legal age']
+# Critères des données villes reconnus comme priorités (AlgorithmeRevolutionnaire.mapping)
+REVOLUTIONNAIRE_PRIORITIES = ['ratio_salaire_loyer', 'cout_installation', 'securite_publique', 'emploi_accessible',
+                              'reseau_business', 'transport_economique', 'ecoles_internationales',
+                              'soins_accessibles', 'culture_loisirs', 'climat_agreable', 'qualite_air',
+                              'logement_familial', 'gastronomie_qualite', 'scene_startup', 'tolerance_diversite']
+REVOLUTIONNAIRE_BUDGETS = [1500, 2000, 3000, 4500, 6000, 8000]
+
+
+def load_questions(path: str) -> Dict[str, Dict]:
+    """{question_id: {'type': ..., 'options': [...]}} extrait d'un fichier questions-data"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    questions: Dict[str, Dict] = {}
+    current = None
+    for token, value in _QUESTION_TOKEN.findall(source):
+        if token == 'id':
+            current = questions[value] = {'type': 'single', 'options': []}
+        elif current is not None and token == 'type' and not current['options']:
+            current['type'] = value
+        elif current is not None and token == 'value':
+            current['options'].append(value)
+    return {qid: q for qid, q in questions.items() if q['options']}
+
+
+def answer_questionnaire(questions: Dict[str, Dict], rng: random.Random) -> Dict:
+    answers = {}
+    for qid, question in questions.items():
+        if question['type'] == 'multiple':
+            answers[qid] = rng.sample(question['options'], rng.randint(1, min(3, len(question['options']))))
+        else:
+            answers[qid] = rng.choice(question['options'])
+    return answers
+
+
+def reconcile_answers(country: str, answers: Dict) -> Dict:
+    """Remplace les combinaisons que l'algorithme filtre à vide par conception"""
+    if country == 'uk':
+        # Gallois hors du pays de Galles, anglais seul au pays de Galles: aucune ville candidate
+        region, language = answers.get('uk_region_preference'), answers.get('uk_language_preference')
+        if (language == 'welsh_friendly' and region not in ('wales', 'any_region')) or \
+                (language == 'english_only' and region == 'wales'):
+            answers['uk_language_preference'] = 'language_flexible'
+    return answers
+
+
+def calculate_payload(answers: Dict) -> Dict:
+    """Parcours international (POST /api/calculate)"""
+    return {'answers': answers, 'country': 'world', 'parcours': 'international'}
+
+
+def residents_payload(country: str, answers: Dict) -> Dict:
+    """Corps de POST /api/<pays>-residents/recommendations, tel qu'envoyé par le frontend"""
+    if country in WRAPPED_PAYLOADS:
+        key, prefix = WRAPPED_PAYLOADS[country]
+        return {key: {qid: value for qid, value in answers.items() if qid.startswith(prefix)}}
+    if country == 'brazil':
+        payload = {field: answers[qid] for qid, field in BRAZIL_FIELDS.items() if answers.get(qid)}
+        return {**BRAZIL_DEFAULTS, **payload}
+    return answers
+
+
+def revolutionnaire_questionnaire(rng: random.Random) -> Dict:
+    return {
+        'priorites': rng.sample(REVOLUTIONNAIRE_PRIORITIES, rng.randint(1, 4)),
+        'budget': rng.choice(REVOLUTIONNAIRE_BUDGETS)
+    }
+
+
+def career_payload(rng: random.Random) -> Dict:
+    sectors = rng.sample(CAREER_SECTORS, rng.randint(1, 2))
+    return {
+        'questionnaire': {
+            'current_role': rng.choice(CAREER_LEVELS),
+            'sector_interest': ' and '.join(sectors),
+            'career_priority': rng.choice(CAREER_PRIORITIES),
+            'work_style': rng.choice(['remote', 'hybrid', 'office', 'startup'])
+        },
+        'country': rng.choice(MARKETS)
+    }
+
+
+def wealth_payload(rng: random.Random) -> Dict:
+    return {
+        'questionnaire': {
+            'monthly_income': f"{rng.randrange(1800, 9000, 100)} € net",
+            'savings_habits': rng.choice(SAVINGS_ANSWERS),
+            'lifestyle_goal': rng.choice(LIFESTYLE_ANSWERS),
+            'retirement_goal': rng.choice(RETIREMENT_ANSWERS),
+            'risk_profile': rng.choice(['prudent', 'balanced', 'dynamic'])
+        },
+        'country': rng.choice(MARKETS)
+    }
+
+
+def timeline_payload(rng: random.Random) -> Dict:
+    return {
+        'monthly_savings': rng.randrange(200, 4000, 50),
+        'target_amount': rng.randrange(150000, 1500000, 10000),
+        'expected_roi': round(rng.uniform(0.03, 0.09), 3),
+        'current_age': rng.randint(22, 55),
+        'current_wealth': rng.randrange(0, 300000, 1000)
+    }
+
+
+def build_corpus(seed: int = DEFAULT_SEED, per_country: int = DEFAULT_PER_COUNTRY,
+                 per_service: int = DEFAULT_PER_SERVICE, users: int = DEFAULT_USERS,
+                 questions_dir: str = QUESTIONS_DIR) -> Dict:
+    rng = random.Random(seed)
+    questionnaires: Dict[str, List[Dict]] = {}
+    for country, file_name in QUESTION_FILES.items():
+        questions = load_questions(os.path.join(questions_dir, file_name))
+        questionnaires[country] = [reconcile_answers(country, answer_questionnaire(questions, rng))
+                                   for _ in range(per_country)]
+    return {
+        'seed': seed,
+        'questionnaires': questionnaires,
+        'revolutionnaire': [revolutionnaire_questionnaire(rng) for _ in range(per_country)],
+        'career': [career_payload(rng) for _ in range(per_service)],
+        'wealth': [wealth_payload(rng) for _ in range(per_service)],
+        'wealth_timeline': [timeline_payload(rng) for _ in range(per_service)],
+        'auth_users': [
+            {'email': f"loadtest{index}@example.com", 'password': f"LoadTest{index}Pass", 'name': f"Load Test {index}"}
+            for index in range(users)
+        ]
+    }
+
+
+def load_corpus(path: str = CORPUS_PATH) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Régénère le corpus du banc de charge')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--per-country', type=int, default=DEFAULT_PER_COUNTRY)
+    parser.add_argument('--per-service', type=int, default=DEFAULT_PER_SERVICE)
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS)
+    parser.add_argument('--output', default=CORPUS_PATH)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.seed, args.per_country, args.per_service, args.users)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=1)
+    print(f"📚 Corpus written to {args.output}: {len(corpus['questionnaires'])} countries x {args.per_country} "
+          f"questionnaires, career/wealth/timeline {args.per_service}, users {args.users}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,465 @@
+"""
+🏋️ LOAD TEST - BANC DE CHARGE DES ENDPOINTS PUBLICS
+====================================================
+Rejoue le corpus (corpus.json) contre create_app(), dans le process:
+
+- Deux pilotes: client de test Flask (coût applicatif seul) et vrai
+  serveur WSGI sur localhost (werkzeug make_server dans un thread, HTTP
+  keep-alive via http.client: parsing HTTP et sérialisation compris)
+- Redis remplacé par LocalRedis (auth, sessions, paywall), single-flight
+  sur LocalFlightStore, rate limiting désactivé (tout le trafic vient de
+  127.0.0.1 et serait limité au bout de quelques secondes)
+- Questionnaires pays sur /api/<pays>-residents/recommendations (corps
+  adaptés comme le frontend), parcours international sur /api/calculate
+- Par scénario et par pilote: débit, latences p50/p99, erreurs, RSS
+  (et pic d'allocations avec --tracemalloc); une réponse 200 sans
+  recommandation compte comme une erreur
+- Seuils (thresholds.json) et comparaison à un run de référence
+  (--baseline): code de sortie 1 si un seuil est dépassé
+
+Usage (depuis backend/):
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --driver wsgi --concurrency 8 --scenario 'residents:*'
+    python -m benchmarks.load_test --save baseline.json
+    python -m benchmarks.load_test --baseline baseline.json
+"""
+
+import argparse
+import fnmatch
+import http.client
+import itertools
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.corpus import (CORPUS_PATH, RESIDENTS_COUNTRIES, calculate_payload, load_corpus,
+                               residents_payload)
+from benchmarks.local_redis import LocalRedis
+
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thresholds.json')
+BASE_HEADERS = {'X-Forwarded-Proto': 'https', 'Content-Type': 'application/json'}
+BCRYPT_MAX_REQUESTS = 20  # Inscription / connexion: un hash bcrypt par requête
+
+# (méthode, chemin, corps JSON, en-têtes supplémentaires)
+Request = Tuple[str, str, Optional[Dict], Dict[str, str]]
+
+
+# ===============================
+# 🚗 PILOTES
+# ===============================
+
+class TestClientDriver:
+    """Client de test Flask (un par thread: cookies de session isolés)"""
+
+    name = 'test_client'
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def request(self, method: str, path: str, body: Optional[Dict], headers: Dict[str, str]) -> Tuple[int, bytes]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=body, headers={**BASE_HEADERS, **headers})
+        return response.status_code, response.get_data()
+
+    def close(self):
+        pass
+
+
+class WSGIServerDriver:
+    """Serveur werkzeug threadé sur un port libre + une connexion keep-alive par thread"""
+
+    name = 'wsgi'
+
+    def __init__(self, app):
+        from werkzeug.serving import make_server
+
+        self.server = make_server('127.0.0.1', 0, app, threaded=True)
+        self.port = self.server.server_port
+        self._thread = threading.Thread(target=self.server.serve_forever, name='load-test-wsgi', daemon=True)
+        self._thread.start()
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=60)
+        return connection
+
+    def request(self, method: str, path: str, body: Optional[Dict], headers: Dict[str, str]) -> Tuple[int, bytes]:
+        payload = json.dumps(body).encode('utf-8') if body is not None else None
+        for attempt in (1, 2):
+            connection = self._connection()
+            try:
+                connection.request(method, path, body=payload, headers={**BASE_HEADERS, **headers})
+                response = connection.getresponse()
+                return response.status, response.read()
+            except (http.client.HTTPException, ConnectionError):
+                # Connexion fermée par le serveur: une nouvelle tentative
+                connection.close()
+                self._local.connection = None
+                if attempt == 2:
+                    raise
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+DRIVERS = {'test_client': TestClientDriver, 'wsgi': WSGIServerDriver}
+
+
+# ===============================
+# 🎬 SCÉNARIOS
+# ===============================
+
+class Scenario:
+    """Requêtes d'un endpoint rejouées en boucle (`make_request(i)` → i-ème requête)"""
+
+    def __init__(self, name: str, make_request: Callable[[int], Request], expected_status: int = 200,
+                 setup: Optional[Callable] = None, max_requests: Optional[int] = None,
+                 validate: Optional[Callable[[bytes], bool]] = None):
+        self.name = name
+        self.make_request = make_request
+        self.expected_status = expected_status
+        self.setup = setup
+        self.max_requests = max_requests  # Plafond pour les endpoints lents par conception (bcrypt)
+        self.validate = validate  # Corps d'une réponse au statut attendu → False: erreur
+
+
+def has_recommendations(body: bytes) -> bool:
+    """Succès déclaré et au moins une recommandation (UK / Allemagne: résultat imbriqué)"""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return False
+    if not isinstance(payload, dict) or not (payload.get('success') is True or payload.get('status') == 'success'):
+        return False
+    recommendations = payload.get('recommendations')
+    while isinstance(recommendations, dict):
+        if recommendations.get('status', 'success') != 'success':
+            return False
+        recommendations = recommendations.get('recommendations')
+    return isinstance(recommendations, list) and bool(recommendations)
+
+
+def _cycle(method: str, path: str, payloads: List[Dict]) -> Callable[[int], Request]:
+    return lambda i: (method, path, payloads[i % len(payloads)], {})
+
+
+def _register_request(users: List[Dict]) -> Callable[[int], Request]:
+    sequence = itertools.count()  # Adresse unique à chaque appel, tous pilotes confondus
+
+    def make_request(i: int) -> Request:
+        user = users[i % len(users)]
+        local, domain = user['email'].split('@')
+        return 'POST', '/api/auth/register', {
+            'email': f"{local}.{next(sequence)}@{domain}", 'password': user['password'], 'name': user['name']
+        }, {}
+    return make_request
+
+
+class AuthFixture:
+    """Comptes vérifiés et jetons préparés par le parcours réel (inscription → vérification → connexion)"""
+
+    def __init__(self, users: List[Dict], redis_client: LocalRedis):
+        self.users = users
+        self.redis_client = redis_client
+        self.tokens: List[str] = []
+
+    def prepare(self, driver):
+        if self.tokens:
+            return
+        for user in self.users:
+            driver.request('POST', '/api/auth/register', user, {})
+            user_json = self.redis_client.get(f"user:{user['email']}")
+            token = json.loads(user_json).get('verification_token') if user_json else None
+            if token:
+                driver.request('GET', f"/api/auth/verify-email?token={token}", None, {})
+            status, body = driver.request('POST', '/api/auth/login',
+                                          {'email': user['email'], 'password': user['password']}, {})
+            if status == 200:
+                self.tokens.append(json.loads(body)['jwt_token'])
+        if not self.tokens:
+            raise RuntimeError('Auth fixture: no user could log in')
+
+    def login_request(self, i: int) -> Request:
+        user = self.users[i % len(self.users)]
+        return 'POST', '/api/auth/login', {'email': user['email'], 'password': user['password']}, {}
+
+    def me_request(self, i: int) -> Request:
+        return 'GET', '/api/auth/me', None, {'Authorization': f"Bearer {self.tokens[i % len(self.tokens)]}"}
+
+
+def build_scenarios(corpus: Dict, redis_client: LocalRedis) -> List[Scenario]:
+    questionnaires = corpus['questionnaires']
+    scenarios = [
+        Scenario(f"residents:{country}", _cycle('POST', f"/api/{country}-residents/recommendations", [
+            residents_payload(country, answers) for answers in questionnaires[country]
+        ]), validate=has_recommendations)
+        for country in RESIDENTS_COUNTRIES
+    ]
+    scenarios.append(Scenario('calculate:world', _cycle('POST', '/api/calculate', [
+        calculate_payload(answers) for answers in questionnaires['world']
+    ]), validate=has_recommendations))
+    scenarios += [
+        Scenario('career', _cycle('POST', '/api/career', corpus['career'])),
+        Scenario('wealth', _cycle('POST', '/api/wealth', corpus['wealth'])),
+        Scenario('wealth_timeline', _cycle('POST', '/api/wealth/timeline', corpus['wealth_timeline']))
+    ]
+
+    auth = AuthFixture(corpus['auth_users'], redis_client)
+    scenarios += [
+        Scenario('auth_register', _register_request(corpus['auth_users']), expected_status=201,
+                 max_requests=BCRYPT_MAX_REQUESTS),
+        Scenario('auth_login', auth.login_request, setup=auth.prepare, max_requests=BCRYPT_MAX_REQUESTS),
+        Scenario('auth_me', auth.me_request, setup=auth.prepare)
+    ]
+    return scenarios
+
+
+# ===============================
+# 📏 MESURE
+# ===============================
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    """Rang le plus proche (exact, pas d'histogramme: quelques milliers de mesures)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+def _rss_mb() -> float:
+    """RSS courant (Linux: /proc), sinon pic RSS du process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scenario(driver, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> Dict:
+    if scenario.setup is not None:
+        scenario.setup(driver)
+    if scenario.max_requests is not None:
+        requests = min(requests, scenario.max_requests)
+        warmup = min(warmup, scenario.max_requests)
+    for i in range(warmup):
+        driver.request(*scenario.make_request(i))
+
+    counter = itertools.count(warmup)
+    limit = warmup + requests
+    latencies: List[int] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    def worker():
+        local_latencies, local_errors = [], {}
+        while True:
+            i = next(counter)
+            if i >= limit:
+                break
+            request = scenario.make_request(i)
+            started = time.perf_counter_ns()
+            try:
+                status, body = driver.request(*request)
+            except Exception as e:
+                status = type(e).__name__
+            local_latencies.append(time.perf_counter_ns() - started)
+            if status == scenario.expected_status and scenario.validate is not None and not scenario.validate(body):
+                status = f"{status} empty"
+            if status != scenario.expected_status:
+                local_errors[str(status)] = local_errors.get(str(status), 0) + 1
+        with lock:
+            latencies.extend(local_latencies)
+            for status, count in local_errors.items():
+                errors[status] = errors.get(status, 0) + count
+
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, name=f"load-{scenario.name}-{n}") for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    error_count = sum(errors.values())
+    result = {
+        'scenario': scenario.name,
+        'driver': driver.name,
+        'requests': len(latencies),
+        'concurrency': concurrency,
+        'errors': error_count,
+        'error_statuses': errors,
+        'error_rate': round(error_count / len(latencies), 4) if latencies else 0.0,
+        'duration_s': round(duration, 3),
+        'throughput_rps': round(len(latencies) / duration, 1) if duration else 0.0,
+        'p50_ms': round(_percentile(latencies, 0.50) / 1e6, 3),
+        'p99_ms': round(_percentile(latencies, 0.99) / 1e6, 3),
+        'max_ms': round(latencies[-1] / 1e6, 3) if latencies else 0.0,
+        'rss_mb': round(_rss_mb(), 1)
+    }
+    if tracemalloc.is_tracing():
+        result['alloc_peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    return result
+
+
+# ===============================
+# 🚦 SEUILS
+# ===============================
+
+def _scenario_limits(thresholds: Dict, scenario: str) -> Dict:
+    """Défauts puis entrées dont le motif (fnmatch) correspond, dans l'ordre du fichier"""
+    limits = dict(thresholds.get('defaults', {}))
+    for pattern, overrides in thresholds.get('scenarios', {}).items():
+        if fnmatch.fnmatchcase(scenario, pattern):
+            limits.update(overrides)
+    return limits
+
+
+def check_thresholds(results: List[Dict], thresholds: Dict, baseline: Optional[List[Dict]] = None) -> List[str]:
+    """Liste des dépassements (vide si tout passe)"""
+    failures = []
+    for result in results:
+        label = f"{result['scenario']} [{result['driver']}]"
+        limits = _scenario_limits(thresholds, result['scenario'])
+        if result['error_rate'] > limits.get('max_error_rate', 0.0):
+            failures.append(f"{label}: error rate {result['error_rate']:.2%} "
+                            f"({result['error_statuses']}) > {limits.get('max_error_rate', 0.0):.2%}")
+        if 'max_p99_ms' in limits and result['p99_ms'] > limits['max_p99_ms']:
+            failures.append(f"{label}: p99 {result['p99_ms']}ms > {limits['max_p99_ms']}ms")
+        if 'min_throughput_rps' in limits and result['throughput_rps'] < limits['min_throughput_rps']:
+            failures.append(f"{label}: throughput {result['throughput_rps']} rps < {limits['min_throughput_rps']} rps")
+
+    max_rss = thresholds.get('max_rss_mb')
+    if max_rss is not None and results:
+        peak = max(result['rss_mb'] for result in results)
+        if peak > max_rss:
+            failures.append(f"RSS {peak}MB > {max_rss}MB")
+
+    if baseline:
+        regression = thresholds.get('regression', {})
+        max_p99_increase = regression.get('max_p99_increase', 0.25)
+        max_throughput_drop = regression.get('max_throughput_drop', 0.20)
+        min_delta_ms = regression.get('min_p99_delta_ms', 2.0)  # Bruit ignoré sur les endpoints rapides
+        reference = {(item['scenario'], item['driver']): item for item in baseline}
+        for result in results:
+            previous = reference.get((result['scenario'], result['driver']))
+            if previous is None:
+                continue
+            label = f"{result['scenario']} [{result['driver']}]"
+            p99_delta = result['p99_ms'] - previous['p99_ms']
+            if p99_delta > min_delta_ms and result['p99_ms'] > previous['p99_ms'] * (1 + max_p99_increase):
+                failures.append(f"{label}: p99 regressed {previous['p99_ms']}ms → {result['p99_ms']}ms")
+            if previous['throughput_rps'] and \
+                    result['throughput_rps'] < previous['throughput_rps'] * (1 - max_throughput_drop):
+                failures.append(f"{label}: throughput regressed "
+                                f"{previous['throughput_rps']} → {result['throughput_rps']} rps")
+    return failures
+
+
+# ===============================
+# 🚀 EXÉCUTION
+# ===============================
+
+def build_app(redis_client: LocalRedis):
+    """create_app() avec les substituts locaux (aucun service externe requis)"""
+    os.environ['SINGLE_FLIGHT_BACKEND'] = 'local'
+    os.environ.pop('RATE_LIMIT_BACKEND', None)
+    from main import create_app
+
+    return create_app({'REDIS_CLIENT': redis_client, 'RATE_LIMITING_ENABLED': False})
+
+
+def print_report(results: List[Dict]):
+    header = (f"{'scenario':<22} {'driver':<12} {'req':>6} {'err':>5} {'rps':>9} "
+              f"{'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'rss MB':>8}")
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        print(f"{result['scenario']:<22} {result['driver']:<12} {result['requests']:>6} {result['errors']:>5} "
+              f"{result['throughput_rps']:>9} {result['p50_ms']:>9} {result['p99_ms']:>9} "
+              f"{result['max_ms']:>9} {result['rss_mb']:>8}"
+              + (f"  alloc peak {result['alloc_peak_kb']} KB" if 'alloc_peak_kb' in result else ''))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Banc de charge in-process des endpoints publics')
+    parser.add_argument('--driver', choices=['test_client', 'wsgi', 'both'], default='both')
+    parser.add_argument('--requests', type=int, default=200, help='requêtes mesurées par scénario')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--warmup', type=int, default=0,
+                        help='requêtes non mesurées par scénario (0: caches froids au premier passage du corpus)')
+    parser.add_argument('--scenario', action='append', help='motif fnmatch (répétable), ex: residents:*')
+    parser.add_argument('--corpus', default=CORPUS_PATH)
+    parser.add_argument('--thresholds', default=THRESHOLDS_PATH)
+    parser.add_argument('--baseline', help='résultats JSON de référence (--save d\'un run précédent)')
+    parser.add_argument('--save', help='écrit les résultats JSON')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='pic d\'allocations par scénario (lent: ne pas comparer à une baseline sans)')
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args(argv)
+
+    redis_client = LocalRedis()
+    app = build_app(redis_client)
+    # Journaux applicatifs réduits: le banc mesure le service, pas la console
+    logging.getLogger().setLevel(args.log_level.upper())
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    scenarios = build_scenarios(load_corpus(args.corpus), redis_client)
+    if args.scenario:
+        scenarios = [s for s in scenarios if any(fnmatch.fnmatchcase(s.name, p) for p in args.scenario)]
+    if not scenarios:
+        parser.error('no scenario matches')
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    results = []
+    for driver_name in (['test_client', 'wsgi'] if args.driver == 'both' else [args.driver]):
+        driver = DRIVERS[driver_name](app)
+        try:
+            for scenario in scenarios:
+                results.append(run_scenario(driver, scenario, args.requests, args.concurrency, args.warmup))
+        finally:
+            driver.close()
+
+    print_report(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=1)
+        print(f"\n💾 Results saved to {args.save}")
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = check_thresholds(results, thresholds, baseline)
+    if failures:
+        print(f"\n❌ {len(failures)} threshold(s) exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print('\n✅ All thresholds met')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
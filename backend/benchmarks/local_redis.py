@@ -0,0 +1,122 @@
+"""
+🧪 LOCAL REDIS - SUBSTITUT EN MÉMOIRE POUR LE BANC DE CHARGE
+=============================================================
+Implémente les commandes redis-py utilisées par l'authentification
+(AuthManager, sessions, paywall, freemium) avec la sémantique
+decode_responses=True: valeurs stockées et rendues en str.
+
+Expiration paresseuse (vérifiée à la lecture), verrou global: le but est
+de retirer le réseau et le serveur Redis de la mesure, pas de les simuler.
+"""
+
+import fnmatch
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class LocalRedis:
+    """Sous-ensemble thread-safe de l'API redis.Redis (chaînes, compteurs, listes)"""
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    # --- Interne -----------------------------------------------------------
+
+    def _alive(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+            return False
+        return key in self._data
+
+    def _list(self, key: str) -> List[str]:
+        if not self._alive(key):
+            self._data[key] = []
+        return self._data[key]
+
+    # --- Clés ----------------------------------------------------------------
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._data[key] if self._alive(key) else None
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None, nx: bool = False, **kwargs) -> Optional[bool]:
+        with self._lock:
+            if nx and self._alive(key):
+                return None
+            self._data[key] = str(value)
+            self._expires.pop(key, None)
+            if ex is not None:
+                self._expires[key] = time.monotonic() + ex
+            return True
+
+    def setex(self, key: str, seconds: int, value: Any) -> bool:
+        return self.set(key, value, ex=seconds)
+
+    def exists(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._alive(key))
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self._alive(key):
+                    removed += 1
+                self._data.pop(key, None)
+                self._expires.pop(key, None)
+            return removed
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            if not self._alive(key):
+                return False
+            self._expires[key] = time.monotonic() + seconds
+            return True
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        with self._lock:
+            value = int(self._data[key]) + amount if self._alive(key) else amount
+            self._data[key] = str(value)
+            return value
+
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> Iterator[str]:
+        with self._lock:
+            keys = [key for key in list(self._data) if self._alive(key)]
+        return iter([key for key in keys if match is None or fnmatch.fnmatchcase(key, match)])
+
+    # --- Listes ----------------------------------------------------------------
+
+    def lpush(self, key: str, *values: Any) -> int:
+        with self._lock:
+            items = self._list(key)
+            for value in values:
+                items.insert(0, str(value))
+            return len(items)
+
+    def lrange(self, key: str, start: int, end: int) -> List[str]:
+        with self._lock:
+            if not self._alive(key):
+                return []
+            items = self._data[key]
+            return items[start:] if end == -1 else items[start:end + 1]
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        with self._lock:
+            if self._alive(key):
+                items = self._data[key]
+                self._data[key] = items[start:] if end == -1 else items[start:end + 1]
+            return True
+
+    def flushall(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            self._expires.clear()
+            return True
@@ -0,0 +1,91 @@
+"""
+🩺 PROBES - CONTRÔLE DES SONDES DU LOAD BALANCER
+================================================
+/livez, /readyz et /metrics sont appelés en HTTP direct sur le worker
+(gunicorn écoute en clair sur :8000), plusieurs fois par minute et depuis
+une seule IP. Contrôle, avec le rate limiting réellement actif:
+
+- sondes en HTTP → jamais 400 (HTTPS) ni 429, même au-delà du quota horaire
+- autres routes en HTTP → toujours 400 (l'exemption ne déborde pas)
+- autres routes → toujours limitées (429 au-delà du quota)
+
+Usage (depuis backend/):
+    python -m benchmarks.probes
+"""
+
+import argparse
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from benchmarks.local_redis import LocalRedis
+
+HTTPS_HEADERS = {'X-Forwarded-Proto': 'https'}
+HOURLY_QUOTA = 1000  # max_requests_per_hour de create_app()
+PROBE_STATUSES = {'/livez': {200}, '/readyz': {200, 503}, '/metrics': {200}}
+
+
+def build_app():
+    """create_app() avec rate limiting actif (backend mémoire, aucun service externe)"""
+    os.environ['SINGLE_FLIGHT_BACKEND'] = 'local'
+    os.environ.pop('RATE_LIMIT_BACKEND', None)
+    os.environ.pop('METRICS_TOKEN', None)
+    from main import create_app
+
+    return create_app({'REDIS_CLIENT': LocalRedis(), 'RATE_LIMITING_ENABLED': True})
+
+
+def check_probes(app, requests: int) -> List[str]:
+    failures = []
+    client = app.test_client()
+
+    for path, expected in PROBE_STATUSES.items():
+        statuses = {}
+        for _ in range(requests):
+            status = client.get(path).status_code  # HTTP, sans X-Forwarded-Proto
+            statuses[status] = statuses.get(status, 0) + 1
+        unexpected = {status: count for status, count in statuses.items() if status not in expected}
+        print(f"  {path:<10} {requests} plain HTTP requests → {statuses}")
+        if unexpected:
+            failures.append(f"{path}: unexpected statuses {unexpected}")
+
+    status = client.get('/api/health').status_code
+    print(f"  {'/api/health':<10} plain HTTP → {status}")
+    if status != 400:
+        failures.append(f"/api/health over plain HTTP: {status} (expected 400 HTTPS required)")
+
+    limited_at = None
+    for index in range(HOURLY_QUOTA + 1):
+        if client.get('/api/health', headers=HTTPS_HEADERS).status_code == 429:
+            limited_at = index + 1
+            break
+    print(f"  {'/api/health':<10} rate limited at request {limited_at}")
+    if limited_at is None:
+        failures.append(f"/api/health: no 429 after {HOURLY_QUOTA + 1} requests (rate limiting bypassed)")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Contrôle des sondes (HTTP direct, rate limiting actif)')
+    parser.add_argument('--requests', type=int, default=HOURLY_QUOTA + 100,
+                        help='requêtes par sonde (au-delà du quota horaire: jamais de 429 attendu)')
+    parser.add_argument('--log-level', default='ERROR')
+    args = parser.parse_args(argv)
+
+    app = build_app()
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    print('🩺 Probe endpoints:')
+    failures = check_probes(app, args.requests)
+    if failures:
+        print(f"\n❌ {len(failures)} probe check(s) failed:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print('\n✅ Probes exempt from rate limiting and the HTTPS check')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
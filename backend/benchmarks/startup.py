@@ -0,0 +1,205 @@
+"""
+🧊 STARTUP - DIAGNOSTIC DU DÉMARRAGE À FROID (IMPORTS + CREATE_APP)
+===================================================================
+Chaque run est un interpréteur neuf (comme un worker ou un test):
+
+- `python -X importtime`: temps propre et cumulé de chaque module importé
+- phases de create_app() (PhaseTimer, app.extensions['startup'])
+- imports différés (core.lazy_imports) restés non importés au démarrage
+
+Rapport: modules les plus coûteux (cumulé et propre), coût par paquet de
+premier niveau, phases de create_app (médiane des runs). Résultats en JSON
+(results/, ignoré par git) pour comparer avant / après une optimisation.
+
+Usage (depuis backend/):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --module wsgi --runs 5      # Avec préchargement
+    python -m benchmarks.startup --compare benchmarks/results/startup-20250101-120000.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.algorithms import RESULTS_DIR, _git_commit
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_RUNS = 3
+DEFAULT_TOP = 15
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+# Exécuté dans l'interpréteur mesuré: importe le module cible, écrit les mesures en JSON
+_CHILD_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+module = __import__({module!r})
+import_ms = (time.perf_counter() - started) * 1000
+try:
+    from core.lazy_imports import lazy_import_stats
+    deferred = lazy_import_stats()
+except ImportError:  # Arbre antérieur aux imports différés (comparaison avant / après)
+    deferred = {{}}
+startup = module.app.extensions.get('startup')
+with open({output!r}, 'w') as f:
+    json.dump({{'import_ms': import_ms, 'create_app': startup.as_dict() if startup else None,
+               'deferred_imports': deferred, 'modules': sorted(sys.modules)}}, f)
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Lignes `-X importtime` → [{'module', 'self_us', 'cumulative_us', 'depth'}]"""
+    modules = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append({'module': name, 'self_us': int(self_us), 'cumulative_us': int(cumulative_us),
+                            'depth': len(indent) // 2})
+    return modules
+
+
+def run_cold_start(module: str, backend_dir: str = BACKEND_DIR) -> Dict:
+    """Un démarrage dans un interpréteur neuf"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as handle:
+        output = handle.name
+    try:
+        started = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _CHILD_SCRIPT.format(module=module, output=output)],
+            cwd=backend_dir, capture_output=True, text=True, timeout=300
+        )
+        process_ms = (time.perf_counter() - started) * 1000
+        if process.returncode != 0:
+            raise RuntimeError(f"{module} failed to start:\n{process.stderr[-2000:]}")
+        with open(output) as f:
+            measured = json.load(f)
+    finally:
+        os.remove(output)
+
+    measured['process_ms'] = process_ms
+    measured['imports'] = parse_importtime(process.stderr)
+    return measured
+
+
+def summarize(runs: List[Dict], top: int) -> Dict:
+    """Médianes des runs + classement des modules et paquets (d'après le dernier run)"""
+    last = runs[-1]
+    by_package: Dict[str, int] = defaultdict(int)
+    for entry in last['imports']:
+        by_package[entry['module'].split('.')[0]] += entry['self_us']
+
+    phases: Dict[str, List[float]] = defaultdict(list)
+    for run in runs:
+        for name, stage in ((run.get('create_app') or {}).get('stages') or {}).items():
+            phases[name].append(stage['ms'])
+
+    deferred = last['deferred_imports']
+    return {
+        'process_ms': round(statistics.median(run['process_ms'] for run in runs), 1),
+        'import_ms': round(statistics.median(run['import_ms'] for run in runs), 1),
+        'create_app_ms': round(statistics.median((run.get('create_app') or {}).get('total_ms', 0) for run in runs), 1),
+        'create_app_phases_ms': {name: round(statistics.median(values), 2) for name, values in phases.items()},
+        'modules_loaded': len(last['modules']),
+        'top_cumulative': sorted(last['imports'], key=lambda e: -e['cumulative_us'])[:top],
+        'top_self': sorted(last['imports'], key=lambda e: -e['self_us'])[:top],
+        'packages_ms': {name: round(us / 1000, 1)
+                        for name, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]},
+        'deferred_imports': deferred,
+        'deferred_loaded_at_startup': sorted(name for name, state in deferred.items() if state['imported'])
+    }
+
+
+def print_report(module: str, summary: Dict):
+    print(f"🧊 Cold start of '{module}': process {summary['process_ms']}ms, import {summary['import_ms']}ms "
+          f"(create_app {summary['create_app_ms']}ms), {summary['modules_loaded']} modules")
+
+    print(f"\n{'create_app phase':<24} {'ms':>9}")
+    for name, ms in summary['create_app_phases_ms'].items():
+        print(f"{name:<24} {ms:>9}")
+
+    print(f"\n{'package (self time)':<24} {'ms':>9}")
+    for name, ms in summary['packages_ms'].items():
+        print(f"{name:<24} {ms:>9}")
+
+    print(f"\n{'module (cumulative)':<48} {'cum ms':>9} {'self ms':>9}")
+    for entry in summary['top_cumulative']:
+        print(f"{'  ' * min(entry['depth'], 6) + entry['module']:<48} "
+              f"{entry['cumulative_us'] / 1000:>9.1f} {entry['self_us'] / 1000:>9.1f}")
+
+    deferred = summary['deferred_imports']
+    print(f"\n📦 Deferred imports: {len(deferred) - len(summary['deferred_loaded_at_startup'])}/{len(deferred)} "
+          f"still lazy after startup")
+    for name in summary['deferred_loaded_at_startup']:
+        print(f"  ⚠️ {name} imported during startup")
+
+
+def compare_runs(summary: Dict, previous: Dict, max_slowdown: Optional[float]) -> List[str]:
+    before = previous['summary']
+    regressions = []
+    print(f"\n📊 Compared to {previous.get('git_commit') or '?'} ({previous.get('created_at')}):")
+    for key in ('process_ms', 'import_ms', 'create_app_ms'):
+        change = summary[key] / before[key] - 1 if before.get(key) else 0
+        print(f"  {key:<16} {before.get(key, 0):>9} → {summary[key]:>9}  ({change:+.1%})")
+        if max_slowdown is not None and key == 'import_ms' and change > max_slowdown:
+            regressions.append(f"{key}: {change:+.1%}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Diagnostic du démarrage à froid (imports + create_app)')
+    parser.add_argument('--module', default='main', help="module importé (main, ou wsgi avec préchargement)")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--backend-dir', default=BACKEND_DIR, help='autre arbre backend (ex: worktree git)')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP)
+    parser.add_argument('--output', help=f"fichier de résultats (défaut: {RESULTS_DIR}/startup-<date>.json)")
+    parser.add_argument('--no-save', action='store_true')
+    parser.add_argument('--compare', help='résultats JSON d\'un run précédent')
+    parser.add_argument('--max-slowdown', type=float, help='avec --compare: échec si l\'import ralentit de plus')
+    args = parser.parse_args(argv)
+
+    runs = []
+    for index in range(args.runs):
+        print(f"🧊 Cold start {index + 1}/{args.runs}...", file=sys.stderr)
+        runs.append(run_cold_start(args.module, args.backend_dir))
+    summary = summarize(runs, args.top)
+    print_report(args.module, summary)
+
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'module': args.module, 'runs': args.runs},
+        'summary': summary
+    }
+    if not args.no_save:
+        output = args.output or os.path.join(RESULTS_DIR, f"startup-{datetime.now():%Y%m%d-%H%M%S}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=1)
+        print(f"\n💾 Results saved to {output}")
+
+    failures = []
+    if args.compare:
+        with open(args.compare) as f:
+            failures = compare_runs(summary, json.load(f), args.max_slowdown)
+    if failures:
+        print(f"\n❌ Startup regression: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,6 +17,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 
+from core.metrics import metrics
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -110,6 +112,7 @@ class BaseAlgorithm(ABC):
     def get_cached_result(self, key: str) -> Optional[Any]:
         """Récupère un résultat du cache si valide"""
         if key not in self.cache:
+            metrics.inc('cache_requests_total', cache=self.service_name, result='miss')
             return None
 
         cached_item = self.cache[key]
@@ -118,9 +121,11 @@ class BaseAlgorithm(ABC):
         if age_minutes > cached_item['ttl_minutes']:
             del self.cache[key]
             logger.debug(f"🗑️ Expired cache removed for key: {key}")
+            metrics.inc('cache_requests_total', cache=self.service_name, result='miss')
             return None
 
         logger.debug(f"📦 Cache hit for key: {key}")
+        metrics.inc('cache_requests_total', cache=self.service_name, result='hit')
         return cached_item['data']
 
     def log_calculation(self, questionnaire_size: int, results_count: int, country: str = None):
@@ -0,0 +1,82 @@
+"""
+📐 CONTRIBUTIONS - LIGNES DE CONTRIBUTION PAR CRITÈRE
+=====================================================
+Helpers partagés par les algorithmes résidents pour expliquer un classement
+sans repasser sur les dictionnaires de scores
+
+Principe:
+- Le scoring produit, dans la même passe, la ligne de contribution de la ville
+  (critère → score ville, score × poids)
+- Points forts = sélection partielle top-k sur cette ligne (heapq.nlargest)
+- Points d'attention = lecture directe des critères importants du profil
+- Règles à seuils fixes (indépendantes du profil) évaluées une fois par ville
+"""
+
+import heapq
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# critère → (score ville 0-1, contribution score × poids), ordre des scores ville
+ContributionRow = Dict[str, Tuple[float, float]]
+
+# (critère, comparaison, seuil, libellé) - ex: ('job_market', operator.gt, 0.8, "...")
+ThresholdRule = Tuple[str, Callable[[float, float], bool], float, str]
+
+_CONTRIBUTION = itemgetter(2)
+
+
+def score_with_contributions(scores: Dict[str, float],
+                             weights: Dict[str, float]) -> Tuple[float, ContributionRow]:
+    """Score normalisé (Σ score×poids / Σ poids) + ligne de contribution en une passe"""
+    row = {}
+    total_score = 0.0
+    total_weight = 0.0
+
+    for criterion, city_value in scores.items():
+        weight = weights.get(criterion)
+        if weight is not None:
+            contribution = city_value * weight
+            row[criterion] = (city_value, contribution)
+            total_score += contribution
+            total_weight += weight
+
+    normalized_score = total_score / total_weight if total_weight > 0 else 0.0
+    return normalized_score, row
+
+
+def top_contributions(row: ContributionRow, k: int) -> List[Tuple[str, float, float]]:
+    """Top-k (critère, score, contribution) par contribution décroissante, sans tri complet"""
+    return heapq.nlargest(k, ((criterion, score, contribution)
+                              for criterion, (score, contribution) in row.items()),
+                          key=_CONTRIBUTION)
+
+
+def important_criteria(weights: Dict[str, float], min_weight: float) -> List[str]:
+    """Critères pesant plus que min_weight pour le profil (ordre des poids conservé)"""
+    return [criterion for criterion, weight in weights.items() if weight > min_weight]
+
+
+def weak_criteria(row: ContributionRow, criteria: Iterable[str],
+                  max_score: float, limit: int) -> List[Tuple[str, float]]:
+    """Parmi `criteria`, ceux où la ville score sous max_score (au plus `limit`)"""
+    weak = []
+    for criterion in criteria:
+        entry = row.get(criterion)
+        if entry is not None and entry[0] < max_score:
+            weak.append((criterion, entry[0]))
+            if len(weak) == limit:
+                break
+    return weak
+
+
+def match_threshold_rules(scores: Dict[str, float], rules: Sequence[ThresholdRule],
+                          limit: int) -> List[str]:
+    """Libellés des règles satisfaites, dans l'ordre des règles (critère absent = ignoré)"""
+    labels = []
+    for criterion, compare, threshold, label in rules:
+        value = scores.get(criterion)
+        if value is not None and compare(value, threshold):
+            labels.append(label)
+            if len(labels) == limit:
+                break
+    return labels
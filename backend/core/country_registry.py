@@ -0,0 +1,258 @@
+"""
+🌍 COUNTRY REGISTRY - ALGORITHMES RÉSIDENTS CHARGÉS À LA DEMANDE
+================================================================
+Registre déclaratif des algorithmes pays (algo_<pays>_residents):
+- Module importé et instance construite au premier usage seulement
+- Chemins des données résolus depuis la configuration (COUNTRY_DATA_DIR)
+- Préchauffage optionnel des pays les plus demandés (COUNTRY_WARMUP)
+
+Le temps de create_app() et la mémoire par worker suivent donc les pays
+réellement utilisés, pas l'ensemble du catalogue.
+
+Les routes gardent une référence stable via `proxy(code)`: l'objet délègue
+chaque attribut à l'instance réelle, construite au premier accès.
+
+Chaque chargement enregistre la version du dataset (hash court du fichier)
+et notifie les listeners (ex: pré-sérialisation des réponses /cities).
+"""
+
+import hashlib
+import importlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.tracing import trace_stages
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data_v2"
+
+
+@dataclass(frozen=True)
+class CountrySpec:
+    """Déclaration d'un algorithme pays: module, classe et fichier de données"""
+    module: str
+    class_name: str
+    data_file: str
+
+
+COUNTRY_ALGORITHMS: Dict[str, CountrySpec] = {
+    'usa': CountrySpec('algo_usa_residents', 'USAResidentsAlgorithm', 'villes_usa_residents.json'),
+    'france': CountrySpec('algo_france_residents', 'FranceResidentsAlgorithm', 'villes_france_residents.json'),
+    'canada': CountrySpec('algo_canada_residents', 'CanadaResidentsAlgorithm', 'villes_canada_residents.json'),
+    'uk': CountrySpec('algo_uk_residents', 'UKResidentsAlgorithm', 'villes_uk_residents.json'),
+    'germany': CountrySpec('algo_germany_residents', 'GermanyResidentsAlgorithm', 'villes_germany_residents.json'),
+    'australia': CountrySpec('algo_australia_residents', 'AustraliaResidentsAlgorithm',
+                             'villes_australia_residents.json'),
+    'spain': CountrySpec('algo_spain_residents', 'SpainResidentsAlgorithm', 'villes_spain_residents.json'),
+    'japan': CountrySpec('algo_japan_residents', 'JapanResidentsAlgorithm', 'villes_japan_residents.json'),
+    'mexico': CountrySpec('algo_mexico_residents', 'MexicoResidentsAlgorithm', 'villes_mexico_residents.json'),
+    'morocco': CountrySpec('algo_morocco_residents', 'MoroccoResidentsAlgorithm', 'villes_morocco_residents.json'),
+    'brazil': CountrySpec('algo_brazil_residents', 'BrazilResidentsAlgorithm', 'villes_brazil_residents.json'),
+    'thailand': CountrySpec('algo_thailand_residents', 'ThailandResidentsAlgorithm', 'villes_thailand_residents.json'),
+}
+
+
+class LazyAlgorithm:
+    """Référence stable vers un algorithme pays, construit au premier accès d'attribut"""
+
+    __slots__ = ('_registry', '_code')
+
+    def __init__(self, registry: 'CountryRegistry', code: str):
+        self._registry = registry
+        self._code = code
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._registry.get(self._code), name)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._registry.is_loaded(self._code) else 'lazy'
+        return f"<LazyAlgorithm {self._code} ({state})>"
+
+
+class CountryRegistry:
+    """Import + construction paresseux et thread-safe des algorithmes pays"""
+
+    def __init__(self, data_dir: Optional[os.PathLike] = None,
+                 specs: Optional[Dict[str, CountrySpec]] = None):
+        self.data_dir = Path(data_dir or DEFAULT_DATA_DIR)
+        self.specs = dict(specs or COUNTRY_ALGORITHMS)
+        self._instances: Dict[str, Any] = {}
+        self._versions: Dict[str, str] = {}
+        self._load_times: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._listeners: List[Callable[[str, Any, str], None]] = []
+        self._lock = threading.Lock()
+
+    def __contains__(self, code: str) -> bool:
+        return code in self.specs
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    @property
+    def codes(self) -> List[str]:
+        return list(self.specs)
+
+    def data_path(self, code: str) -> Path:
+        """Chemin du fichier de villes d'un pays"""
+        return self.data_dir / self.specs[code].data_file
+
+    def dataset_version(self, code: str) -> str:
+        """Version du dataset chargé (hash court du fichier, vide si pas encore chargé)"""
+        return self._versions.get(code, '')
+
+    def status(self, code: str) -> Dict[str, Any]:
+        """État de chargement d'un pays (sans le charger): version, durée, dernière erreur"""
+        return {
+            'loaded': code in self._instances,
+            'dataset_version': self._versions.get(code, ''),
+            'load_time_ms': self._load_times.get(code),
+            'last_error': self._errors.get(code)
+        }
+
+    def health_details(self, code: str) -> Dict[str, Any]:
+        """Sonde de santé d'un pays: ne force pas le chargement, lève si le dernier échoue"""
+        status = self.status(code)
+        if status['last_error'] and not status['loaded']:
+            raise RuntimeError(status['last_error'])
+
+        details = {'state': 'loaded' if status['loaded'] else 'lazy'}
+        if status['loaded']:
+            cities_data = self._instances[code].cities_data
+            cities = cities_data.get('cities', []) if isinstance(cities_data, dict) else cities_data
+            details.update({
+                'cities': len(cities),
+                'version': getattr(self._instances[code], 'version', '1.0.0'),
+                'dataset_version': status['dataset_version'],
+                'load_time_ms': status['load_time_ms']
+            })
+        return details
+
+    def add_listener(self, callback: Callable[[str, Any, str], None]):
+        """callback(code, instance, version) appelé après chaque (re)chargement d'un pays"""
+        self._listeners.append(callback)
+
+    def is_loaded(self, code: str) -> bool:
+        return code in self._instances
+
+    def loaded(self) -> List[str]:
+        """Pays dont l'algorithme est déjà construit dans ce worker"""
+        return list(self._instances)
+
+    def get(self, code: str) -> Any:
+        """Instance de l'algorithme d'un pays (importée et construite au premier appel)"""
+        instance = self._instances.get(code)
+        if instance is not None:
+            return instance
+
+        if code not in self.specs:
+            raise KeyError(f"Unknown country algorithm: {code}")
+
+        with self._lock:
+            instance = self._instances.get(code)
+            if instance is None:
+                instance = self._load(code)
+                logger.info(f"🌍 Country algorithm loaded on demand: {code}")
+        return instance
+
+    def reload(self, code: str) -> Any:
+        """Reconstruit l'algorithme d'un pays (dataset modifié sur disque)"""
+        if code not in self.specs:
+            raise KeyError(f"Unknown country algorithm: {code}")
+        with self._lock:
+            instance = self._load(code)
+        logger.info(f"🔄 Country algorithm reloaded: {code} (dataset {self._versions[code]})")
+        return instance
+
+    def _load(self, code: str) -> Any:
+        """Import + construction (appelant détient le verrou), puis notification"""
+        spec = self.specs[code]
+        path = self.data_path(code)
+        started = time.perf_counter()
+        try:
+            algorithm_class = getattr(importlib.import_module(spec.module), spec.class_name)
+            trace_stages(algorithm_class, code)  # Étapes chronométrées quand la requête est tracée
+            instance = algorithm_class(str(path))
+        except Exception as e:
+            self._errors[code] = str(e)
+            raise
+        version = _file_version(path)
+
+        self._instances[code] = instance
+        self._versions[code] = version
+        self._load_times[code] = round((time.perf_counter() - started) * 1000, 1)
+        self._errors.pop(code, None)
+        for callback in self._listeners:
+            try:
+                callback(code, instance, version)
+            except Exception as e:
+                logger.error(f"❌ Country load listener failed for {code}: {e}")
+        return instance
+
+    def proxy(self, code: str) -> LazyAlgorithm:
+        """Référence paresseuse utilisable comme l'instance elle-même"""
+        if code not in self.specs:
+            raise KeyError(f"Unknown country algorithm: {code}")
+        return LazyAlgorithm(self, code)
+
+    def warmup(self, codes: Iterable[str]) -> List[str]:
+        """Construit à l'avance les pays demandés (codes inconnus ignorés avec un warning)"""
+        warmed = []
+        for code in codes:
+            code = code.strip().lower()
+            if not code:
+                continue
+            if code not in self.specs:
+                logger.warning(f"⚠️ Unknown country in warmup list: {code}")
+                continue
+            try:
+                self.get(code)
+                warmed.append(code)
+            except Exception as e:
+                logger.error(f"❌ Country warmup failed for {code}: {e}")
+        return warmed
+
+    def refresh(self, codes: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Construit les pays absents, reconstruit ceux dont le dataset a changé sur disque"""
+        outcome = {}
+        for code in codes or self.codes:
+            try:
+                if code not in self._instances:
+                    self.get(code)
+                    outcome[code] = 'loaded'
+                elif _file_version(self.data_path(code)) != self._versions.get(code):
+                    self.reload(code)
+                    outcome[code] = 'reloaded'
+                else:
+                    outcome[code] = 'unchanged'
+            except Exception as e:
+                logger.error(f"❌ Country refresh failed for {code}: {e}")
+                outcome[code] = 'error'
+        return outcome
+
+
+def _file_version(path: Path) -> str:
+    """Hash court du contenu d'un fichier de données (vide si absent)"""
+    try:
+        return hashlib.md5(path.read_bytes()).hexdigest()[:12]
+    except OSError:
+        return ''
+
+
+def init_country_registry(app) -> CountryRegistry:
+    """
+    Registre configuré depuis app.config:
+    - COUNTRY_DATA_DIR: dossier des villes_*_residents.json (défaut: backend/data_v2)
+    - COUNTRY_WARMUP: pays à construire au démarrage, séparés par des virgules
+    """
+    registry = CountryRegistry(app.config.get('COUNTRY_DATA_DIR'))
+    app.extensions['country_registry'] = registry
+    warmed = registry.warmup((app.config.get('COUNTRY_WARMUP') or '').split(','))
+    logger.info(f"🌍 Country registry: {len(registry)} countries, warmed up: {warmed or 'none'}")
+    return registry
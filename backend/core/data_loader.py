@@ -18,6 +18,8 @@ from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 import hashlib
 
+from core.metrics import metrics
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -81,8 +83,11 @@ class DataLoader:
         if not force_reload and file_path_str in self.cache:
             if not self._is_file_changed(file_path):
                 logger.debug(f"📦 Cache hit for {file_path.name}")
+                metrics.inc('cache_requests_total', cache='data_loader', result='hit')
                 return self.cache[file_path_str]['data']
 
+        metrics.inc('cache_requests_total', cache='data_loader', result='miss')
+
         # Charger le fichier
         try:
             if not file_path.exists():
@@ -175,6 +180,55 @@ class DataLoader:
             logger.info(f"📋 Guide templates loaded")
         return data
 
+    def get_residents_countries(self) -> List[str]:
+        """Liste les pays disposant d'un fichier villes_<pays>_residents.json"""
+        prefix, suffix = "villes_", "_residents.json"
+        return sorted(
+            path.name[len(prefix):-len(suffix)]
+            for path in self.data_root.glob(f"{prefix}*{suffix}")
+        )
+
+    def load_residents_cities(self, country: str, force_reload: bool = False) -> Optional[Dict]:
+        """Charge le dataset résidents d'un pays (metadata + cities + critères)"""
+        residents_file = self.data_root / f"villes_{country}_residents.json"
+
+        data = self._load_json_file(residents_file, force_reload)
+        if data:
+            logger.info(f"🏙️ {country.title()} residents cities loaded: {len(data.get('cities', []))} cities")
+        return data
+
+    def load_job_catalog(self, force_reload: bool = False) -> Optional[Dict]:
+        """Charge le catalogue d'emplois SkillGraph (metadata + jobs)"""
+        catalog_file = self.data_root / "jobs_catalog.json"
+
+        data = self._load_json_file(catalog_file, force_reload)
+        if data:
+            logger.info(f"💼 Job catalog loaded: {len(data.get('jobs', []))} jobs")
+        return data
+
+    def load_skill_graph(self, force_reload: bool = False) -> Optional[Dict]:
+        """Charge le graphe de compétences SkillGraph (skills + edges pondérées)"""
+        graph_file = self.data_root / "skills_graph.json"
+
+        data = self._load_json_file(graph_file, force_reload)
+        if data:
+            logger.info(f"🧠 Skill graph loaded: {len(data.get('skills', []))} skills, "
+                        f"{len(data.get('edges', []))} edges")
+        return data
+
+    def load_market_insights(self, force_reload: bool = False) -> Optional[Dict]:
+        """Charge les tables marché par pays (SkillGraph + Wealth)"""
+        insights_file = self.data_root / "market_insights.json"
+
+        data = self._load_json_file(insights_file, force_reload)
+        if data:
+            logger.info(f"🗺️ Market insights loaded: version {data.get('metadata', {}).get('version', 'N/A')}")
+        return data
+
+    def get_dataset_version(self, file_name: str) -> str:
+        """Version d'un fichier data_v2: hash court de son contenu (vide si absent)"""
+        return self._calculate_file_hash(self.data_root / file_name)[:12]
+
     def get_supported_countries(self) -> List[str]:
         """Retourne la liste des pays supportés"""
         config = self.load_countries_config()
@@ -230,6 +284,26 @@ class DataLoader:
             'cached_files': len(self.cache)
         }
 
+    def preload_all_data(self) -> Dict:
+        """
+        Charge tous les datasets connus (mode multi-process: avant le fork,
+        pour que les workers partagent les pages au lieu de recharger chacun).
+        Idempotent: les fichiers inchangés restent servis depuis le cache.
+        """
+        stats = self.preload_essential_data()
+        for country in self.get_supported_countries():
+            self.load_country_cities(country)
+        for country in self.get_residents_countries():
+            self.load_residents_cities(country)
+        self.load_guides_templates()
+        self.load_job_catalog()
+        self.load_skill_graph()
+        self.load_market_insights()
+
+        stats['cached_files'] = len(self.cache)
+        logger.info(f"✅ All data preloaded: {len(self.cache)} files cached")
+        return stats
+
     def load_cities_data(self, file_name: str) -> Optional[Dict]:
         """
         Charge les données de villes depuis un fichier JSON
@@ -251,8 +325,11 @@ class DataLoader:
             # Check cache
             if self._is_cache_valid(file_path, cache_key):
                 logger.debug(f"📦 Using cached cities data: {file_name}")
+                metrics.inc('cache_requests_total', cache='data_loader_cities', result='hit')
                 return self.cache[cache_key]
 
+            metrics.inc('cache_requests_total', cache='data_loader_cities', result='miss')
+
             # Charger depuis le fichier
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
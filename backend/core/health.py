@@ -0,0 +1,179 @@
+"""
+🏥 HEALTH - REGISTRE DE SANTÉ ET SONDES LIVENESS / READINESS
+============================================================
+Chaque composant (algorithme, dataset) s'enregistre avec une sonde légère
+qui retourne ses détails (version de dataset, volumétrie...) ou lève une
+exception. Un rafraîchisseur en arrière-plan exécute les sondes et publie
+un snapshot pré-sérialisé:
+
+- /livez  → le process répond (corps constant, aucun calcul)
+- /readyz → tous les composants critiques sont prêts (booléen précalculé)
+- /api/health → dernier snapshot sérialisé (bytes servis tels quels)
+- /api/health?detail=1 → sondes exécutées à la demande, vue détaillée
+
+Les probes de load balancer ne déclenchent donc plus aucun calcul.
+Le rafraîchisseur redémarre après un fork (workers gunicorn en preload).
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.http_cache import JsonSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SECONDS = 15.0
+
+Probe = Callable[[], Dict[str, Any]]
+
+
+class ComponentHealth:
+    """État d'un composant: prêt, détails, durée de sonde et dernière erreur"""
+
+    __slots__ = ('name', 'probe', 'critical', 'ready', 'details', 'probe_ms', 'last_error', 'checked_at')
+
+    def __init__(self, name: str, probe: Probe, critical: bool):
+        self.name = name
+        self.probe = probe
+        self.critical = critical
+        self.ready = False
+        self.details: Dict[str, Any] = {}
+        self.probe_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.checked_at: Optional[str] = None
+
+    def check(self):
+        started = time.perf_counter()
+        try:
+            self.details = self.probe() or {}
+            self.ready = self.details.get('status', 'healthy') == 'healthy'
+            self.last_error = None
+        except Exception as e:
+            self.ready = False
+            self.last_error = str(e)
+            logger.warning(f"⚠️ Health probe failed for {self.name}: {e}")
+        self.probe_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.checked_at = datetime.now().isoformat()
+
+    def summary(self) -> Dict[str, Any]:
+        """Vue /api/health: statut + détails de la sonde"""
+        if self.last_error is not None:
+            return {'status': 'unhealthy', 'error': self.last_error}
+        return {'status': 'healthy', **self.details}
+
+    def detail(self) -> Dict[str, Any]:
+        """Vue détaillée: résumé + métadonnées de sonde"""
+        return {
+            **self.summary(),
+            'critical': self.critical,
+            'probe_ms': self.probe_ms,
+            'checked_at': self.checked_at
+        }
+
+
+class HealthRegistry:
+    """Composants enregistrés + snapshot pré-sérialisé rafraîchi en arrière-plan"""
+
+    LIVE_BODY = b'{"status":"alive"}'
+
+    def __init__(self, refresh_seconds: float = DEFAULT_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._components: Dict[str, ComponentHealth] = {}
+        self._lock = threading.Lock()
+        self._snapshot: Tuple[JsonSnapshot, int] = (JsonSnapshot({'gateway': 'starting', 'services': {}}), 503)
+        self._ready = False
+        self._ready_body = b'{"ready":false}'
+        self._refresher_pid: Optional[int] = None
+        self._stop = threading.Event()
+
+    def register(self, name: str, probe: Probe, critical: bool = True):
+        """Ajoute un composant; critical=False n'affecte pas /readyz (statut partiel 206)"""
+        with self._lock:
+            self._components[name] = ComponentHealth(name, probe, critical)
+
+    @property
+    def components(self) -> List[str]:
+        return list(self._components)
+
+    def refresh(self) -> Tuple[JsonSnapshot, int]:
+        """Exécute toutes les sondes et publie un nouveau snapshot"""
+        with self._lock:
+            components = list(self._components.values())
+        for component in components:
+            component.check()
+
+        statuses = [component.ready for component in components]
+        if all(statuses):
+            status_code, gateway = 200, 'healthy'
+        elif any(statuses):
+            status_code, gateway = 206, 'healthy'  # Partial content
+        else:
+            status_code, gateway = 503, 'degraded'
+
+        snapshot = JsonSnapshot({
+            'gateway': gateway,
+            'timestamp': datetime.now().isoformat(),
+            'services': {component.name: component.summary() for component in components}
+        })
+        ready = all(component.ready for component in components if component.critical)
+
+        # Publication atomique (une affectation par attribut)
+        self._snapshot = (snapshot, status_code)
+        self._ready = ready
+        self._ready_body = b'{"ready":true}' if ready else b'{"ready":false}'
+        return self._snapshot
+
+    def snapshot(self) -> Tuple[JsonSnapshot, int]:
+        """Dernier snapshot publié (démarre le rafraîchisseur si besoin)"""
+        self.ensure_refresher()
+        return self._snapshot
+
+    def readiness(self) -> Tuple[bytes, int]:
+        self.ensure_refresher()
+        return self._ready_body, 200 if self._ready else 503
+
+    def details(self) -> Dict[str, Any]:
+        """Vue détaillée à la demande (sondes exécutées maintenant)"""
+        _, status_code = self.refresh()
+        with self._lock:
+            components = list(self._components.values())
+        return {
+            'ready': self._ready,
+            'status_code': status_code,
+            'refresh_seconds': self.refresh_seconds,
+            'timestamp': datetime.now().isoformat(),
+            'services': {component.name: component.detail() for component in components}
+        }
+
+    def ensure_refresher(self):
+        """Thread de rafraîchissement par process (les threads ne survivent pas au fork)"""
+        pid = os.getpid()
+        if self._refresher_pid == pid:
+            return
+        with self._lock:
+            if self._refresher_pid == pid:
+                return
+            self._refresher_pid = pid
+        threading.Thread(target=self._run_refresher, name='health-refresher', daemon=True).start()
+
+    def _run_refresher(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"❌ Health refresh failed: {e}")
+            self._stop.wait(self.refresh_seconds)
+
+    def stop(self):
+        self._stop.set()
+
+
+def init_health(app) -> HealthRegistry:
+    """Registre de santé de l'application (HEALTH_REFRESH_SECONDS, défaut 15s)"""
+    registry = HealthRegistry(float(os.environ.get('HEALTH_REFRESH_SECONDS', DEFAULT_REFRESH_SECONDS)))
+    app.extensions['health_registry'] = registry
+    return registry
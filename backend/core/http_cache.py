@@ -0,0 +1,39 @@
+"""
+📦 HTTP CACHE - RÉPONSES JSON PRÉ-SÉRIALISÉES
+=============================================
+Corps JSON sérialisés une fois + ETag fort, servis tels quels par Flask
+Les GET quasi statiques ne coûtent plus qu'une comparaison d'ETag
+
+- JsonSnapshot: corps (bytes) + ETag "<version dataset>-<hash corps>"
+- snapshot_response(): Response avec ETag + Cache-Control public,
+  304 Not Modified si If-None-Match correspond (nginx et navigateurs)
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from flask import Response, request
+
+DEFAULT_MAX_AGE = 3600  # Secondes de cache navigateur / proxy
+
+
+class JsonSnapshot:
+    """Payload JSON figé: sérialisé une fois, ETag calculé une fois"""
+
+    __slots__ = ('body', 'etag')
+
+    def __init__(self, payload: Any, version: str = ''):
+        self.body = json.dumps(payload, ensure_ascii=False, sort_keys=True,
+                               separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha1(self.body).hexdigest()[:16]
+        self.etag = f"{version}-{digest}" if version else digest
+
+
+def snapshot_response(snapshot: JsonSnapshot, max_age: int = DEFAULT_MAX_AGE) -> Response:
+    """Réponse conditionnelle (200 avec corps, ou 304) pour un snapshot"""
+    response = Response(snapshot.body, mimetype='application/json')
+    response.set_etag(snapshot.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
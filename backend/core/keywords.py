@@ -0,0 +1,69 @@
+"""
+🔤 KEYWORDS - CLASSIFICATION PAR MOTS-CLÉS EN UNE PASSE
+=======================================================
+Moteur partagé pour l'analyse des réponses libres des questionnaires
+(orientation, SkillGraph, Wealth)
+
+Principe:
+- Vocabulaires déclaratifs {catégorie: [mots-clés]} compilés une seule fois
+- Une seule regex d'alternance en lookahead: chaque position du texte est
+  testée, le mot-clé le plus long qui y commence est capturé
+- Les mots-clés plus courts commençant à la même position sont forcément des
+  préfixes du plus long: leurs catégories sont précalculées par mot-clé
+- Même sémantique que `any(word in text for word in [...])` (sous-chaînes,
+  chevauchements compris), mais toutes les catégories en un seul scan
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class KeywordClassifier:
+    """Classifieur multi-catégories compilé depuis des vocabulaires déclaratifs"""
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        self.vocabularies = {
+            category: tuple(dict.fromkeys(word.lower() for word in words if word))
+            for category, words in vocabularies.items()
+        }
+
+        # Mot-clé → catégories qui le contiennent
+        keyword_categories: Dict[str, Set[str]] = {}
+        for category, words in self.vocabularies.items():
+            for word in words:
+                keyword_categories.setdefault(word, set()).add(category)
+
+        # Mot-clé capturé → catégories de tous les mots-clés qui en sont préfixes
+        self._categories: Dict[str, FrozenSet[str]] = {}
+        for keyword in keyword_categories:
+            matched = set()
+            for length in range(1, len(keyword) + 1):
+                matched.update(keyword_categories.get(keyword[:length], ()))
+            self._categories[keyword] = frozenset(matched)
+
+        # Plus longs d'abord: l'alternance retient le plus long mot-clé à chaque position
+        alternatives = sorted(keyword_categories, key=len, reverse=True)
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(map(re.escape, alternatives)) + '))'
+        ) if alternatives else None
+
+    def classify(self, text: str) -> Set[str]:
+        """Catégories dont au moins un mot-clé apparaît dans le texte (minuscules)"""
+        if self._pattern is None or not text:
+            return set()
+
+        categories = set()
+        for match in self._pattern.finditer(text.lower()):
+            categories.update(self._categories[match.group(1)])
+        return categories
+
+    def keywords(self, category: str) -> tuple:
+        """Mots-clés d'une catégorie (ordre déclaratif)"""
+        return self.vocabularies.get(category, ())
+
+
+def response_text(response) -> str:
+    """Texte d'une réponse de questionnaire (valeur brute ou {'value': ...})"""
+    if isinstance(response, dict):
+        return str(response.get('value', '')).lower()
+    return str(response).lower()
@@ -0,0 +1,74 @@
+"""
+📦 LAZY IMPORTS - DÉPENDANCES LOURDES IMPORTÉES AU PREMIER USAGE
+=================================================================
+Paiement (stripe), email (sendgrid), JWT / hachage (jwt, bcrypt) et client
+HTTP sortant (requests) ne servent pas au trafic anonyme de
+recommandations: les importer au démarrage allonge le cold start de chaque
+worker et de chaque test pour rien.
+
+    stripe = lazy_import('stripe')
+    stripe.PaymentIntent.create(...)   # Import réel ici, une seule fois
+
+Même principe que LazyAlgorithm (core.country_registry): référence stable,
+chaque attribut délégué au module réel. Les imports différés sont comptés
+(lazy_import_stats) pour le diagnostic de démarrage.
+"""
+
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """Référence vers un module importé au premier accès d'attribut"""
+
+    __slots__ = ('_name', '_module', '_import_ms', '_lock')
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._import_ms: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    self._import_ms = round((time.perf_counter() - started) * 1000, 1)
+                    self._module = module
+                    logger.info(f"📦 Deferred import of {self._name}: {self._import_ms}ms")
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        state = 'imported' if self._module is not None else 'lazy'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+_lazy_modules: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Module `name` importé au premier accès d'attribut (une référence par nom)"""
+    module = _lazy_modules.get(name)
+    if module is None:
+        module = _lazy_modules.setdefault(name, LazyModule(name))
+    return module
+
+
+def lazy_import_stats() -> Dict[str, Dict[str, Any]]:
+    """État des imports différés: importé ou non, durée de l'import réel"""
+    return {
+        name: {'imported': module._module is not None, 'import_ms': module._import_ms}
+        for name, module in _lazy_modules.items()
+    }
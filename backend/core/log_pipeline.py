@@ -0,0 +1,227 @@
+"""
+📝 LOG PIPELINE - JOURNALISATION NON BLOQUANTE
+==============================================
+Les threads de requête ne font qu'un put_nowait dans une file; un thread
+QueueListener formate et écrit en arrière-plan.
+
+- Log applicatif: logs/revolutionary.log + console (comme avant)
+- Flux d'audit JSON séparé: logs/audit.jsonl (une ligne par événement,
+  sérialisée dans le thread d'écriture)
+- Écritures fichier par lots: flush quand la file se vide ou tous les
+  `batch_size` enregistrements
+- Audit: échantillonnage et plafond par minute par type d'événement
+- File pleine → enregistrement abandonné et compté, jamais d'attente
+- Listener relancé après un fork (workers gunicorn en preload)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 200
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+AUDIT_LOGGER_NAME = 'audit'
+
+
+class BatchingFileHandler(logging.FileHandler):
+    """FileHandler qui ne flush qu'en fin de lot (le listener appelle flush_batch)"""
+
+    def __init__(self, filename: str, batch_size: int = DEFAULT_BATCH_SIZE, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.batch_size = batch_size
+        self._pending = 0
+
+    def flush(self):
+        # Appelé par emit() à chaque enregistrement: différé jusqu'au lot plein
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush_batch()
+
+    def flush_batch(self):
+        if self._pending:
+            self._pending = 0
+            super().flush()
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener qui flush les fichiers dès que la file est vide"""
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                if isinstance(handler, BatchingFileHandler):
+                    handler.flush_batch()
+            return self.queue.get(block)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)  # Arrêt: attendre une place plutôt que lever Full
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler sans attente: file pleine → enregistrement compté et abandonné"""
+
+    def __init__(self, log_queue: queue.Queue, pipeline: 'LogPipeline'):
+        super().__init__(log_queue)
+        self.pipeline = pipeline
+        self.dropped = 0
+
+    def enqueue(self, record):
+        self.pipeline.ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class AuditJsonFormatter(logging.Formatter):
+    """Une ligne JSON par événement d'audit (sérialisée hors thread de requête)"""
+
+    def format(self, record):
+        return json.dumps(getattr(record, 'audit', {'message': record.getMessage()}), default=str)
+
+
+class AuditSampler:
+    """Échantillonnage + plafond par minute, par type d'événement"""
+
+    def __init__(self, sample_rates: Optional[Dict[str, float]] = None,
+                 max_per_minute: Optional[Dict[str, int]] = None):
+        self.sample_rates = sample_rates or {}
+        self.max_per_minute = max_per_minute or {}
+        self._windows: Dict[str, List[int]] = {}  # event → [minute, compte]
+        self._lock = threading.Lock()
+        self.suppressed: Dict[str, int] = {}
+
+    def allow(self, event: str) -> bool:
+        rate = self.sample_rates.get(event, 1.0)
+        if rate < 1.0 and random.random() >= rate:
+            return self._suppress(event)
+
+        cap = self.max_per_minute.get(event)
+        if cap is not None:
+            minute = int(time.time() // 60)
+            with self._lock:
+                window = self._windows.get(event)
+                if window is None or window[0] != minute:
+                    window = self._windows[event] = [minute, 0]
+                if window[1] >= cap:
+                    return self._suppress(event)
+                window[1] += 1
+        return True
+
+    def _suppress(self, event: str) -> bool:
+        self.suppressed[event] = self.suppressed.get(event, 0) + 1
+        return False
+
+
+class LogPipeline:
+    """File + listener partagés par le log applicatif et le flux d'audit"""
+
+    def __init__(self, log_dir: str, level: int = logging.INFO,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.log_dir = log_dir
+        self.level = level
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.batch_size = batch_size
+        self.queue_handler = NonBlockingQueueHandler(self.queue, self)
+        self._listener: Optional[BatchingQueueListener] = None
+        self._listener_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _build_handlers(self) -> List[logging.Handler]:
+        formatter = logging.Formatter(LOG_FORMAT)
+        app_file = BatchingFileHandler(os.path.join(self.log_dir, 'revolutionary.log'), self.batch_size)
+        console = logging.StreamHandler()
+        audit_file = BatchingFileHandler(os.path.join(self.log_dir, 'audit.jsonl'), self.batch_size)
+        for handler in (app_file, console):
+            handler.setFormatter(formatter)
+            handler.addFilter(lambda record: record.name != AUDIT_LOGGER_NAME)
+        audit_file.setFormatter(AuditJsonFormatter())
+        audit_file.addFilter(lambda record: record.name == AUDIT_LOGGER_NAME)
+        return [app_file, console, audit_file]
+
+    def ensure_listener(self):
+        """Listener par process (le thread d'écriture ne survit pas au fork)"""
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._lock:
+            if self._listener_pid == pid:
+                return
+            self._listener = BatchingQueueListener(self.queue, *self._build_handlers(),
+                                                   respect_handler_level=True)
+            self._listener.start()
+            self._listener_pid = pid
+
+    def install(self):
+        """Remplace les handlers du root logger par le QueueHandler"""
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(self.level)
+        self.ensure_listener()
+
+    def stop(self):
+        """Vide la file et ferme les fichiers (arrêt propre)"""
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            self._listener_pid = None
+
+    def get_stats(self) -> Dict:
+        return {
+            'queued': self.queue.qsize(),
+            'dropped': self.queue_handler.dropped,
+            'audit_suppressed': dict(audit_sampler.suppressed)
+        }
+
+
+audit_logger = logging.getLogger(AUDIT_LOGGER_NAME)
+
+# Échantillonnage d'audit global (configuré par SecurityMiddleware)
+audit_sampler = AuditSampler()
+
+# Pipeline global (configure_logging)
+log_pipeline: Optional[LogPipeline] = None
+
+
+def configure_logging(log_dir: str, level: int = logging.INFO) -> LogPipeline:
+    """Installe le pipeline (LOG_QUEUE_SIZE, LOG_BATCH_SIZE en variables d'environnement)"""
+    global log_pipeline
+    os.makedirs(log_dir, exist_ok=True)
+    if log_pipeline is None:
+        log_pipeline = LogPipeline(
+            log_dir, level,
+            queue_size=int(os.environ.get('LOG_QUEUE_SIZE', DEFAULT_QUEUE_SIZE)),
+            batch_size=int(os.environ.get('LOG_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+        )
+        log_pipeline.install()
+        atexit.register(log_pipeline.stop)
+    return log_pipeline
+
+
+def audit_allowed(event: str) -> bool:
+    """À tester avant de construire l'entrée (False si échantillonné / plafonné)"""
+    return audit_sampler.allow(event)
+
+
+def audit_event(event: str, entry: Dict):
+    """Flux d'audit JSON (sérialisé par le thread d'écriture si le pipeline est installé)"""
+    audit_logger.info(event, extra={'audit': entry})
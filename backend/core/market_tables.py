@@ -0,0 +1,52 @@
+"""
+🗺️ MARKET TABLES - TABLES PAYS IMMUABLES
+========================================
+Tables {pays: valeur} chargées une fois via DataLoader (data_v2/market_insights.json)
+Partagées par SkillGraph (compétences, salaires) et Wealth (perspectives, fiscalité)
+
+Principe:
+- Valeurs gelées à la construction (MappingProxyType / tuple): aucune
+  reconstruction ni mutation accidentelle entre deux requêtes
+- thaw() rend une copie JSON-sérialisable pour les résultats d'analyse
+- Version du dataset = hash du fichier (DataLoader.get_dataset_version),
+  reprise dans les ETags des réponses pré-sérialisées
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+
+def freeze(value: Any) -> Any:
+    """Copie immuable récursive (dict → MappingProxyType, list → tuple)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Copie mutable récursive d'une valeur gelée (dict / list)"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class CountryTable:
+    """Table immuable par pays avec valeur par défaut pour les pays non couverts"""
+
+    def __init__(self, rows: Optional[Dict[str, Any]], default: Any = None):
+        self._rows = freeze(rows or {})
+        self._default = freeze(default)
+
+    def get(self, country: str) -> Any:
+        """Valeur gelée du pays (ou valeur par défaut)"""
+        return self._rows.get(country, self._default)
+
+    def countries(self) -> Iterable[str]:
+        return self._rows.keys()
+
+    def __contains__(self, country: str) -> bool:
+        return country in self._rows
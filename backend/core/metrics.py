@@ -0,0 +1,316 @@
+"""
+📈 METRICS - HISTOGRAMMES DE LATENCE ET EXPOSITION /metrics
+===========================================================
+Instrumentation sans APM externe:
+
+- Latence par endpoint / pays / méthode / statut: histogrammes log-linéaires
+  façon HDR (8 sous-cases par puissance de 2, erreur relative ≤ 12,5 %),
+  en microsecondes, mesurés avec perf_counter_ns
+- Compteurs (hits/misses des caches DataLoader, BaseAlgorithm...) et
+  collecteurs lus au scrape (pipeline wealth, LRU skillgraph, single-flight)
+- Sans verrou sur le chemin chaud: chaque thread écrit dans son propre shard,
+  les shards sont fusionnés au scrape; ceux des threads terminés (un thread
+  par connexion sous werkzeug) sont repliés dans un agrégat unique
+- Multi-workers: avec METRICS_DIR, chaque worker publie son snapshot dans
+  un fichier (écriture atomique) et /metrics agrège tous les fichiers;
+  les quantiles sont calculés sur les cases fusionnées (pas de moyenne de p99);
+  les fichiers des workers arrêtés restent comptés (compteurs monotones)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = 28 * SUB_BUCKETS  # Jusqu'à ~2^28 µs (≈ 4,5 min), au-delà: dernière case
+QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_FLUSH_SECONDS = 5.0
+
+Labels = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Iterable[Tuple[str, Dict[str, str], float]]]
+
+
+def bucket_index(value_us: int) -> int:
+    """Case log-linéaire d'une durée en µs (O(1), bit_length)"""
+    if value_us < SUB_BUCKETS:
+        return max(value_us, 0)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    index = (shift + 1) * SUB_BUCKETS + (value_us >> shift) - SUB_BUCKETS
+    return min(index, BUCKET_COUNT - 1)
+
+
+def bucket_upper_us(index: int) -> int:
+    """Borne supérieure (exclue) d'une case, en µs"""
+    if index < SUB_BUCKETS:
+        return index + 1
+    shift = index // SUB_BUCKETS - 1
+    return (SUB_BUCKETS + index % SUB_BUCKETS + 1) << shift
+
+
+def quantile_us(counts: List[int], total: int, q: float) -> float:
+    """Quantile approché: borne haute de la case qui contient le rang q"""
+    if not total:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        seen += count
+        if count and seen >= rank:
+            return float(bucket_upper_us(index))
+    return float(bucket_upper_us(len(counts) - 1))
+
+
+def _labels(**labels: str) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+class _Shard:
+    """Données d'un thread (seul écrivain → pas de verrou)"""
+
+    __slots__ = ('histograms', 'counters', 'thread')
+
+    def __init__(self, thread: Optional[threading.Thread] = None):
+        self.histograms: Dict[Tuple[str, Labels], list] = {}  # → [counts, total, somme µs]
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.thread = thread  # Écrivain (None: agrégat des threads terminés)
+
+    def merge(self, other: '_Shard'):
+        """Ajoute les données de `other` à ce shard"""
+        for key, (counts, total, sum_us) in list(other.histograms.items()):
+            merged = self.histograms.setdefault(key, [[0] * BUCKET_COUNT, 0, 0])
+            merged[0] = [a + b for a, b in zip(merged[0], counts)]
+            merged[1] += total
+            merged[2] += sum_us
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0) + value
+
+
+class MetricsRegistry:
+    """Shards par thread + collecteurs, snapshot fusionné et export texte"""
+
+    def __init__(self, metrics_dir: Optional[str] = None, flush_seconds: float = DEFAULT_FLUSH_SECONDS):
+        self.metrics_dir = metrics_dir
+        self.flush_seconds = flush_seconds
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()  # Shards des threads terminés, fusionnés
+        self._shards_lock = threading.Lock()
+        self._collectors: Dict[str, Collector] = {}
+        self._flusher_pid: Optional[int] = None
+        self._owner_pid = os.getpid()
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._shards_lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+        return shard
+
+    def _retire_dead_shards(self):
+        """Replie les shards des threads terminés (verrou tenu): mémoire et scrape bornés par les threads vivants"""
+        alive = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                alive.append(shard)
+            else:
+                self._retired.merge(shard)
+        self._shards = alive
+
+    # --- Chemin chaud -----------------------------------------------------
+
+    def observe(self, name: str, duration_ns: int, **labels: str):
+        """Ajoute une durée à l'histogramme `name`"""
+        key = (name, _labels(**labels))
+        histograms = self._shard().histograms
+        entry = histograms.get(key)
+        if entry is None:
+            entry = histograms[key] = [[0] * BUCKET_COUNT, 0, 0]
+        value_us = duration_ns // 1000
+        entry[0][bucket_index(value_us)] += 1
+        entry[1] += 1
+        entry[2] += value_us
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        """Incrémente le compteur `name`"""
+        key = (name, _labels(**labels))
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0) + amount
+
+    def register_collector(self, name: str, collector: Collector):
+        """Collecteur appelé au scrape: itérable de (métrique, labels, valeur)"""
+        self._collectors[name] = collector
+
+    # --- Agrégation -------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        """Snapshot du process (shards fusionnés + collecteurs), sérialisable JSON"""
+        merged = _Shard()
+        with self._shards_lock:
+            self._retire_dead_shards()
+            merged.merge(self._retired)
+            shards = list(self._shards)
+        for shard in shards:
+            merged.merge(shard)
+        histograms, counters = merged.histograms, merged.counters
+        for name, collector in self._collectors.items():
+            try:
+                for metric, labels, value in collector():
+                    key = (metric, _labels(**labels))
+                    counters[key] = counters.get(key, 0) + value
+            except Exception as e:
+                logger.warning(f"⚠️ Metrics collector {name} failed: {e}")
+        return {
+            'histograms': [[name, list(labels), counts, total, sum_us]
+                           for (name, labels), (counts, total, sum_us) in histograms.items()],
+            'counters': [[name, list(labels), value] for (name, labels), value in counters.items()]
+        }
+
+    def _snapshot_path(self, pid: int) -> str:
+        return os.path.join(self.metrics_dir, f"metrics-{pid}.json")
+
+    def flush(self):
+        """Publie le snapshot du worker (fichier remplacé atomiquement)"""
+        if not self.metrics_dir:
+            return
+        path = self._snapshot_path(os.getpid())
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def ensure_flusher(self):
+        """Thread de publication par process (relancé après fork)"""
+        if not self.metrics_dir:
+            return
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._shards_lock:
+            if self._flusher_pid == pid:
+                return
+            self._flusher_pid = pid
+            if pid != self._owner_pid:
+                # Worker forké: les shards hérités (preload du master) ne sont pas son trafic
+                self._owner_pid = pid
+                self._shards = []
+                self._retired = _Shard()
+                self._local = threading.local()
+        threading.Thread(target=self._run_flusher, name='metrics-flusher', daemon=True).start()
+
+    def _run_flusher(self):
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"❌ Metrics flush failed: {e}")
+            time.sleep(self.flush_seconds)
+
+    def collect(self) -> List[Dict]:
+        """Snapshots de tous les workers (ou du seul process sans METRICS_DIR)"""
+        if not self.metrics_dir:
+            return [self.snapshot()]
+        self.flush()
+        snapshots = []
+        for file_name in os.listdir(self.metrics_dir):
+            if file_name.startswith('metrics-') and file_name.endswith('.json'):
+                try:
+                    with open(os.path.join(self.metrics_dir, file_name)) as f:
+                        snapshots.append(json.load(f))
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Unreadable metrics snapshot {file_name}: {e}")
+        return snapshots
+
+    # --- Exposition ---------------------------------------------------------
+
+    def render(self) -> str:
+        """Format texte Prometheus (summary de latence + compteurs)"""
+        histograms: Dict[Tuple[str, Labels], list] = {}
+        counters: Dict[Tuple[str, Labels], float] = {}
+        for snapshot in self.collect():
+            for name, labels, counts, total, sum_us in snapshot['histograms']:
+                key = (name, tuple(tuple(pair) for pair in labels))
+                merged = histograms.setdefault(key, [[0] * BUCKET_COUNT, 0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+                merged[2] += sum_us
+            for name, labels, value in snapshot['counters']:
+                key = (name, tuple(tuple(pair) for pair in labels))
+                counters[key] = counters.get(key, 0) + value
+
+        lines = []
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f"# TYPE {name}_seconds summary")
+            for (metric, labels), (counts, total, sum_us) in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for q in QUANTILES:
+                    value = quantile_us(counts, total, q) / 1e6
+                    lines.append(f"{name}_seconds{_format_labels(labels + (('quantile', str(q)),))} {value:.6f}")
+                lines.append(f"{name}_seconds_count{_format_labels(labels)} {total}")
+                lines.append(f"{name}_seconds_sum{_format_labels(labels)} {sum_us / 1e6:.6f}")
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {name} counter")
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+
+def cache_counters(cache: str, hits: int, misses: int) -> List[Tuple[str, Dict[str, str], float]]:
+    """Échantillons cache_requests_total d'un cache qui tient ses propres stats (collecteurs)"""
+    return [
+        ('cache_requests_total', {'cache': cache, 'result': 'hit'}, hits),
+        ('cache_requests_total', {'cache': cache, 'result': 'miss'}, misses)
+    ]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+# Registre global (DataLoader, BaseAlgorithm... y écrivent directement)
+metrics = MetricsRegistry(os.environ.get('METRICS_DIR') or None,
+                          float(os.environ.get('METRICS_FLUSH_SECONDS', DEFAULT_FLUSH_SECONDS)))
+
+
+def init_metrics(app) -> MetricsRegistry:
+    """Latence de chaque requête, à partir de g.request_start_time (SecurityMiddleware)"""
+    from flask import g, request
+
+    if metrics.metrics_dir:
+        os.makedirs(metrics.metrics_dir, exist_ok=True)
+
+    @app.after_request
+    def record_request_latency(response):
+        metrics.ensure_flusher()
+        started = g.get('request_start_time')
+        if started is not None:
+            rule = request.url_rule
+            view_args = request.view_args or {}
+            metrics.observe(
+                'http_request_duration', time.perf_counter_ns() - started,
+                endpoint=rule.rule if rule is not None else 'unmatched',
+                # Pays seulement pour les réponses valides (borne la cardinalité)
+                country=view_args.get('country', '') if response.status_code < 400 else '',
+                method=request.method,
+                status=str(response.status_code)
+            )
+        return response
+
+    app.extensions['metrics'] = metrics
+    return metrics
@@ -0,0 +1,247 @@
+"""
+🔬 PROFILER - PROFILAGE À LA DEMANDE D'UN WORKER EN PRODUCTION
+==============================================================
+Deux modes, lancés depuis les endpoints admin /api/admin/profile/*:
+
+- Requêtes: cProfile sur les N prochaines requêtes d'une route. La vue est
+  remplacée dans app.view_functions le temps de la capture, puis restaurée:
+  aucun hook ni coût quand rien n'est armé.
+- Échantillonnage: pile de tous les threads relevée à intervalle fixe
+  pendant T secondes (thread dédié, sys._current_frames).
+
+Résultats: texte pstats (tri cumulatif), fichier pstats binaire
+(snakeviz, pstats.Stats) ou piles repliées "thread;frame;frame N" pour
+flamegraph.pl / speedscope.
+
+Garde-fous: bornes sur N, T et l'intervalle, une capture de chaque type à
+la fois, expiration automatique, une seule requête profilée à la fois.
+Le profiler est propre au worker: l'identifiant de job est lié à son pid.
+"""
+
+import cProfile
+import io
+import itertools
+import logging
+import marshal
+import math
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_PROFILED_REQUESTS = 100
+MAX_SAMPLE_SECONDS = 60.0
+MIN_SAMPLE_INTERVAL = 0.001
+DEFAULT_CAPTURE_TIMEOUT = 300.0
+MAX_KEPT_JOBS = 10
+
+
+class ProfilerBusy(Exception):
+    """Une capture du même type est déjà en cours sur ce worker"""
+
+
+class ProfileJob:
+    """Capture en cours ou terminée"""
+
+    def __init__(self, job_id: str, kind: str, params: Dict[str, Any]):
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+        self.status = 'running'
+        self.started_at = datetime.now().isoformat()
+        self.finished_at: Optional[str] = None
+        self.captured = 0
+        self.stats: Optional[pstats.Stats] = None
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+    def finish(self, status: str = 'done'):
+        if self.status == 'running':
+            self.status = status
+            self.finished_at = datetime.now().isoformat()
+
+    def summary(self) -> Dict[str, Any]:
+        summary = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'params': self.params,
+            'worker_pid': os.getpid(),
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if self.kind == 'requests':
+            summary['captured_requests'] = self.captured
+        else:
+            summary['samples'] = self.samples
+        return summary
+
+    # --- Rendus -----------------------------------------------------------
+
+    def pstats_text(self, limit: int = 40, sort: str = 'cumulative') -> str:
+        if self.stats is None:
+            return ''
+        buffer = io.StringIO()
+        self.stats.stream = buffer
+        try:
+            self.stats.sort_stats(sort).print_stats(limit)
+        finally:
+            self.stats.stream = sys.stdout
+        return buffer.getvalue()
+
+    def pstats_dump(self) -> bytes:
+        """Même format que pstats.Stats.dump_stats (fichier .prof)"""
+        return marshal.dumps(self.stats.stats) if self.stats is not None else b''
+
+    def collapsed(self) -> str:
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfilerService:
+    """Captures cProfile par route et échantillonnage de piles, par worker"""
+
+    def __init__(self):
+        self._jobs: "OrderedDict[str, ProfileJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._capture_lock = threading.Lock()  # Une requête profilée à la fois
+        self._active: Dict[str, ProfileJob] = {}  # type → job en cours
+        self._ids = itertools.count(1)
+
+    def _new_job(self, kind: str, params: Dict[str, Any]) -> ProfileJob:
+        """Appelant détient self._lock"""
+        active = self._active.get(kind)
+        if active is not None and active.status == 'running':
+            raise ProfilerBusy(f"A {kind} capture is already running ({active.id})")
+        job = ProfileJob(f"{os.getpid()}-{next(self._ids)}", kind, params)
+        self._active[kind] = job
+        self._jobs[job.id] = job
+        while len(self._jobs) > MAX_KEPT_JOBS:
+            self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> Optional[ProfileJob]:
+        return self._jobs.get(job_id)
+
+    def jobs(self):
+        return [job.summary() for job in reversed(self._jobs.values())]
+
+    # --- cProfile sur les prochaines requêtes --------------------------------
+
+    @staticmethod
+    def resolve_endpoint(app, target: str, method: str = 'GET') -> str:
+        """Endpoint Flask depuis un nom d'endpoint ou un chemin d'URL"""
+        if target in app.view_functions:
+            return target
+        try:
+            endpoint, _ = app.url_map.bind('localhost').match(target, method=method.upper())
+        except Exception as e:
+            raise ValueError(f"No route matches {method.upper()} {target}") from e
+        return endpoint
+
+    def profile_requests(self, app, target: str, count: int, method: str = 'GET',
+                         timeout: float = DEFAULT_CAPTURE_TIMEOUT) -> ProfileJob:
+        """Arme cProfile sur les `count` prochaines requêtes de la route `target`"""
+        if not 1 <= count <= MAX_PROFILED_REQUESTS:
+            raise ValueError(f"count must be between 1 and {MAX_PROFILED_REQUESTS}")
+        if not math.isfinite(timeout) or timeout <= 0:
+            raise ValueError("timeout must be a positive number of seconds")
+        endpoint = self.resolve_endpoint(app, target, method)
+
+        with self._lock:
+            job = self._new_job('requests', {'endpoint': endpoint, 'count': count, 'timeout': timeout})
+            original = app.view_functions[endpoint]
+
+            def restore(status: str = 'done'):
+                with self._lock:
+                    if app.view_functions.get(endpoint) is profiled_view:
+                        app.view_functions[endpoint] = original
+                    job.finish(status)
+
+            def profiled_view(*args, **kwargs):
+                if job.status != 'running' or not self._capture_lock.acquire(blocking=False):
+                    return original(*args, **kwargs)
+                profile = cProfile.Profile()
+                try:
+                    return profile.runcall(original, *args, **kwargs)
+                finally:
+                    if job.stats is None:
+                        job.stats = pstats.Stats(profile)
+                    else:
+                        job.stats.add(profile)
+                    job.captured += 1
+                    self._capture_lock.release()
+                    if job.captured >= count:
+                        restore()
+
+            app.view_functions[endpoint] = profiled_view
+
+        timer = threading.Timer(timeout, restore, kwargs={'status': 'expired'})
+        timer.daemon = True
+        timer.start()
+        logger.warning(f"🔬 cProfile armed on {endpoint} for {count} requests (job {job.id})")
+        return job
+
+    # --- Échantillonnage des piles -------------------------------------------
+
+    def sample_stacks(self, seconds: float, interval: float = 0.01) -> ProfileJob:
+        """Relève les piles de tous les threads toutes les `interval` s pendant `seconds` s"""
+        if not 0 < seconds <= MAX_SAMPLE_SECONDS:
+            raise ValueError(f"seconds must be in (0, {MAX_SAMPLE_SECONDS}]")
+        if not math.isfinite(interval):
+            raise ValueError("interval must be a finite number")
+        # Borné des deux côtés: l'échantillonneur ne vérifie l'échéance qu'entre deux pauses
+        interval = min(max(interval, MIN_SAMPLE_INTERVAL), seconds)
+
+        with self._lock:
+            job = self._new_job('stacks', {'seconds': seconds, 'interval': interval})
+        threading.Thread(target=self._run_sampler, args=(job, seconds, interval),
+                         name='stack-sampler', daemon=True).start()
+        logger.warning(f"🔬 Stack sampling for {seconds}s every {interval * 1000:.0f}ms (job {job.id})")
+        return job
+
+    def _run_sampler(self, job: ProfileJob, seconds: float, interval: float):
+        own_ident = threading.get_ident()
+        deadline = time.monotonic() + seconds
+        labels: Dict[Any, str] = {}
+        try:
+            while time.monotonic() < deadline:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                for ident, frame in sys._current_frames().items():
+                    if ident == own_ident:
+                        continue
+                    stack = []
+                    while frame is not None:
+                        code = frame.f_code
+                        label = labels.get(code)
+                        if label is None:
+                            label = labels[code] = (f"{code.co_name} "
+                                                    f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                        stack.append(label)
+                        frame = frame.f_back
+                    stack.append(names.get(ident, f"thread-{ident}"))
+                    job.stacks[';'.join(reversed(stack))] += 1
+                job.samples += 1
+                time.sleep(interval)
+            job.finish()
+        except Exception as e:
+            logger.error(f"❌ Stack sampling failed: {e}")
+            job.finish('error')
+
+
+# Instance globale (par worker)
+profiler = ProfilerService()
+
+
+def profile_result(job: ProfileJob, output: str, limit: int = 40):
+    """(corps, mimetype, nom de fichier ou None) selon le format demandé"""
+    if output == 'pstats':
+        return job.pstats_dump(), 'application/octet-stream', f"profile-{job.id}.prof"
+    if output == 'collapsed' or (output == 'auto' and job.kind == 'stacks'):
+        return job.collapsed(), 'text/plain', None
+    return job.pstats_text(limit), 'text/plain', None
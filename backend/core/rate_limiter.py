@@ -0,0 +1,191 @@
+"""
+🚦 RATE LIMITER - FENÊTRE GLISSANTE O(1)
+========================================
+Compteur à fenêtre glissante par clé (client + règle):
+    estimation = précédente × (1 - fraction écoulée) + courante
+Une vérification = deux lectures + un incrément, quel que soit le nombre
+de clients suivis.
+
+Backends interchangeables (même interface `hit`):
+- MemoryRateLimitBackend: compteurs du process, expiration amortie par une
+  roue temporelle (une case par fenêtre, purgée en bloc quand elle expire)
+- RedisRateLimitBackend: script Lua atomique, limites cohérentes entre
+  workers gunicorn, expiration native (PEXPIRE)
+
+Limites configurables par préfixe de route (le plus long préfixe gagne),
+défaut global sinon.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limite: `limit` requêtes par fenêtre de `window_seconds`"""
+    limit: int
+    window_seconds: int
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    """Résultat d'une vérification (en-têtes X-RateLimit-*)"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int
+
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+
+def parse_limit(value: str) -> RateLimit:
+    """'60/minute' → RateLimit(60, 60)"""
+    count, _, period = value.partition('/')
+    return RateLimit(int(count), PERIODS[period.strip().lower()])
+
+
+class MemoryRateLimitBackend:
+    """Compteurs en mémoire (stand-in Redis pour tests / mono-worker)"""
+
+    def __init__(self):
+        self._counts: Dict[Tuple[str, int, int], int] = {}
+        # Roue temporelle: (durée fenêtre, id fenêtre) → clés à purger à l'expiration
+        self._wheel: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        self._windows: Dict[int, deque] = defaultdict(deque)  # Cases ouvertes, ordre croissant
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window_seconds: int, now: float) -> Tuple[bool, float]:
+        """Incrémente si l'estimation glissante reste sous la limite → (autorisé, estimation)"""
+        window = int(now // window_seconds)
+        weight = 1.0 - (now % window_seconds) / window_seconds
+
+        with self._lock:
+            self._expire(window_seconds, window)
+            current = self._counts.get((key, window_seconds, window), 0)
+            estimate = self._counts.get((key, window_seconds, window - 1), 0) * weight + current
+            if estimate >= limit:
+                return False, estimate
+
+            if not current:
+                slot = (window_seconds, window)
+                if slot not in self._wheel:
+                    self._windows[window_seconds].append(window)
+                self._wheel[slot].add(key)
+            self._counts[(key, window_seconds, window)] = current + 1
+            return True, estimate + 1
+
+    def _expire(self, window_seconds: int, window: int):
+        """Purge les cases antérieures à la fenêtre précédente (coût amorti O(1) par clé)"""
+        windows = self._windows[window_seconds]
+        while windows and windows[0] < window - 1:
+            expired = windows.popleft()
+            for key in self._wheel.pop((window_seconds, expired), ()):
+                del self._counts[(key, window_seconds, expired)]
+
+    def size(self) -> int:
+        return len(self._counts)
+
+
+# KEYS[1] = fenêtre courante, KEYS[2] = fenêtre précédente
+# ARGV[1] = poids de la précédente, ARGV[2] = limite, ARGV[3] = TTL (ms)
+SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimate = previous * tonumber(ARGV[1]) + current
+if estimate >= tonumber(ARGV[2]) then
+    return {0, tostring(estimate)}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[3])
+end
+return {1, tostring(estimate + 1)}
+"""
+
+
+class RedisRateLimitBackend:
+    """Compteurs partagés entre workers (script Lua atomique)"""
+
+    def __init__(self, client, prefix: str = 'ratelimit'):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def hit(self, key: str, limit: int, window_seconds: int, now: float) -> Tuple[bool, float]:
+        window = int(now // window_seconds)
+        weight = 1.0 - (now % window_seconds) / window_seconds
+        base = f"{self.prefix}:{window_seconds}:{key}"
+        allowed, estimate = self._script(
+            keys=[f"{base}:{window}", f"{base}:{window - 1}"],
+            args=[weight, limit, window_seconds * 2000]
+        )
+        return bool(int(allowed)), float(estimate)
+
+    def size(self) -> int:
+        return -1  # Non suivi localement (compteurs dans Redis)
+
+
+class RateLimiter:
+    """Limites par route + backend de compteurs"""
+
+    def __init__(self, default: RateLimit, route_limits: Optional[Dict[str, RateLimit]] = None,
+                 backend=None):
+        self.default = default
+        self.backend = backend or MemoryRateLimitBackend()
+        # Plus long préfixe d'abord
+        self._routes: List[Tuple[str, RateLimit]] = sorted(
+            (route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def rule_for(self, path: str) -> Tuple[str, RateLimit]:
+        """Règle applicable à un chemin (nom de règle, limite)"""
+        for prefix, limit in self._routes:
+            if path.startswith(prefix):
+                return prefix, limit
+        return '*', self.default
+
+    def check(self, client: str, path: str, now: Optional[float] = None) -> RateDecision:
+        """Vérifie et comptabilise une requête (échec backend → requête autorisée)"""
+        rule, limit = self.rule_for(path)
+        now = time.time() if now is None else now
+        try:
+            allowed, estimate = self.backend.hit(f"{rule}:{client}", limit.limit, limit.window_seconds, now)
+        except Exception as e:
+            logger.error(f"❌ Rate limit backend error (failing open): {e}")
+            return RateDecision(True, limit.limit, limit.limit, 0)
+
+        remaining = max(0, limit.limit - math.ceil(estimate))
+        retry_after = 0 if allowed else limit.window_seconds - int(now % limit.window_seconds)
+        return RateDecision(allowed, limit.limit, remaining, retry_after)
+
+    def get_stats(self) -> Dict:
+        return {
+            'backend': type(self.backend).__name__,
+            'tracked_counters': self.backend.size(),
+            'default': f"{self.default.limit}/{self.default.window_seconds}s",
+            'routes': {prefix: f"{limit.limit}/{limit.window_seconds}s" for prefix, limit in self._routes}
+        }
+
+
+def create_rate_limit_backend(app=None):
+    """Backend selon RATE_LIMIT_BACKEND ('redis' = partagé entre workers, défaut: mémoire)"""
+    if os.environ.get('RATE_LIMIT_BACKEND', '').lower() == 'redis':
+        import redis
+        config = app.config if app is not None else {}
+        client = redis.Redis(
+            host=config.get('REDIS_HOST', 'localhost'),
+            port=config.get('REDIS_PORT', 6379),
+            decode_responses=True
+        )
+        logger.info("🚦 Rate limiting backend: redis")
+        return RedisRateLimitBackend(client)
+    return MemoryRateLimitBackend()
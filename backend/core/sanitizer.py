@@ -0,0 +1,120 @@
+"""
+🧼 SANITIZER - NETTOYAGE DES ENTRÉES EN UNE PASSE
+=================================================
+Moteur de sanitization partagé (SecurityMiddleware.sanitize_input, routes):
+
+- Un seul pattern combiné, compilé au démarrage
+  (<script>…</script> | javascript: | onXxx= | <balise>)
+- Pré-vérification rapide: une chaîne sans '<', ':' ni '=' ne peut pas
+  matcher → seul .strip() est appliqué
+- Sortie sans aucun motif résiduel (repasse si un retrait en a formé un)
+- Conteneurs inchangés retournés tels quels (aucune copie)
+- sanitized_json(): vue paresseuse du corps JSON, seuls les champs lus
+  par la route sont nettoyés (une fois, mémorisés)
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+from flask import g, request
+
+DANGEROUS_PATTERN = re.compile(
+    r'<script.*?</script>|javascript:|on\w+\s*=|<.*?>',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+class InputSanitizer:
+    """Sanitization récursive sans copie des valeurs déjà propres"""
+
+    def __init__(self, pattern: re.Pattern = DANGEROUS_PATTERN):
+        self._sub = pattern.sub
+
+    def clean_str(self, value: str) -> str:
+        if '<' in value or ':' in value or '=' in value:
+            # Repasse seulement si un retrait a pu former un nouveau motif ("<scr<b>ipt>")
+            cleaned = self._sub('', value)
+            while cleaned != value:
+                value, cleaned = cleaned, self._sub('', cleaned)
+        return value.strip()
+
+    def sanitize(self, data: Any) -> Any:
+        """Retourne `data` lui-même si rien n'a changé, une copie nettoyée sinon"""
+        if isinstance(data, str):
+            return self.clean_str(data)
+        if isinstance(data, dict):
+            return self._sanitize_dict(data)
+        if isinstance(data, list):
+            return self._sanitize_list(data)
+        return data
+
+    def _sanitize_dict(self, data: Dict) -> Dict:
+        cleaned = None
+        for key, value in data.items():
+            new_value = self.sanitize(value)
+            if new_value is not value:
+                if cleaned is None:
+                    cleaned = dict(data)
+                cleaned[key] = new_value
+        return data if cleaned is None else cleaned
+
+    def _sanitize_list(self, data: list) -> list:
+        cleaned = None
+        for index, item in enumerate(data):
+            new_item = self.sanitize(item)
+            if new_item is not item:
+                if cleaned is None:
+                    cleaned = list(data)
+                cleaned[index] = new_item
+        return data if cleaned is None else cleaned
+
+
+class LazySanitizedJSON(Mapping):
+    """Vue lecture seule d'un objet JSON: chaque champ est nettoyé au premier accès"""
+
+    __slots__ = ('_raw', '_sanitizer', '_cleaned')
+
+    def __init__(self, raw: Dict, sanitizer: InputSanitizer):
+        self._raw = raw
+        self._sanitizer = sanitizer
+        self._cleaned: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cleaned[key]
+        except KeyError:
+            value = self._cleaned[key] = self._sanitizer.sanitize(self._raw[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, key) -> bool:
+        return key in self._raw
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def to_dict(self) -> Dict:
+        """Matérialise tous les champs (ex: payload transmis tel quel à un algorithme)"""
+        return {key: self[key] for key in self._raw}
+
+
+# Instance globale du moteur
+input_sanitizer = InputSanitizer()
+
+
+def sanitized_json():
+    """Corps JSON de la requête en vue paresseuse (None si absent ou pas un objet)
+
+    Les valeurs non-objet (liste, scalaire) sont nettoyées directement.
+    """
+    if 'sanitized_json' not in g:
+        data = request.get_json(silent=True)
+        g.sanitized_json = LazySanitizedJSON(data, input_sanitizer) if isinstance(data, dict) \
+            else input_sanitizer.sanitize(data)
+    return g.sanitized_json
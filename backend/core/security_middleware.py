@@ -5,23 +5,26 @@ Middleware de sécurité pour tous les services Revolutionary Platform
 Basé sur main_revolutionary_secure.py avec améliorations
 
 Features:
-- Validation requêtes et sanitization
-- Rate limiting intelligent
+- Validation requêtes et sanitization (core.sanitizer, pattern unique précompilé)
+- Rate limiting fenêtre glissante O(1), limites par route (core.rate_limiter)
 - Session management sécurisé
 - API key management
-- Audit logs et monitoring
+- Audit logs et monitoring (flux JSON non bloquant, core.log_pipeline)
 """
 
 import os
 import logging
+import time
 import secrets
 import hashlib
-import json
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Dict, Any, Optional, List
 from flask import request, jsonify, session, g, current_app
-import re
+
+from core.log_pipeline import audit_allowed, audit_event, audit_sampler
+from core.rate_limiter import RateLimiter, RateLimit, MemoryRateLimitBackend, create_rate_limit_backend, parse_limit
+from core.sanitizer import input_sanitizer
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -41,6 +44,14 @@ class SecurityMiddleware:
             'require_https': True,
             'audit_logs_enabled': True,
             'rate_limiting_enabled': True,
+            'route_rate_limits': {},  # {'/api/calculate': '60/minute', ...}
+            'exempt_paths': [],  # Sondes (/livez, /readyz...): ni rate limiting ni exigence HTTPS
+            'audit_sample_rates': {},  # {'slow_request': 0.1, ...}
+            'audit_max_per_minute': {  # Plafonds des événements déclenchables en rafale
+                'rate_limit_exceeded': 60,
+                'blocked_ip_access': 60,
+                'non_whitelisted_access': 60
+            },
             'ip_whitelist': [],
             'blocked_ips': []
         }
@@ -48,9 +59,10 @@ class SecurityMiddleware:
         # Merge config
         self.config = {**self.default_config, **self.config}
 
-        # Cache pour rate limiting
-        self.request_counts = {}
+        # Rate limiting (backend mémoire jusqu'à init_app)
+        self.rate_limiter = self._build_rate_limiter(MemoryRateLimitBackend())
         self.blocked_ips_cache = set(self.config.get('blocked_ips', []))
+        self.exempt_paths = frozenset(self.config.get('exempt_paths', []))
 
         if app:
             self.init_app(app)
@@ -60,6 +72,9 @@ class SecurityMiddleware:
     def init_app(self, app):
         """Initialise le middleware avec l'app Flask"""
         self.app = app
+        self.rate_limiter = self._build_rate_limiter(create_rate_limit_backend(app))
+        audit_sampler.sample_rates = dict(self.config.get('audit_sample_rates', {}))
+        audit_sampler.max_per_minute = dict(self.config.get('audit_max_per_minute', {}))
 
         # Middleware pré-requête
         app.before_request(self.before_request)
@@ -122,62 +137,35 @@ class SecurityMiddleware:
         whitelist = self.config.get('ip_whitelist', [])
         return ip in whitelist if whitelist else True
 
+    def _build_rate_limiter(self, backend) -> RateLimiter:
+        """Limite par défaut (max_requests_per_hour) + limites par préfixe de route"""
+        route_limits = {
+            prefix: limit if isinstance(limit, RateLimit) else parse_limit(limit)
+            for prefix, limit in self.config.get('route_rate_limits', {}).items()
+        }
+        default = RateLimit(self.config.get('max_requests_per_hour', 1000), 3600)
+        return RateLimiter(default, route_limits, backend)
+
     def check_rate_limit(self, ip: str) -> bool:
-        """Vérifie les limites de taux de requêtes"""
+        """Vérifie les limites de taux de requêtes (fenêtre glissante, O(1))"""
         if not self.config.get('rate_limiting_enabled', True):
             return True
 
-        now = datetime.now()
-        hour_key = now.strftime('%Y-%m-%d-%H')
-        ip_key = f"{ip}:{hour_key}"
-
-        # Nettoyer les anciennes entrées
-        keys_to_remove = []
-        for key in self.request_counts:
-            if not key.endswith(hour_key):
-                keys_to_remove.append(key)
-
-        for key in keys_to_remove:
-            del self.request_counts[key]
+        decision = self.rate_limiter.check(ip, request.path)
+        g.rate_limit = decision
 
-        # Vérifier limite actuelle
-        current_count = self.request_counts.get(ip_key, 0)
-        max_requests = self.config.get('max_requests_per_hour', 1000)
-
-        if current_count >= max_requests:
-            logger.warning(f"🚫 Rate limit exceeded for IP: {self.hash_ip_address(ip)}")
+        if not decision.allowed:
+            logger.warning(f"🚫 Rate limit exceeded for IP: {self.hash_ip_address(ip)} on {request.path}")
             return False
-
-        # Incrémenter compteur
-        self.request_counts[ip_key] = current_count + 1
         return True
 
     def sanitize_input(self, data: Any) -> Any:
-        """Sanitise les données d'entrée"""
-        if isinstance(data, dict):
-            return {key: self.sanitize_input(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self.sanitize_input(item) for item in data]
-        elif isinstance(data, str):
-            # Nettoyer les caractères dangereux
-            dangerous_patterns = [
-                r'<script.*?</script>',
-                r'javascript:',
-                r'on\w+\s*=',
-                r'<.*?>'
-            ]
-
-            cleaned = data
-            for pattern in dangerous_patterns:
-                cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.DOTALL)
-
-            return cleaned.strip()
-
-        return data
+        """Sanitise les données d'entrée (moteur une passe, sans copie si inchangé)"""
+        return input_sanitizer.sanitize(data)
 
     def audit_log(self, event: str, details: Dict = None):
-        """Enregistre un événement d'audit"""
-        if not self.config.get('audit_logs_enabled', True):
+        """Enregistre un événement d'audit (flux JSON séparé, échantillonné par type)"""
+        if not self.config.get('audit_logs_enabled', True) or not audit_allowed(event):
             return
 
         audit_entry = {
@@ -190,7 +178,7 @@ class SecurityMiddleware:
             'details': details or {}
         }
 
-        logger.info(f"🔍 AUDIT: {json.dumps(audit_entry)}")
+        audit_event(event, audit_entry)
 
     def before_request(self):
         """Middleware exécuté avant chaque requête"""
@@ -206,10 +194,22 @@ class SecurityMiddleware:
             self.audit_log('non_whitelisted_access', {'ip_hash': self.hash_ip_address(client_ip)})
             return jsonify({'error': 'Access denied'}), 403
 
+        # Sondes du load balancer (HTTP direct sur le worker, plusieurs par seconde):
+        # ni quota par IP (429 → nœud marqué down), ni aller-retour Redis, ni HTTPS
+        if request.path in self.exempt_paths:
+            g.client_ip = client_ip
+            g.request_start_time = time.perf_counter_ns()
+            return None
+
         # Vérifier rate limiting
         if not self.check_rate_limit(client_ip):
             self.audit_log('rate_limit_exceeded', {'ip_hash': self.hash_ip_address(client_ip)})
-            return jsonify({'error': 'Rate limit exceeded'}), 429
+            decision = g.rate_limit
+            return jsonify({'error': 'Rate limit exceeded'}), 429, {
+                'Retry-After': str(decision.retry_after),
+                'X-RateLimit-Limit': str(decision.limit),
+                'X-RateLimit-Remaining': '0'
+            }
 
         # HTTPS required en production
         if self.config.get('require_https', True) and not request.is_secure and request.headers.get('X-Forwarded-Proto') != 'https':
@@ -218,7 +218,7 @@ class SecurityMiddleware:
 
         # Stocker l'IP dans le contexte
         g.client_ip = client_ip
-        g.request_start_time = datetime.now()
+        g.request_start_time = time.perf_counter_ns()  # Base des métriques de latence (core.metrics)
 
     def after_request(self, response):
         """Middleware exécuté après chaque requête"""
@@ -231,9 +231,15 @@ class SecurityMiddleware:
         # CSP basique
         response.headers['Content-Security-Policy'] = "default-src 'self'; script-src 'self' 'unsafe-inline'"
 
+        # Quota restant (requêtes comptabilisées)
+        decision = g.get('rate_limit')
+        if decision is not None and decision.allowed:
+            response.headers['X-RateLimit-Limit'] = str(decision.limit)
+            response.headers['X-RateLimit-Remaining'] = str(decision.remaining)
+
         # Log de la requête si audit activé
         if hasattr(g, 'request_start_time'):
-            duration = (datetime.now() - g.request_start_time).total_seconds()
+            duration = (time.perf_counter_ns() - g.request_start_time) / 1e9
 
             if duration > 5.0:  # Log requêtes lentes
                 self.audit_log('slow_request', {
@@ -283,7 +289,9 @@ class SecurityMiddleware:
         """Retourne les statistiques de sécurité"""
         return {
             'blocked_ips_count': len(self.blocked_ips_cache),
-            'active_rate_limits': len(self.request_counts),
+            'active_rate_limits': self.rate_limiter.backend.size(),
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'audit_suppressed': dict(audit_sampler.suppressed),
             'config': {
                 'rate_limiting_enabled': self.config.get('rate_limiting_enabled'),
                 'audit_logs_enabled': self.config.get('audit_logs_enabled'),
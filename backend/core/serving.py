@@ -0,0 +1,149 @@
+"""
+🚀 SERVING - MODE MULTI-PROCESS (GUNICORN / UWSGI) AVEC PRÉCHARGEMENT
+=====================================================================
+Cycle de vie d'un déploiement master + workers forkés (wsgi.py,
+gunicorn.conf.py):
+
+- Préchargement (master, avant le fork): chaque étape enregistrée par
+  create_app() charge ses datasets (pays, DataLoader...), puis gc.freeze()
+  place tous les objets survivants dans la génération permanente. Le GC des
+  workers ne les parcourt plus: leurs pages restent partagées copy-on-write
+  au lieu d'être recopiées dans chaque worker à la première collecte.
+- Après fork (worker): pools Redis vidés (les sockets du master ne sont
+  jamais réutilisées), hooks relancés (threads de santé, métriques, logs).
+  Déclenché par os.register_at_fork (gunicorn) ou uwsgi.post_fork_hook.
+- Rechargement gracieux (SIGHUP gunicorn, hook on_reload du master):
+  dégel, étapes rejouées (datasets modifiés sur disque reconstruits), gel;
+  les nouveaux workers sont forkés depuis l'état rafraîchi.
+
+Les compteurs de références des objets lus restent écrits par CPython:
+le partage porte surtout sur les gros datasets rarement touchés en entier.
+"""
+
+import gc
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ServingLifecycle:
+    """Étapes de préchargement et hooks post-fork de l'application servie"""
+
+    def __init__(self):
+        self._preload_steps: List[Tuple[str, Callable[[], Any]]] = []
+        self._post_fork_hooks: List[Tuple[str, Callable[[], Any]]] = []
+        self._redis_clients: List[Any] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.preloaded = False
+        self.last_preload: Dict[str, Any] = {}
+        self.reloads = 0
+
+    def reset(self):
+        """Nouvelle application: étapes et hooks de la précédente oubliés"""
+        with self._lock:
+            self._preload_steps = []
+            self._post_fork_hooks = []
+            self._redis_clients = []
+            self.preloaded = False
+            self.last_preload = {}
+
+    # --- Enregistrement -------------------------------------------------------
+
+    def add_preload_step(self, name: str, step: Callable[[], Any]):
+        """step() charge un dataset; rejouée au rechargement, doit être idempotente"""
+        self._preload_steps.append((name, step))
+
+    def add_post_fork_hook(self, name: str, hook: Callable[[], Any]):
+        """hook() exécuté une fois dans chaque worker, juste après le fork"""
+        self._post_fork_hooks.append((name, hook))
+
+    def track_redis(self, *clients):
+        """Clients dont le pool de connexions est vidé après fork (autres objets ignorés)"""
+        for client in clients:
+            if hasattr(getattr(client, 'connection_pool', None), 'reset') and client not in self._redis_clients:
+                self._redis_clients.append(client)
+
+    # --- Master -----------------------------------------------------------------
+
+    def preload(self) -> Dict[str, Any]:
+        """Exécute toutes les étapes puis gèle le tas (à appeler avant le fork)"""
+        started = time.perf_counter()
+        steps = {}
+        for name, step in self._preload_steps:
+            step_started = time.perf_counter()
+            try:
+                step()
+                steps[name] = round((time.perf_counter() - step_started) * 1000, 1)
+            except Exception as e:
+                logger.error(f"❌ Preload step {name} failed: {e}")
+                steps[name] = 'error'
+
+        gc.collect()
+        gc.freeze()
+        self.preloaded = True
+        self.last_preload = {
+            'at': datetime.now().isoformat(),
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+            'steps_ms': steps,
+            'frozen_objects': gc.get_freeze_count()
+        }
+        logger.info(f"🧊 Preload done in {self.last_preload['duration_ms']}ms, "
+                    f"{self.last_preload['frozen_objects']} objects frozen: {steps}")
+        return self.last_preload
+
+    def reload(self) -> Dict[str, Any]:
+        """Rechargement gracieux: dégèle, rejoue le préchargement, regèle"""
+        gc.unfreeze()  # Anciennes versions des datasets de nouveau collectables
+        self.reloads += 1
+        logger.warning(f"🔄 Graceful reload #{self.reloads}: re-running preload")
+        return self.preload()
+
+    # --- Worker -----------------------------------------------------------------
+
+    def post_fork(self):
+        """Réinitialise l'état hérité du master (idempotent par process)"""
+        pid = os.getpid()
+        if pid == self._pid:
+            return
+        self._pid = pid
+
+        for client in self._redis_clients:
+            try:
+                client.connection_pool.reset()
+            except Exception as e:
+                logger.error(f"❌ Redis pool reset failed after fork: {e}")
+        for name, hook in self._post_fork_hooks:
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"❌ Post-fork hook {name} failed: {e}")
+        logger.info(f"👷 Worker {pid} ready ({len(self._redis_clients)} Redis pools reset)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'preloaded': self.preloaded,
+            'reloads': self.reloads,
+            'last_preload': self.last_preload,
+            'preload_steps': [name for name, _ in self._preload_steps],
+            'post_fork_hooks': [name for name, _ in self._post_fork_hooks],
+            'redis_pools': len(self._redis_clients)
+        }
+
+
+# Instance globale (hooks de fork enregistrés une seule fois par process)
+serving = ServingLifecycle()
+os.register_at_fork(after_in_child=serving.post_fork)
+
+
+def init_serving(app) -> ServingLifecycle:
+    """Cycle de vie lié à l'application (create_app y enregistre étapes et hooks)"""
+    serving.reset()
+    app.extensions['serving'] = serving
+    return serving
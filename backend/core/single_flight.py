@@ -0,0 +1,191 @@
+"""
+🛬 SINGLE FLIGHT - COALESCENCE DES ANALYSES IDENTIQUES
+======================================================
+Requêtes concurrentes identiques (lien partagé, retries agressifs):
+une seule exécution, résultat partagé par toutes les requêtes en attente.
+
+Deux niveaux:
+- Threads d'un même worker: le premier appel (leader) calcule, les suivants
+  attendent son résultat (ou son exception)
+- Entre workers (optionnel): verrou `SET NX PX` dans un store compatible
+  Redis; le worker qui obtient le verrou publie le résultat JSON avec un TTL
+  court, les autres l'interrogent jusqu'à publication. Si le leader échoue
+  (verrou libéré sans résultat) ou tarde trop, le worker calcule lui-même.
+
+LocalFlightStore reproduit le sous-ensemble Redis utilisé (set nx/px, get,
+delete) en mémoire: stand-in pour les tests et le développement.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LOCK_TTL_MS = 30_000        # Durée max d'un calcul leader inter-workers
+RESULT_TTL_MS = 5_000       # Durée de vie du résultat publié pour les autres workers
+POLL_INTERVAL_SECONDS = 0.05
+WAIT_TIMEOUT_SECONDS = 30.0
+
+
+def canonical_key(namespace: str, *parts: Any) -> str:
+    """Clé canonique: même contenu (ordre des clés indifférent) → même clé"""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class LocalFlightStore:
+    """Store mémoire avec l'API Redis utilisée par SingleFlight (set nx/px, get, delete)"""
+
+    def __init__(self):
+        self._values: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, name: str) -> Optional[tuple]:
+        entry = self._values.get(name)
+        if entry and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._values[name]
+            return None
+        return entry
+
+    def set(self, name: str, value: str, nx: bool = False, px: Optional[int] = None) -> bool:
+        with self._lock:
+            if nx and self._live(name):
+                return False
+            expires = time.monotonic() + px / 1000 if px else None
+            self._values[name] = (value, expires)
+            return True
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            entry = self._live(name)
+            return entry[0] if entry else None
+
+    def delete(self, name: str) -> int:
+        with self._lock:
+            return 1 if self._values.pop(name, None) else 0
+
+
+class _Call:
+    """Calcul en cours dans ce worker"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalescence par clé: threads du worker + (optionnel) workers via un store partagé"""
+
+    def __init__(self, store=None, lock_ttl_ms: int = LOCK_TTL_MS, result_ttl_ms: int = RESULT_TTL_MS,
+                 wait_timeout: float = WAIT_TIMEOUT_SECONDS):
+        self.store = store
+        self.lock_ttl_ms = lock_ttl_ms
+        self.result_ttl_ms = result_ttl_ms
+        self.wait_timeout = wait_timeout
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {'executions': 0, 'coalesced': 0, 'remote_hits': 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Exécute fn une seule fois pour tous les appels concurrents de même clé"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            if not call.done.wait(self.wait_timeout):
+                raise TimeoutError(f"Single-flight wait timed out for {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._execute(key, fn)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+            if call.waiters:
+                logger.info(f"🛬 Single-flight shared {key[:40]} with {call.waiters} waiting requests")
+
+    def _execute(self, key: str, fn: Callable[[], Any]) -> Any:
+        if self.store is None:
+            return self._run(fn)
+
+        lock_key, result_key = f"singleflight:lock:{key}", f"singleflight:result:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            published = self.store.get(result_key)
+            if published is not None:
+                with self._lock:
+                    self._stats['remote_hits'] += 1
+                return json.loads(published)
+
+            if self.store.set(lock_key, token, nx=True, px=self.lock_ttl_ms):
+                try:
+                    result = self._run(fn)
+                    self.store.set(result_key, json.dumps(result, default=str), px=self.result_ttl_ms)
+                    return result
+                finally:
+                    if self.store.get(lock_key) == token:
+                        self.store.delete(lock_key)
+
+            if time.monotonic() >= deadline:
+                logger.warning(f"⏱️ Single-flight leader too slow for {key[:40]}, computing locally")
+                return self._run(fn)
+            time.sleep(POLL_INTERVAL_SECONDS)
+
+    def _run(self, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._stats['executions'] += 1
+        return fn()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls)}
+
+
+# Instance partagée par les endpoints d'analyse (store configuré par init_single_flight)
+analysis_flight = SingleFlight()
+
+
+def init_single_flight(app) -> SingleFlight:
+    """
+    Active la coalescence inter-workers si SINGLE_FLIGHT_BACKEND vaut 'redis'
+    ('local' = store mémoire, utile en test; défaut: threads du worker seulement)
+    """
+    backend = os.environ.get('SINGLE_FLIGHT_BACKEND', '').lower()
+
+    if backend == 'redis':
+        import redis
+        analysis_flight.store = redis.Redis(
+            host=app.config.get('REDIS_HOST', 'localhost'),
+            port=app.config.get('REDIS_PORT', 6379),
+            decode_responses=True
+        )
+    elif backend == 'local':
+        analysis_flight.store = LocalFlightStore()
+
+    logger.info(f"🛬 Single-flight ready (backend: {backend or 'threads'})")
+    return analysis_flight
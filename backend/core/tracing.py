@@ -0,0 +1,213 @@
+"""
+⏱️ TRACING - DURÉE PAR ÉTAPE DES PIPELINES DE RECOMMANDATION
+============================================================
+Spans légers pour savoir quelle étape rend une requête lente (profil,
+préfiltres, scoring, bonus, tri, explications...).
+
+- span('expat.sorting') (context manager) et @traced('usa.scoring') (décorateur)
+- Sans trace active: une lecture de ContextVar, aucun chronométrage
+- Trace activée par requête: en-tête X-Debug-Timings, ou échantillonnage
+  (TRACE_SAMPLE_RATE, ex: 0.01)
+- Requête tracée: bloc `timings` ajouté aux réponses JSON + en-tête
+  Server-Timing, et chaque étape alimente l'histogramme
+  pipeline_stage_duration du registre de métriques
+- trace_stages(): instrumente les étapes d'une classe d'algorithme d'après
+  des règles de nommage (algorithmes résidents chargés par le registre pays)
+- PhaseTimer: phases successives du démarrage (create_app), hors requête
+
+Les durées sont inclusives et cumulées par nom d'étape (une étape appelée
+pour chaque ville apparaît une fois, avec son nombre d'appels).
+"""
+
+import inspect
+import json
+import logging
+import os
+import random
+import re
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEBUG_HEADER = 'X-Debug-Timings'
+
+_current_trace: ContextVar[Optional['Trace']] = ContextVar('current_trace', default=None)
+
+
+class Trace:
+    """Durées cumulées par étape pour une requête"""
+
+    __slots__ = ('started_ns', 'stages')
+
+    def __init__(self):
+        self.started_ns = time.perf_counter_ns()
+        self.stages: Dict[str, list] = {}  # nom → [durée ns, appels]
+
+    def add(self, name: str, duration_ns: int):
+        entry = self.stages.get(name)
+        if entry is None:
+            self.stages[name] = [duration_ns, 1]
+        else:
+            entry[0] += duration_ns
+            entry[1] += 1
+
+    def as_dict(self) -> Dict:
+        return {
+            'total_ms': round((time.perf_counter_ns() - self.started_ns) / 1e6, 3),
+            'stages': {
+                name: {'ms': round(duration_ns / 1e6, 3), 'calls': calls}
+                for name, (duration_ns, calls) in self.stages.items()
+            }
+        }
+
+
+class _Span:
+    __slots__ = ('trace', 'name', 'started_ns')
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self):
+        self.started_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.add(self.name, time.perf_counter_ns() - self.started_ns)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class PhaseTimer:
+    """Durées de phases consécutives hors requête (ex: create_app), même format que Trace"""
+
+    def __init__(self):
+        self.trace = Trace()
+        self._last_ns = self.trace.started_ns
+
+    def mark(self, name: str):
+        """Clôt la phase `name`: temps écoulé depuis la marque précédente"""
+        now = time.perf_counter_ns()
+        self.trace.add(name, now - self._last_ns)
+        self._last_ns = now
+
+    def as_dict(self) -> Dict:
+        return self.trace.as_dict()
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def span(name: str):
+    """Chronomètre un bloc si une trace est active (no-op sinon)"""
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP_SPAN
+    return _Span(trace, name)
+
+
+def traced(name: str) -> Callable:
+    """Décorateur: chronomètre chaque appel sous l'étape `name`"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            started_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                trace.add(name, time.perf_counter_ns() - started_ns)
+        wrapper.__traced_stage__ = name
+        return wrapper
+    return decorator
+
+
+# Étapes des algorithmes résidents, d'après le nommage de leurs méthodes
+RESIDENTS_STAGE_RULES: Sequence[Tuple[str, str]] = (
+    ('profile', r'create_user_profile'),
+    ('weights', r'(adapt|adjust)_(weights|criteria)'),
+    ('prefilters', r'apply_\w*(filters|deal_breakers)'),
+    ('scoring', r'(calculate_city_score|score_city)'),
+    ('bonuses', r'apply_\w*bonuses'),
+    ('explanations', r'(generate_\w*(reason|explanation|insights)|_generate_reasons|get_city_(strengths|concerns)|get_top_criteria)'),
+)
+
+
+def trace_stages(cls: type, prefix: str, rules: Sequence[Tuple[str, str]] = RESIDENTS_STAGE_RULES) -> int:
+    """Enveloppe les méthodes de `cls` dont le nom correspond à une règle → nb de méthodes"""
+    compiled = [(stage, re.compile(pattern)) for stage, pattern in rules]
+    instrumented = 0
+    for attr, value in list(vars(cls).items()):
+        if not inspect.isfunction(value) or hasattr(value, '__traced_stage__'):
+            continue
+        for stage, pattern in compiled:
+            if pattern.match(attr):
+                setattr(cls, attr, traced(f"{prefix}.{stage}")(value))
+                instrumented += 1
+                break
+    return instrumented
+
+
+def _server_timing(trace: Trace) -> str:
+    return ', '.join(
+        f"{re.sub(r'[^A-Za-z0-9_-]', '-', name)};dur={duration_ns / 1e6:.3f}"
+        for name, (duration_ns, _) in trace.stages.items()
+    )
+
+
+def init_tracing(app, sample_rate: Optional[float] = None):
+    """Active les traces par requête (en-tête de debug ou TRACE_SAMPLE_RATE)"""
+    from flask import request
+
+    if sample_rate is None:
+        sample_rate = float(os.environ.get('TRACE_SAMPLE_RATE', 0))
+
+    @app.before_request
+    def start_trace():
+        if request.headers.get(DEBUG_HEADER) or (sample_rate and random.random() < sample_rate):
+            _current_trace.set(Trace())
+
+    @app.after_request
+    def attach_timings(response):
+        trace = _current_trace.get()
+        if trace is None:
+            return response
+
+        for name, (duration_ns, _) in trace.stages.items():
+            metrics.observe('pipeline_stage_duration', duration_ns, stage=name)
+
+        if trace.stages:
+            response.headers['Server-Timing'] = _server_timing(trace)
+        # Corps pré-sérialisés avec ETag (snapshots) laissés intacts: Server-Timing seul
+        if response.is_json and not response.is_streamed and 'ETag' not in response.headers:
+            payload = response.get_json(silent=True)
+            if isinstance(payload, dict):
+                payload['timings'] = trace.as_dict()
+                response.set_data(json.dumps(payload, ensure_ascii=False, default=str))
+        return response
+
+    @app.teardown_request
+    def end_trace(exc):
+        _current_trace.set(None)
+
+    logger.info(f"⏱️ Stage tracing ready (header {DEBUG_HEADER}, sample rate {sample_rate})")
@@ -0,0 +1,56 @@
+"""
+🦄 GUNICORN - CONFIGURATION PRODUCTION
+======================================
+    cd backend && gunicorn -c gunicorn.conf.py wsgi:app
+
+- preload_app: datasets chargés une fois dans le master, partagés
+  copy-on-write par les workers (core.serving)
+- Un worker par cœur (WEB_CONCURRENCY), quelques threads chacun pour les
+  réponses streamées et les attentes Redis / SendGrid (GUNICORN_THREADS)
+- kill -HUP <master>: rechargement gracieux, préchargement rejoué dans le
+  master avant de forker les nouveaux workers (datasets modifiés pris en compte)
+- Métriques agrégées entre workers (METRICS_DIR, lu à l'import de l'application)
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', f"0.0.0.0:{os.environ.get('PORT', 8000)}")
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+preload_app = True
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Recyclage des workers (fuites mémoire), décalé pour ne pas tous redémarrer ensemble
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 10000))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG')  # Désactivé par défaut (logs applicatifs suffisants)
+errorlog = '-'
+
+os.environ.setdefault('METRICS_DIR', os.path.join('/tmp', 'zineinsight-metrics'))
+
+
+def on_starting(server):
+    """Nouveau déploiement: snapshots de métriques des workers précédents retirés"""
+    metrics_dir = os.environ['METRICS_DIR']
+    if os.path.isdir(metrics_dir):
+        for file_name in os.listdir(metrics_dir):
+            if file_name.startswith('metrics-') and file_name.endswith('.json'):
+                os.remove(os.path.join(metrics_dir, file_name))
+
+
+def on_reload(server):
+    """SIGHUP (master): datasets rechargés avant le fork des nouveaux workers"""
+    from core.serving import serving
+    serving.reload()
+
+
+def post_fork(server, worker):
+    """Déjà fait par os.register_at_fork; garde-fou idempotent"""
+    from core.serving import serving
+    serving.post_fork()
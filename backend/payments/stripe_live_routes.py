@@ -30,9 +30,7 @@ STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY', 'sk_live_...')
 STRIPE_WEBHOOK_SECRET = os.environ.get('STRIPE_WEBHOOK_SECRET', 'whsec_...')
 STRIPE_MODE = os.environ.get('STRIPE_MODE', 'live')
 
-print(f"🔑 Stripe Mode: {STRIPE_MODE}")
-print(f"🔑 Stripe Public Key: {STRIPE_PUBLIC_KEY[:20]}...")
-print(f"🔑 Stripe Secret Key: {STRIPE_SECRET_KEY[:20]}...")
+logger.info(f"🔑 Stripe mode: {STRIPE_MODE} (public key {STRIPE_PUBLIC_KEY[:12]}...)")
 
 # Configuration des prix (en centimes)
 PAYWALL_PRICES = {
@@ -5,6 +5,9 @@ Modules de services spécialisés:
 - ZScore: Intelligence géographique et lifestyle
 - SkillGraph: Intelligence carrière et compétences
 - Wealth: Intelligence financière et patrimoniale
+- Cities: Recherche villes multi-pays (autocomplete)
+- Analyze: Profil complet multi-services streamé (NDJSON)
+- Residents: Relocation domestique par pays (routes génériques)
 """
 
 # Services disponibles
@@ -26,6 +29,29 @@ __services__ = {
         "description": "Gestion patrimoine et optimisation financière",
         "version": "0.9.0",
         "endpoints": ["/api/wealth", "/api/portfolio", "/api/tax"]
+    },
+    "cities": {
+        "name": "City Search",
+        "description": "Autocomplete villes tous pays, insensible aux accents et aux fautes",
+        "version": "1.0.0",
+        "endpoints": ["/api/cities/search", "/api/cities/search/stats"]
+    },
+    "analyze": {
+        "name": "Full Profile Stream",
+        "description": "ZScore + SkillGraph + Wealth en parallèle, résultats streamés en NDJSON",
+        "version": "1.0.0",
+        "endpoints": ["/api/analyze/stream"]
+    },
+    "residents": {
+        "name": "Residents Relocation",
+        "description": "Relocation domestique par pays, /cities et /criteria pré-sérialisés (ETag)",
+        "version": "1.0.0",
+        "endpoints": [
+            "/api/<country>-residents/recommendations",
+            "/api/<country>-residents/health",
+            "/api/<country>-residents/cities",
+            "/api/<country>-residents/criteria"
+        ]
     }
 }
 
@@ -0,0 +1,22 @@
+"""
+⚡ ANALYZE SERVICE - PROFIL COMPLET EN STREAMING
+================================================
+Orchestration des services ZScore, SkillGraph et Wealth pour un profil complet
+Résultats streamés en NDJSON dès qu'ils sont prêts (time-to-first-result réduit)
+
+Features:
+- Exécution concurrente sur pool de threads partagé
+- Un événement JSON par ligne, dans l'ordre de complétion
+- Durée par service et durée totale dans le flux
+- Timeout global et annulation des analyses non démarrées
+"""
+
+__version__ = "1.0.0"
+__service_name__ = "analyze"
+__endpoints__ = ["/api/analyze/stream"]
+
+# Imports du service Analyze
+from .runner import stream_analyses
+from .routes import analyze_bp
+
+__all__ = ['stream_analyses', 'analyze_bp']
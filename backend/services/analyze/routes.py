@@ -0,0 +1,98 @@
+"""
+🌐 ANALYZE ROUTES - API ENDPOINTS
+================================
+Profil complet en une requête: ZScore + SkillGraph + Wealth en parallèle,
+chaque résultat streamé en NDJSON dès qu'il est prêt.
+
+Endpoints:
+- POST /api/analyze/stream → Flux application/x-ndjson (une ligne JSON par événement)
+
+Body:
+    {
+        "services": ["zscore", "skillgraph", "wealth"],   (défaut: tous)
+        "questionnaire": {...}, "country": "france",       (partagés)
+        "zscore": {"questionnaire": {...}, "country": "world"}  (surcharge par service)
+    }
+"""
+
+import json
+import logging
+from flask import Blueprint, Response, jsonify
+from typing import Dict
+
+from core.sanitizer import sanitized_json
+from services.skillgraph.routes import run_career_analysis
+from services.wealth.routes import run_wealth_analysis
+from services.zscore.routes import run_zscore_recommendations
+from .runner import stream_analyses
+
+logger = logging.getLogger(__name__)
+
+# Blueprint Analyze
+analyze_bp = Blueprint('analyze', __name__, url_prefix='/api')
+
+
+def _run_zscore(questionnaire: Dict, country: str) -> Dict:
+    """Même format que POST /api/calculate"""
+    recommendations = run_zscore_recommendations(questionnaire, country)
+    if recommendations:
+        return {
+            'success': True,
+            'recommendations': recommendations,
+            'message': f'Top {len(recommendations)} villes trouvées'
+        }
+    return {'success': False, 'error': 'Aucune ville compatible trouvée', 'recommendations': []}
+
+
+# Service → exécution (questionnaire, pays) → résultat identique à l'endpoint dédié
+SERVICE_RUNNERS = {
+    'zscore': _run_zscore,
+    'skillgraph': run_career_analysis,
+    'wealth': run_wealth_analysis
+}
+
+
+def _ndjson(event: Dict) -> str:
+    return json.dumps(event, ensure_ascii=False, default=str) + '\n'
+
+
+@analyze_bp.route('/analyze/stream', methods=['POST'])
+def stream_profile_analysis():
+    """Analyses multi-services concurrentes, résultats streamés au fil de l'eau"""
+    try:
+        data = sanitized_json()  # Champs nettoyés à la lecture
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        services = data.get('services') or list(SERVICE_RUNNERS)
+        if not isinstance(services, list) or not all(isinstance(service, str) for service in services):
+            return jsonify({'error': "'services' must be a list of service names"}), 400
+        unknown = [service for service in services if service not in SERVICE_RUNNERS]
+        if unknown:
+            return jsonify({'error': f'Unknown services: {unknown}',
+                            'available_services': list(SERVICE_RUNNERS)}), 400
+
+        shared_questionnaire = data.get('questionnaire', data.get('responses', {}))
+        shared_country = data.get('country', 'france')
+
+        jobs = {}
+        for service in dict.fromkeys(services):
+            override = data.get(service) or {}
+            if not isinstance(override, dict):
+                return jsonify({'error': f"'{service}' must be an object"}), 400
+            questionnaire = override.get('questionnaire', shared_questionnaire)
+            if not questionnaire or not isinstance(questionnaire, dict):
+                return jsonify({'error': f'Questionnaire is required for {service}'}), 400
+            jobs[service] = {'questionnaire': questionnaire, 'country': override.get('country', shared_country)}
+
+        logger.info(f"⚡ Streaming profile analysis: {list(jobs)}")
+        events = (_ndjson(event) for event in stream_analyses(SERVICE_RUNNERS, jobs))
+
+        return Response(events, mimetype='application/x-ndjson', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # nginx: transmettre chaque ligne sans bufferiser
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Analyze stream error: {e}")
+        return jsonify({'error': 'Streaming analysis failed'}), 500
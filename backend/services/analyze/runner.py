@@ -0,0 +1,95 @@
+"""
+⚡ ANALYZE RUNNER - EXÉCUTION CONCURRENTE MULTI-SERVICES
+=======================================================
+Lance les analyses ZScore / SkillGraph / Wealth d'un profil complet sur un
+pool de threads partagé et produit chaque résultat dès qu'il est prêt.
+
+Flux produit (un dict par événement, sérialisé en NDJSON par la route):
+- {"event": "start", "services": [...]}
+- {"event": "result", "service": ..., "status": "ok"|"error", "elapsed_ms": ..., "result"|"error": ...}
+- {"event": "done", "total_ms": ..., "timings": {service: ms}}
+
+Les services sont indépendants: l'ordre des événements "result" est l'ordre
+de complétion, pas l'ordre de la requête.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS = int(os.environ.get('ANALYZE_STREAM_WORKERS', 8))
+SERVICE_TIMEOUT_SECONDS = float(os.environ.get('ANALYZE_STREAM_TIMEOUT', 30))
+
+ServiceRunner = Callable[[Dict, str], Dict]
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='analyze')
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _timed(runner: ServiceRunner, questionnaire: Dict, country: str) -> Dict:
+    """Exécute un service et mesure sa durée propre (hors attente dans le pool)"""
+    started = time.perf_counter()
+    result = runner(questionnaire, country)
+    return {'result': result, 'elapsed_ms': _elapsed_ms(started)}
+
+
+def stream_analyses(runners: Dict[str, ServiceRunner], jobs: Dict[str, Dict],
+                    timeout: float = SERVICE_TIMEOUT_SECONDS) -> Iterator[Dict[str, Any]]:
+    """
+    Soumet chaque service au pool et produit les événements au fil des complétions
+    jobs: {service: {"questionnaire": {...}, "country": "..."}}
+    """
+    started = time.perf_counter()
+    services: List[str] = list(jobs)
+    yield {'event': 'start', 'services': services}
+
+    futures = {
+        _executor.submit(_timed, runners[service], job['questionnaire'], job['country']): service
+        for service, job in jobs.items()
+    }
+    timings: Dict[str, float] = {}
+    pending = set(futures)
+
+    try:
+        deadline = started + timeout
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.perf_counter()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+
+            for future in done:
+                service = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Streamed {service} analysis failed: {e}")
+                    timings[service] = _elapsed_ms(started)
+                    yield {'event': 'result', 'service': service, 'status': 'error',
+                           'elapsed_ms': timings[service], 'error': f'{service} analysis failed'}
+                    continue
+
+                timings[service] = outcome['elapsed_ms']
+                yield {'event': 'result', 'service': service, 'status': 'ok',
+                       'elapsed_ms': outcome['elapsed_ms'], 'result': outcome['result']}
+
+        for future in pending:
+            service = futures[future]
+            future.cancel()
+            logger.warning(f"⏱️ Streamed {service} analysis timed out after {timeout}s")
+            yield {'event': 'result', 'service': service, 'status': 'error',
+                   'elapsed_ms': _elapsed_ms(started), 'error': f'{service} analysis timed out'}
+
+        yield {'event': 'done', 'total_ms': _elapsed_ms(started), 'timings': timings}
+
+    finally:
+        # Client déconnecté ou timeout: ne pas démarrer les analyses encore en file
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,22 @@
+"""
+🔎 CITIES SERVICE - RECHERCHE VILLES MULTI-PAYS
+===============================================
+Autocomplete instantané sur toutes les villes des datasets data_v2
+Index construit une fois en mémoire, interrogé à chaque frappe
+
+Features:
+- Recherche par nom, région/état/province et identifiant ville
+- Insensible aux accents (São Paulo ← "sao p")
+- Tolérance aux fautes de frappe par trigrammes
+- Filtre optionnel par pays
+"""
+
+__version__ = "1.0.0"
+__service_name__ = "cities"
+__endpoints__ = ["/api/cities/search", "/api/cities/search/stats"]
+
+# Imports du service Cities
+from .search_index import CitySearchIndex, normalize_text
+from .routes import cities_bp
+
+__all__ = ['CitySearchIndex', 'normalize_text', 'cities_bp']
@@ -0,0 +1,68 @@
+"""
+🌐 CITIES ROUTES - API ENDPOINTS
+===============================
+Routes Flask pour la recherche de villes tous pays confondus
+Appelées à chaque frappe par la barre de recherche du frontend
+
+Endpoints:
+- GET /api/cities/search?q=&limit=&country= → Autocomplete classé
+- GET /api/cities/search/stats → Statistiques de l'index
+"""
+
+import logging
+import time
+from flask import Blueprint, request, jsonify
+from .search_index import CitySearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Blueprint Cities
+cities_bp = Blueprint('cities', __name__, url_prefix='/api')
+
+# Index global construit au chargement du module
+city_search_index = CitySearchIndex()
+
+
+@cities_bp.route('/cities/search', methods=['GET'])
+def search_cities():
+    """Autocomplete villes: préfixes insensibles aux accents + fuzzy"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'success': False, 'error': 'Query parameter q is required'}), 400
+
+        limit = request.args.get('limit', 10, type=int)
+        country = request.args.get('country')
+
+        started = time.perf_counter()
+        results = city_search_index.search(query, limit=limit, country=country)
+        took_ms = (time.perf_counter() - started) * 1000
+
+        response = jsonify({
+            'success': True,
+            'query': query,
+            'country': country,
+            'results': results,
+            'count': len(results),
+            'took_ms': round(took_ms, 3)
+        })
+        response.headers['Cache-Control'] = 'public, max-age=300'
+        return response
+
+    except Exception as e:
+        logger.error(f"❌ City search error: {e}")
+        return jsonify({'success': False, 'error': 'City search failed'}), 500
+
+
+@cities_bp.route('/cities/search/stats', methods=['GET'])
+def search_index_stats():
+    """Statistiques de l'index de recherche villes"""
+    try:
+        return jsonify({
+            'success': True,
+            'stats': city_search_index.get_index_stats()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ City search stats error: {e}")
+        return jsonify({'success': False, 'error': 'Failed to get stats'}), 500
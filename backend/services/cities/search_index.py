@@ -0,0 +1,332 @@
+"""
+🔎 CITY SEARCH INDEX - AUTOCOMPLETE VILLES INSTANTANÉ
+=====================================================
+Index en mémoire construit une seule fois sur tous les fichiers data_v2
+Conçu pour être appelé à chaque frappe dans la barre de recherche
+
+Features:
+- Normalisation insensible aux accents, à la casse et à la ponctuation
+- Trie de préfixes avec TOP candidats précalculés à chaque nœud
+- Trigrammes (coefficient de Dice) pour tolérer les fautes de frappe
+- Classement: nom exact > préfixe nom > préfixe mot > région/id > fuzzy
+- Un trie par pays + un trie global (filtre pays sans perte de résultats)
+- Villes world déjà présentes dans un dataset pays (même nom normalisé, même
+  pays): seule l'entrée pays est servie hors filtre, l'entrée world reste
+  accessible avec country=world
+"""
+
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from core.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+# Niveaux de correspondance (plus petit = meilleur)
+MATCH_EXACT = 0
+MATCH_NAME_PREFIX = 1
+MATCH_WORD_PREFIX = 2
+MATCH_REGION_PREFIX = 3
+MATCH_FUZZY = 4
+
+MATCH_LABELS = {
+    MATCH_EXACT: 'exact',
+    MATCH_NAME_PREFIX: 'name_prefix',
+    MATCH_WORD_PREFIX: 'word_prefix',
+    MATCH_REGION_PREFIX: 'region_prefix',
+    MATCH_FUZZY: 'fuzzy'
+}
+
+MATCH_SCORES = {
+    MATCH_EXACT: 1.0,
+    MATCH_NAME_PREFIX: 0.9,
+    MATCH_WORD_PREFIX: 0.8,
+    MATCH_REGION_PREFIX: 0.6
+}
+
+# Champs région selon les datasets (USA/Australie: state, Canada: province)
+REGION_FIELDS = ('state', 'province', 'region')
+
+# Noms de pays du dataset world → dataset pays, quand ni le code ni les noms du dataset ne correspondent
+WORLD_COUNTRY_ALIASES = {
+    'united states': 'usa',
+    'united states of america': 'usa',
+    'united kingdom': 'uk',
+    'great britain': 'uk'
+}
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_text(text: str) -> str:
+    """Normalise un texte: minuscules, sans accents, ponctuation → espaces"""
+    decomposed = unicodedata.normalize('NFKD', str(text).casefold())
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(' ', stripped).strip()
+
+
+def trigrams(normalized: str) -> set:
+    """Trigrammes d'un texte normalisé (avec padding de début/fin de mot)"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _PrefixTrie:
+    """Trie de préfixes dont chaque nœud garde ses meilleurs candidats triés"""
+
+    __slots__ = ('root',)
+
+    def __init__(self):
+        # Nœud: [enfants, {entry_idx: rang}, {entry_idx: rang terminal}]
+        self.root = [{}, {}, {}]
+
+    def insert(self, key: str, entry_idx: int, rank: int):
+        node = self.root
+        for char in key:
+            node = node[0].setdefault(char, [{}, {}, {}])
+            if rank < node[1].get(entry_idx, MATCH_FUZZY):
+                node[1][entry_idx] = rank
+        if rank < node[2].get(entry_idx, MATCH_FUZZY):
+            node[2][entry_idx] = rank
+
+    def finalize(self, sort_key, top_k: int):
+        """Fige chaque nœud en tuple de (rang, entry_idx) triés, tronqués à top_k"""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            ranked = sorted(node[1].items(), key=lambda item: (item[1], sort_key(item[0])))
+            node[1] = tuple((rank, idx) for idx, rank in ranked[:top_k])
+            node[2] = {idx for idx, rank in node[2].items() if rank == MATCH_NAME_PREFIX}
+            stack.extend(node[0].values())
+
+    def lookup(self, key: str) -> Optional[list]:
+        node = self.root
+        for char in key:
+            node = node[0].get(char)
+            if node is None:
+                return None
+        return node
+
+
+class CitySearchIndex:
+    """Index de recherche villes multi-pays (préfixes + trigrammes)"""
+
+    TOP_CANDIDATES = 50      # Candidats précalculés par nœud du trie
+    MAX_RESULTS = 20         # Limite haute exposée par l'API
+    FUZZY_THRESHOLD = 0.35   # Dice minimum pour une correspondance approximative
+    FUZZY_MIN_LENGTH = 3     # Pas de fuzzy sur 1-2 caractères (trop de bruit)
+
+    def __init__(self, data_loader: Optional[DataLoader] = None):
+        self.data_loader = data_loader or DataLoader()
+
+        self.entries: List[Dict] = []
+        self._populations: List[int] = []
+        self._name_keys: List[str] = []
+        self._name_trigram_counts: List[int] = []
+        self._entry_datasets: List[str] = []
+        self._shadowed: frozenset = frozenset()  # Entrées world doublons d'une entrée pays
+
+        self._tries: Dict[Optional[str], _PrefixTrie] = {}
+        self._trigram_postings: Dict[str, List[int]] = {}
+
+        self.build()
+
+    # ===============================
+    # 🏗️ CONSTRUCTION
+    # ===============================
+
+    def build(self):
+        """(Re)construit l'index complet depuis data_v2"""
+        self.entries = []
+        self._populations = []
+        self._name_keys = []
+        self._name_trigram_counts = []
+        self._entry_datasets = []
+
+        for country in self.data_loader.get_residents_countries():
+            dataset = self.data_loader.load_residents_cities(country)
+            if dataset:
+                for city in dataset.get('cities', []):
+                    self._add_entry(city, country)
+
+        world_data = self.data_loader.load_world_cities()
+        if isinstance(world_data, dict):
+            for city in world_data.get('cities', []):
+                self._add_entry(city, 'world')
+
+        self._shadowed = self._world_duplicates()
+        self._build_tries()
+        self._build_trigrams()
+
+        logger.info(f"🔎 City search index built: {len(self.entries)} cities "
+                    f"({len(self._shadowed)} world duplicates), "
+                    f"{len(self._tries) - 1} datasets, {len(self._trigram_postings)} trigrams")
+
+    def _world_duplicates(self) -> frozenset:
+        """Entrées world dont (nom normalisé, pays) existe déjà dans un dataset pays"""
+        country_datasets = dict(WORLD_COUNTRY_ALIASES)
+        country_keys = set()
+        for idx, dataset in enumerate(self._entry_datasets):
+            if dataset != 'world':
+                country_datasets[dataset] = dataset
+                country_datasets[normalize_text(self.entries[idx]['country'])] = dataset
+                country_keys.add((self._name_keys[idx], dataset))
+
+        return frozenset(
+            idx for idx, dataset in enumerate(self._entry_datasets)
+            if dataset == 'world' and (
+                self._name_keys[idx],
+                country_datasets.get(normalize_text(self.entries[idx]['country']))
+            ) in country_keys
+        )
+
+    def _add_entry(self, city: Dict, dataset: str):
+        name = city.get('name') or city.get('city')
+        if not name:
+            return
+
+        region = next((city[field] for field in REGION_FIELDS if city.get(field)), '')
+        population = city.get('population') or 0
+
+        self.entries.append({
+            'id': city.get('id') or normalize_text(name).replace(' ', '_'),
+            'name': name,
+            'region': region,
+            'country': city.get('country') or dataset.title(),
+            'country_id': city.get('country_id'),
+            'dataset': dataset,
+            'population': population
+        })
+        self._populations.append(population if isinstance(population, (int, float)) else 0)
+        self._name_keys.append(normalize_text(name))
+        self._entry_datasets.append(dataset)
+
+    def _index_keys(self, entry_idx: int) -> List[Tuple[str, int]]:
+        """Clés indexées pour une ville: nom complet, mots du nom, régions, id"""
+        entry = self.entries[entry_idx]
+        name_key = self._name_keys[entry_idx]
+        keys = [(name_key, MATCH_NAME_PREFIX)]
+
+        words = name_key.split()
+        keys.extend((' '.join(words[i:]), MATCH_WORD_PREFIX) for i in range(1, len(words)))
+
+        region_key = normalize_text(entry['region'])
+        if region_key:
+            keys.append((region_key, MATCH_REGION_PREFIX))
+            region_words = region_key.split()
+            keys.extend((' '.join(region_words[i:]), MATCH_REGION_PREFIX) for i in range(1, len(region_words)))
+
+        id_key = normalize_text(entry['id'])
+        if id_key and id_key != name_key:
+            keys.append((id_key, MATCH_REGION_PREFIX))
+
+        return keys
+
+    def _sort_key(self, entry_idx: int):
+        return (-self._populations[entry_idx], self._name_keys[entry_idx])
+
+    def _build_tries(self):
+        self._tries = {None: _PrefixTrie()}
+
+        for entry_idx, dataset in enumerate(self._entry_datasets):
+            country_trie = self._tries.setdefault(dataset, _PrefixTrie())
+            in_global = entry_idx not in self._shadowed
+            for key, rank in self._index_keys(entry_idx):
+                if in_global:
+                    self._tries[None].insert(key, entry_idx, rank)
+                country_trie.insert(key, entry_idx, rank)
+
+        for trie in self._tries.values():
+            trie.finalize(self._sort_key, self.TOP_CANDIDATES)
+
+    def _build_trigrams(self):
+        postings = defaultdict(list)
+        self._name_trigram_counts = []
+
+        for entry_idx, name_key in enumerate(self._name_keys):
+            name_trigrams = trigrams(name_key)
+            self._name_trigram_counts.append(len(name_trigrams))
+            for trigram in name_trigrams:
+                postings[trigram].append(entry_idx)
+
+        self._trigram_postings = {trigram: tuple(ids) for trigram, ids in postings.items()}
+
+    # ===============================
+    # 🔍 RECHERCHE
+    # ===============================
+
+    def search(self, query: str, limit: int = 10, country: Optional[str] = None) -> List[Dict]:
+        """Recherche classée: préfixes d'abord, trigrammes si pas assez de résultats"""
+        query_key = normalize_text(query)
+        if not query_key:
+            return []
+
+        limit = max(1, min(int(limit), self.MAX_RESULTS))
+        country = country.lower() if country else None
+        trie = self._tries.get(country)
+        if trie is None:
+            return []
+
+        ranked: Dict[int, float] = {}
+        match_levels: Dict[int, int] = {}
+
+        node = trie.lookup(query_key)
+        if node is not None:
+            exact_ids = node[2]
+            for rank, entry_idx in node[1]:
+                if entry_idx in exact_ids:
+                    rank = MATCH_EXACT
+                ranked[entry_idx] = MATCH_SCORES[rank]
+                match_levels[entry_idx] = rank
+
+        if len(ranked) < limit and len(query_key) >= self.FUZZY_MIN_LENGTH:
+            for entry_idx, similarity in self._fuzzy_candidates(query_key, country):
+                if entry_idx not in ranked:
+                    ranked[entry_idx] = round(similarity * 0.5, 3)
+                    match_levels[entry_idx] = MATCH_FUZZY
+
+        best = sorted(ranked, key=lambda idx: (-ranked[idx], self._sort_key(idx)))[:limit]
+
+        return [
+            {**self.entries[idx], 'match': MATCH_LABELS[match_levels[idx]], 'score': ranked[idx]}
+            for idx in best
+        ]
+
+    def _fuzzy_candidates(self, query_key: str, country: Optional[str]) -> List[Tuple[int, float]]:
+        """Candidats par trigrammes partagés, filtrés par similarité de Dice"""
+        query_trigrams = trigrams(query_key)
+        shared = defaultdict(int)
+
+        for trigram in query_trigrams:
+            for entry_idx in self._trigram_postings.get(trigram, ()):
+                shared[entry_idx] += 1
+
+        candidates = []
+        query_size = len(query_trigrams)
+        for entry_idx, count in shared.items():
+            if country and self._entry_datasets[entry_idx] != country:
+                continue
+            if not country and entry_idx in self._shadowed:
+                continue
+            similarity = 2.0 * count / (query_size + self._name_trigram_counts[entry_idx])
+            if similarity >= self.FUZZY_THRESHOLD:
+                candidates.append((entry_idx, similarity))
+
+        return candidates
+
+    def get_datasets(self) -> List[str]:
+        """Datasets indexés (pays résidents + world)"""
+        return sorted(key for key in self._tries if key is not None)
+
+    def get_index_stats(self) -> Dict:
+        """Statistiques de l'index"""
+        return {
+            'cities_indexed': len(self.entries),
+            'world_duplicates': len(self._shadowed),
+            'datasets': self.get_datasets(),
+            'trigrams': len(self._trigram_postings),
+            'top_candidates_per_prefix': self.TOP_CANDIDATES
+        }
@@ -0,0 +1,26 @@
+"""
+🏠 RESIDENTS SERVICE - RELOCATION DOMESTIQUE PAR PAYS
+=====================================================
+Routes génériques des services résidents (USA, France, Canada, UK, Allemagne,
+Australie, Espagne, Japon, Mexique, Maroc, Brésil, Thaïlande)
+
+Features:
+- Une couche de routes pilotée par le registre des algorithmes pays
+- Adaptateurs par pays (formats de réponse historiques conservés)
+- /cities et /criteria pré-sérialisés avec ETag fort et 304 Not Modified
+"""
+
+__version__ = "1.0.0"
+__service_name__ = "residents"
+__endpoints__ = [
+    "/api/<country>-residents/recommendations",
+    "/api/<country>-residents/health",
+    "/api/<country>-residents/cities",
+    "/api/<country>-residents/criteria"
+]
+
+# Imports du service Residents
+from .countries import RESIDENTS_COUNTRIES, ResidentsCountry
+from .routes import residents_bp, init_residents, residents_snapshots
+
+__all__ = ['RESIDENTS_COUNTRIES', 'ResidentsCountry', 'residents_bp', 'init_residents', 'residents_snapshots']
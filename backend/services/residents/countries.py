@@ -0,0 +1,890 @@
+"""
+🗺️ RESIDENTS COUNTRIES - ADAPTATEURS PAR PAYS
+=============================================
+Les algorithmes résidents n'exposent pas tous la même interface ni le même
+format de réponse: chaque pays déclare ici ses quatre adaptateurs.
+
+- recommend(algorithm)  → réponse Flask de POST /<pays>-residents/recommendations
+- health(algorithm)     → réponse Flask de GET /<pays>-residents/health
+- cities(algorithm)     → payload de GET /<pays>-residents/cities (pur, pré-sérialisé)
+- criteria(algorithm)   → payload de GET /<pays>-residents/criteria (pur, pré-sérialisé)
+
+Les payloads cities/criteria ne dépendent que du dataset chargé: ils sont
+calculés une fois par version de dataset (voir routes.py).
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from flask import current_app, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResidentsCountry:
+    """Adaptateurs d'un service résidents"""
+    code: str
+    recommend: Callable[[Any], Any]
+    health: Callable[[Any], Any]
+    cities: Callable[[Any], Dict]
+    criteria: Callable[[Any], Dict]
+
+
+def _criteria_payload(algorithm, **extra) -> Dict:
+    """Format commun: définitions du dataset + poids de base"""
+    criteria_definitions = algorithm.cities_data.get('criteria_definitions', {})
+    return {
+        'status': 'success',
+        'criteria_definitions': criteria_definitions,
+        'criteria_count': len(criteria_definitions),
+        'base_weights': algorithm.criteria_weights_base,
+        **extra
+    }
+
+
+def _score_criteria_payload(algorithm) -> Dict:
+    """Critères déduits des scores de la première ville (datasets en liste)"""
+    sample_city = algorithm.cities_data[0] if algorithm.cities_data else {}
+    criteria_definitions = {}
+    if 'scores' in sample_city:
+        criteria_definitions = {
+            criteria: f"Score for {criteria.replace('_', ' ').title()}"
+            for criteria in sample_city['scores'].keys()
+        }
+
+    return {
+        'status': 'success',
+        'criteria_definitions': criteria_definitions,
+        'criteria_count': len(criteria_definitions),
+        'base_weights': algorithm.criteria_weights_base,
+        'approach': 'hybrid_residents_expats'
+    }
+
+
+def _full_cities_payload(algorithm) -> Dict:
+    """Villes complètes + définitions (UK, Japon, Allemagne)"""
+    return {
+        'status': 'success',
+        'cities': algorithm.cities_data['cities'],
+        'total_count': len(algorithm.cities_data['cities']),
+        'criteria_definitions': algorithm.cities_data.get('criteria_definitions', {}),
+        'metadata': algorithm.cities_data.get('metadata', {})
+    }
+
+
+def _adapt_frontend_recommendations(raw_recommendations, reasons_key: str, description_key: str,
+                                    extended: bool = True):
+    """Structure V2 → format attendu par le frontend (nom, pays, score_final...)"""
+    recommendations = []
+    for rec in raw_recommendations:
+        adapted_rec = {
+            'nom': rec.get('city', ''),
+            'pays': rec.get('region', ''),
+            'population': rec.get('population', 0),
+            'score_final': rec.get('score_percentage', 0),
+            'points_forts': rec.get(reasons_key, []),
+            'cout_vie': None,  # Pas utilisé dans V2
+            'pros': rec.get('pros', []) if not extended else rec.get('strengths', []),
+            'cons': rec.get('cons', []) if not extended else rec.get('concerns', []),
+            'description': rec.get(description_key, '')
+        }
+        if extended:
+            adapted_rec.update({
+                'rank': rec.get('rank', 0),
+                'coordinates': rec.get('coordinates', []),
+                'economic_zone': rec.get('economic_zone', 'general')
+            })
+        recommendations.append(adapted_rec)
+    return recommendations
+
+
+# ===========================
+# 🇺🇸 USA
+# ===========================
+
+def _usa_recommend(algorithm):
+    """🎯 Recommandations TOP 3 USA"""
+    try:
+        questionnaire_data = request.get_json()
+
+        if not questionnaire_data:
+            return jsonify({'error': 'Données questionnaire requises'}), 400
+
+        logger.debug("USA Recommendations request: %s", list(questionnaire_data))
+
+        recommendations = algorithm.get_top_recommendations(questionnaire_data, top_n=3)
+
+        logger.info(f"USA Recommendations generated for profile: {questionnaire_data.get('usa_main_priority', 'unknown')}")
+
+        return jsonify({
+            'status': 'success',
+            'success': True,
+            'recommendations': recommendations,
+            'algorithm_version': '1.0.0',
+            'total_cities_analyzed': len(algorithm.cities_data['cities']),
+            'questionnaire_responses': len([k for k in questionnaire_data.keys() if k.startswith('usa_')]),
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ USA Residents algorithm error: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'success': False,
+            'error': 'Erreur interne algorithme',
+            'details': str(e) if current_app.debug else None
+        }), 500
+
+
+def _usa_health(algorithm):
+    """🏥 Health check spécifique USA Residents"""
+    try:
+        test_data = {
+            'usa_main_priority': 'career_growth',
+            'usa_monthly_budget': 'budget_balanced',
+            'usa_work_situation': 'remote_full'
+        }
+
+        test_recommendations = algorithm.get_top_recommendations(test_data, top_n=1)
+
+        return jsonify({
+            'status': 'healthy',
+            'algorithm_version': '1.0.0',
+            'cities_loaded': len(algorithm.cities_data['cities']),
+            'criteria_count': 25,
+            'test_passed': len(test_recommendations) > 0,
+            'sample_city': test_recommendations[0]['city'] if test_recommendations else None,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ USA Residents health check failed: {str(e)}")
+        return jsonify({
+            'status': 'unhealthy',
+            'error': str(e),
+            'cities_loaded': len(algorithm.cities_data['cities']) if hasattr(algorithm, 'cities_data') else 0
+        }), 500
+
+
+def _usa_cities(algorithm) -> Dict:
+    """📍 Toutes les villes USA disponibles"""
+    cities_list = [{
+        'id': city['id'],
+        'name': city['name'],
+        'state': city['state'],
+        'population': city['population'],
+        'coordinates': city['coordinates']
+    } for city in algorithm.cities_data['cities']]
+
+    return {
+        'status': 'success',
+        'cities': cities_list,
+        'total_cities': len(cities_list),
+        'metadata': algorithm.cities_data.get('metadata', {})
+    }
+
+
+# ===========================
+# 🇫🇷 FRANCE / 🇨🇦 CANADA
+# ===========================
+
+def _domestic_recommend(country: str, label: str, flag: str, method: str):
+    """Recommandations TOP 3 avec champs requis <pays>_main_priority / <pays>_monthly_budget"""
+
+    def recommend(algorithm):
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'Données questionnaire requises'}), 400
+
+            logger.debug("%s %s residents analysis request: %s", flag, label, list(data))
+
+            required_fields = [f'{country}_main_priority', f'{country}_monthly_budget']
+            missing_fields = [field for field in required_fields if field not in data]
+            if missing_fields:
+                return jsonify({'error': f'Champs manquants: {missing_fields}'}), 400
+
+            recommendations = getattr(algorithm, method)(data, top_n=3)
+
+            response = {
+                'status': 'success',
+                'country': country,
+                'algorithm_version': '1.0.0',
+                'recommendations': recommendations,
+                'metadata': {
+                    'cities_analyzed': len(algorithm.cities_data['cities']),
+                    'criteria_used': len(algorithm.criteria_weights_base),
+                    'timestamp': datetime.now().isoformat()
+                }
+            }
+
+            logger.info(f"✅ {label} analysis successful: {len(recommendations)} recommendations")
+            return jsonify(response)
+
+        except Exception as e:
+            logger.error(f"❌ {label} residents analysis error: {str(e)}")
+            return jsonify({'error': f'Erreur analyse {label}', 'details': str(e)}), 500
+
+    return recommend
+
+
+def _domestic_health(label: str):
+    """🏥 Health check France / Canada Residents"""
+
+    def health(algorithm):
+        try:
+            return jsonify({
+                'status': 'healthy',
+                'service': f'{label} Residents',
+                'version': '1.0.0',
+                'cities_loaded': len(algorithm.cities_data.get('cities', [])),
+                'criteria_available': len(algorithm.criteria_weights_base),
+                'data_source': algorithm.cities_data.get('metadata', {}),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        except Exception as e:
+            logger.error(f"❌ {label} residents health error: {str(e)}")
+            return jsonify({'error': f'Service {label} indisponible'}), 503
+
+    return health
+
+
+def _domestic_cities(area_field: str):
+    """🏙️ Format léger pour le frontend (région / province)"""
+
+    def cities(algorithm) -> Dict:
+        cities_summary = [{
+            'name': city['name'],
+            area_field: city[area_field],
+            'population': city['population'],
+            'coordinates': city['coordinates']
+        } for city in algorithm.cities_data.get('cities', [])]
+
+        return {
+            'status': 'success',
+            'cities': cities_summary,
+            'count': len(cities_summary),
+            'metadata': algorithm.cities_data.get('metadata', {})
+        }
+
+    return cities
+
+
+# ===========================
+# 🇧🇷 BRAZIL
+# ===========================
+
+def _brazil_recommend(algorithm):
+    """🇧🇷 Recommandations TOP 3 Brésil"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Données questionnaire requises'}), 400
+
+        logger.debug("🇧🇷 Brazil residents analysis request: %s", list(data))
+
+        required_fields = ['brazil_main_priority', 'brazil_monthly_budget']
+        missing_fields = [field for field in required_fields if field not in data]
+        if missing_fields:
+            return jsonify({'error': f'Champs manquants: {missing_fields}'}), 400
+
+        recommendations = algorithm.get_recommendations(data)
+
+        if recommendations['status'] == 'error':
+            return jsonify(recommendations), 400
+
+        response = {
+            'status': 'success',
+            'country': 'brazil',
+            'algorithm_version': algorithm.version,
+            'recommendations': recommendations['recommendations'],
+            'metadata': {
+                'cities_analyzed': recommendations.get('total_cities_analyzed', 0),
+                'criteria_used': len(algorithm.criteria_weights_base),
+                'regions_supported': list(algorithm.regional_mappings.keys()),
+                'user_profile_summary': recommendations.get('user_profile_summary', {}),
+                'timestamp': datetime.now().isoformat()
+            }
+        }
+
+        logger.info(f"✅ Brazil analysis successful: {len(recommendations['recommendations'])} recommendations")
+        return jsonify(response)
+
+    except Exception as e:
+        logger.error(f"❌ Brazil residents analysis error: {str(e)}")
+        return jsonify({'error': 'Erreur analyse Brésil', 'details': str(e)}), 500
+
+
+def _brazil_health(algorithm):
+    """🏥 Health check service Brazil Residents"""
+    try:
+        health_info = algorithm.health_check()
+
+        return jsonify({
+            'status': 'healthy',
+            'service': 'Brazil Residents',
+            'version': algorithm.version,
+            'cities_loaded': health_info['cities_loaded'],
+            'criteria_available': health_info['criteria_count'],
+            'regions_supported': health_info['regions_supported'],
+            'data_source': algorithm.cities_data.get('metadata', {}),
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Brazil residents health error: {str(e)}")
+        return jsonify({'error': 'Service Brésil indisponible'}), 503
+
+
+def _brazil_cities(algorithm) -> Dict:
+    """🏙️ Villes brésiliennes disponibles"""
+    payload = _domestic_cities('region')(algorithm)
+    payload['regions'] = list(algorithm.regional_mappings.keys())
+    return payload
+
+
+def _brazil_criteria(algorithm) -> Dict:
+    return _criteria_payload(algorithm, regional_mappings=algorithm.regional_mappings)
+
+
+# ===========================
+# 🇬🇧 UK / 🇯🇵 JAPAN / 🇩🇪 GERMANY
+# ===========================
+
+def _versioned_recommend(label: str, wrap: bool = True):
+    """Recommandations avec filtres régionaux (Japon: format déjà prêt côté algorithme)"""
+
+    def recommend(algorithm):
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'Données requises'}), 400
+
+            recommendations = algorithm.get_recommendations(data)
+            if not wrap:
+                return jsonify(recommendations)
+
+            return jsonify({
+                'status': 'success',
+                'recommendations': recommendations,
+                'criteria_used': list(algorithm.criteria_weights_base.keys()),
+                'total_cities': len(algorithm.cities_data['cities']),
+                'algorithm_version': algorithm.version,
+                'filters_applied': recommendations.get('filters_applied', {}),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        except Exception as e:
+            logger.error(f"❌ {label} Recommendations error: {str(e)}")
+            return jsonify({'error': f'Erreur calcul recommandations {label}'}), 500
+
+    return recommend
+
+
+def _versioned_health(label: str, data_file: str):
+    """Health check complet UK / Japon / Allemagne"""
+
+    def health(algorithm):
+        try:
+            return jsonify({
+                'service': f'{label} Residents',
+                'status': 'healthy',
+                'cities_loaded': len(algorithm.cities_data['cities']),
+                'criteria_count': len(algorithm.criteria_weights_base),
+                'algorithm_version': algorithm.version,
+                'data_file': data_file,
+                'last_update': algorithm.cities_data.get('last_update', 'unknown'),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        except Exception as e:
+            logger.error(f"❌ {label} health check failed: {e}")
+            return jsonify({
+                'service': f'{label} Residents',
+                'status': 'unhealthy',
+                'error': str(e)
+            }), 503
+
+    return health
+
+
+# ===========================
+# 🇦🇺 AUSTRALIA / 🇪🇸 SPAIN
+# ===========================
+
+def _hybrid_recommend(label: str, flag: str):
+    """Recommandations hybrides résidents/expats (interface standardisée)"""
+
+    def recommend(algorithm):
+        try:
+            if not request.is_json:
+                return jsonify({'error': 'Content-Type must be application/json'}), 400
+
+            data = request.get_json()
+            logger.info(f"{flag} {label} residents request received")
+
+            if not data:
+                return jsonify({'error': 'No data provided'}), 400
+
+            result = algorithm.get_recommendations(data)
+
+            if result['status'] == 'success':
+                logger.info(f"✅ {label} recommendations: {len(result['recommendations'])} cities")
+            else:
+                logger.warning(f"⚠️ {label} algorithm issue: {result.get('message', 'Unknown error')}")
+
+            return jsonify(result)
+
+        except Exception as e:
+            logger.error(f"❌ {label} residents error: {str(e)}")
+            return jsonify({
+                'status': 'error',
+                'message': f'Server error: {str(e)}',
+                'recommendations': []
+            }), 500
+
+    return recommend
+
+
+def _hybrid_health(label: str):
+    """Health check délégué à l'algorithme"""
+
+    def health(algorithm):
+        try:
+            return jsonify(algorithm.get_health_check())
+
+        except Exception as e:
+            logger.error(f"❌ {label} health check error: {str(e)}")
+            return jsonify({
+                'status': 'unhealthy',
+                'error': str(e),
+                'cities_loaded': 0,
+                'algorithm_version': 'unknown'
+            }), 500
+
+    return health
+
+
+def _hybrid_cities(label: str, area_field: str):
+    """Villes disponibles (dataset en liste)"""
+
+    def cities(algorithm) -> Dict:
+        cities_info = [{
+            'id': city['id'],
+            'name': city['name'],
+            area_field: city[area_field],
+            'population': city['population'],
+            'coordinates': city['coordinates']
+        } for city in algorithm.cities_data]
+
+        return {
+            'status': 'success',
+            'cities': cities_info,
+            'cities_count': len(cities_info),
+            'country': label,
+            'approach': 'hybrid_residents_expats'
+        }
+
+    return cities
+
+
+# ===========================
+# 🇲🇽 MEXICO
+# ===========================
+
+MEXICO_CRITERIA = {
+    'lifestyle_preference': 'Style de vie mexicain préféré',
+    'climate': 'Préférence climatique (tropical, désertique, tempéré)',
+    'work_environment': 'Environnement professionnel recherché',
+    'budget_comfort': 'Budget mensuel en pesos mexicains',
+    'social_life': 'Type de vie sociale désirée',
+    'transport': 'Mode de transport privilégié',
+    'housing_type': 'Type de logement recherché',
+    'gastronomy': 'Culture gastronomique préférée',
+    'pace_of_life': 'Rythme de vie souhaité',
+    'safety_priority': 'Niveau de sécurité requis'
+}
+
+MEXICO_ZONES = [
+    'central_metropolis',
+    'riviera_maya',
+    'pacific_coast',
+    'colonial_heritage',
+    'yucatan_peninsula',
+    'oaxaca_cultural',
+    'northern_business'
+]
+
+
+def _mexico_recommend(algorithm):
+    """🇲🇽 Service de recommandations Mexico - Pattern Revolutionary"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'Données JSON requises'}), 400
+
+        preferences = data.get('preferences', {})
+        if not preferences:
+            return jsonify({'error': 'Préférences requises'}), 400
+
+        result = algorithm.get_recommendations(preferences, 3)
+
+        if not result or not result.get('success'):
+            return jsonify({'error': 'Aucune recommandation générée'}), 500
+
+        recommendations = _adapt_frontend_recommendations(
+            result.get('recommendations', []), 'reasons', 'description', extended=False)
+
+        logger.info(f"🇲🇽 Mexico recommendations adapted: {len(recommendations)} cities")
+
+        return jsonify({
+            'status': 'success',
+            'recommendations': recommendations,
+            'country': 'Mexico',
+            'service': 'mexico_residents',
+            'approach': 'hybrid_residents_expats',
+            'generated_at': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Mexico recommendations error: {str(e)}")
+        return jsonify({'error': 'Erreur génération recommandations Mexico'}), 500
+
+
+def _mexico_health(algorithm):
+    """🏥 Health check Mexico residents service"""
+    try:
+        test_prefs = {'mexico_lifestyle_priority': 'expat_friendly'}
+        test_result = algorithm.get_recommendations(test_prefs, 3)
+
+        return jsonify({
+            'status': 'healthy',
+            'service': 'mexico_residents',
+            'country': 'Mexico',
+            'test_cities_count': len(test_result),
+            'approach': 'hybrid_residents_expats',
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Mexico health check error: {str(e)}")
+        return jsonify({'status': 'unhealthy', 'error': str(e)}), 500
+
+
+def _mexico_cities(algorithm) -> Dict:
+    """🏙️ Villes mexicaines (infos de base)"""
+    cities_info = [{
+        'name': city.get('name', ''),
+        'region': city.get('region', ''),
+        'population': city.get('population', 0),
+        'cost_of_living': city.get('cost_of_living', 5),
+        'safety_score': city.get('safety_score', 5),
+        'climate_type': city.get('climate_type', ''),
+        'highlights': city.get('highlights', [])
+    } for city in algorithm.cities_data]
+
+    return {
+        'status': 'success',
+        'cities': cities_info,
+        'cities_count': len(cities_info),
+        'country': 'Mexico',
+        'approach': 'hybrid_residents_expats'
+    }
+
+
+def _mexico_criteria(algorithm) -> Dict:
+    return {
+        'status': 'success',
+        'criteria_definitions': MEXICO_CRITERIA,
+        'criteria_count': len(MEXICO_CRITERIA),
+        'approach': 'hybrid_residents_expats',
+        'zones': MEXICO_ZONES
+    }
+
+
+# ===========================
+# 🇲🇦 MOROCCO / 🇹🇭 THAILAND
+# ===========================
+
+# 27 critères standardisés (23 communs + 4 spécifiques au pays)
+_STANDARD_CRITERIA = {
+    # Économie (5)
+    'cost_of_living': 'Coût de la vie abordable (logement, nourriture, transport)',
+    'job_opportunities': 'Opportunités d\'emploi et marché du travail dynamique',
+    'salary_potential': 'Potentiel d\'évolution salariale et revenus',
+    'housing_availability': 'Disponibilité et accessibilité du logement',
+    'public_transport': 'Qualité du transport public urbain',
+
+    # Santé et sécurité (2)
+    'healthcare_quality': 'Qualité des soins médicaux et hôpitaux',
+    'safety_security': 'Niveau de sécurité et stabilité',
+
+    # Éducation et famille (2)
+    'education_quality': 'Qualité du système éducatif',
+    'family_friendliness': 'Environnement favorable aux familles',
+
+    # Culture et lifestyle (4)
+    'cultural_scene': 'Richesse culturelle, événements, arts',
+    'nightlife': 'Vie nocturne et divertissements',
+    'youth_scene': 'Dynamisme et activités pour jeunes',
+    'sports_recreation': 'Activités sportives et de loisir',
+
+    # Connectivité (2)
+    'international_connectivity': 'Connexions aéroport et business international',
+    'language_diversity': 'Multilinguisme et diversité linguistique',
+
+    # Environnement (5) - climat, plages et montagnes précisés par pays
+    'air_quality': 'Qualité de l\'air et pollution',
+    'nature_access': 'Accès aux espaces verts et naturels',
+
+    # Business et tech (3)
+    'business_environment': 'Écosystème d\'affaires et entrepreneuriat',
+    'startup_ecosystem': 'Dynamisme startup et innovation',
+    'tech_scene': 'Secteur technologique et numérique'
+}
+
+MOROCCO_CRITERIA = {
+    **_STANDARD_CRITERIA,
+    'climate_quality': 'Qualité du climat méditerranéen/atlantique',
+    'beach_access': 'Accès aux plages atlantiques/méditerranéennes',
+    'mountain_access': 'Proximité Atlas, Rif et montagnes',
+
+    # Spécifiques Maroc (4)
+    'european_proximity_advantage': 'Avantage géostratégique proximité Europe',
+    'berber_culture_presence': 'Richesse du patrimoine amazigh/berbère',
+    'french_language_usage': 'Usage du français dans business/éducation',
+    'traditional_markets_souks': 'Authenticité souks et commerce traditionnel'
+}
+
+THAILAND_CRITERIA = {
+    **_STANDARD_CRITERIA,
+    'climate_quality': 'Qualité du climat tropical adaptatif',
+    'beach_access': 'Accès aux plages tropicales',
+    'mountain_access': 'Proximité montagnes du Nord',
+
+    # Spécifiques Thailand (4 - INNOVATIONS RÉVOLUTIONNAIRES)
+    'tropical_climate_adaptation': 'Adaptation optimale au climat tropical',
+    'expat_community_presence': 'Communauté expatriée internationale',
+    'buddhist_culture_integration': 'Intégration culture bouddhiste authentique',
+    'street_food_culture': '🍜 INNOVATION - Culture street food exceptionnelle'
+}
+
+MOROCCO_REGIONS = [
+    'Grand Casablanca-Settat',
+    'Rabat-Salé-Kénitra',
+    'Fès-Meknès',
+    'Marrakech-Safi',
+    'Tanger-Tétouan-Al Hoceïma',
+    'Oriental',
+    'Souss-Massa',
+    'Béni Mellal-Khénifra',
+    'Drâa-Tafilalet',
+    'Laâyoune-Sakia El Hamra'
+]
+
+
+def _zoned_recommend(label: str, flag: str, payload_key: str, approach: str,
+                     description_key: str, default_total: int):
+    """Recommandations Maroc / Thaïlande adaptées au format frontend"""
+
+    def recommend(algorithm):
+        try:
+            data = request.get_json()
+            if not data:
+                return jsonify({'error': 'Données JSON requises'}), 400
+
+            preferences = data.get(payload_key, {})
+            if not preferences:
+                error = 'Préférences requises' if payload_key == 'preferences' else 'Réponses du questionnaire requises'
+                return jsonify({'error': error}), 400
+
+            result = algorithm.get_recommendations(preferences)
+
+            if not result or result.get('status') != 'success':
+                return jsonify({'error': 'Aucune recommandation générée'}), 500
+
+            recommendations = _adapt_frontend_recommendations(
+                result.get('recommendations', []), 'strengths', description_key)
+
+            logger.info(f"{flag} {label} recommendations generated: {len(recommendations)} cities")
+
+            return jsonify({
+                'status': 'success',
+                'recommendations': recommendations,
+                'country': label,
+                'service': f'{label.lower()}_residents',
+                'approach': approach,
+                'total_cities_analyzed': result.get('total_cities_analyzed', default_total),
+                'algorithm_version': result.get('algorithm_version', '1.0.0'),
+                'filters_applied': result.get('filters_applied', {}),
+                'generated_at': datetime.now().isoformat()
+            })
+
+        except Exception as e:
+            logger.error(f"❌ {label} recommendations error: {str(e)}")
+            return jsonify({'error': f'Erreur génération recommandations {label}: {str(e)}'}), 500
+
+    return recommend
+
+
+def _zoned_health(label: str, approach: str, test_responses: Dict):
+    """🏥 Health check Maroc / Thaïlande (recommandation de test)"""
+
+    def health(algorithm):
+        try:
+            test_result = algorithm.get_recommendations(test_responses)
+
+            return jsonify({
+                'status': 'healthy',
+                'service': f'{label.lower()}_residents',
+                'country': label,
+                'test_cities_count': len(test_result.get('recommendations', [])),
+                'approach': approach,
+                'algorithm_version': algorithm.version,
+                'cities_loaded': len(algorithm.cities_data.get('cities', [])),
+                'timestamp': datetime.now().isoformat()
+            })
+
+        except Exception as e:
+            logger.error(f"❌ {label} health check error: {str(e)}")
+            return jsonify({'status': 'unhealthy', 'error': str(e)}), 500
+
+    return health
+
+
+def _morocco_cities(algorithm) -> Dict:
+    """🏙️ 25 villes marocaines stratégiques"""
+    cities_info = []
+    for city in algorithm.cities_data.get('cities', []):
+        scores = city.get('scores', {})
+        cities_info.append({
+            'id': city.get('id', ''),
+            'name': city.get('name', ''),
+            'region': city.get('region', ''),
+            'population': city.get('population', 0),
+            'coordinates': city.get('coordinates', []),
+            'economic_zone': city.get('economic_zone', 'general'),
+            'cost_of_living_score': scores.get('cost_of_living', 0),
+            'safety_score': scores.get('safety_security', 0),
+            'cultural_scene_score': scores.get('cultural_scene', 0),
+            'highlights': [
+                f"Coût vie: {round(scores.get('cost_of_living', 0) * 10, 1)}/10",
+                f"Sécurité: {round(scores.get('safety_security', 0) * 10, 1)}/10",
+                f"Culture: {round(scores.get('cultural_scene', 0) * 10, 1)}/10"
+            ]
+        })
+
+    return {
+        'status': 'success',
+        'cities': cities_info,
+        'cities_count': len(cities_info),
+        'country': 'Morocco',
+        'approach': 'residents_and_expats',
+        'regions': MOROCCO_REGIONS
+    }
+
+
+def _morocco_criteria(algorithm) -> Dict:
+    return {
+        'status': 'success',
+        'criteria_definitions': MOROCCO_CRITERIA,
+        'criteria_count': len(MOROCCO_CRITERIA),
+        'approach': 'residents_and_expats',
+        'regional_filters': [
+            'any_region',
+            'atlantic_coast',
+            'mediterranean',
+            'imperial_cities',
+            'atlas_mountains',
+            'sahara_gateway'
+        ],
+        'algorithm_version': algorithm.version
+    }
+
+
+def _thailand_cities(algorithm) -> Dict:
+    """🏙️ 30 villes thaïlandaises stratégiques"""
+    cities_info = [{
+        'id': city.get('id', ''),
+        'name': city.get('name', ''),
+        'region': city.get('region', ''),
+        'population': city.get('population', 0),
+        'coordinates': city.get('coordinates', []),
+        'economic_zone': city.get('economic_zone', 'general')
+    } for city in algorithm.cities_data.get('cities', [])]
+
+    return {
+        'status': 'success',
+        'cities': cities_info,
+        'cities_count': len(cities_info),
+        'country': 'Thailand',
+        'approach': 'residents_and_expats_inclusive',
+        'regional_zones': ['Central Plains', 'Northern Mountains', 'Northeast Isan', 'Eastern Seaboard', 'Southern Beaches'],
+        'algorithm_version': algorithm.version
+    }
+
+
+def _thailand_criteria(algorithm) -> Dict:
+    return {
+        'status': 'success',
+        'criteria_definitions': THAILAND_CRITERIA,
+        'criteria_count': len(THAILAND_CRITERIA),
+        'approach': 'residents_and_expats_inclusive',
+        'innovations': ['street_food_culture', 'tropical_climate_adaptation'],
+        'regional_filters': [
+            'any_region',
+            'central_plains',
+            'northern_mountains',
+            'northeast_isan',
+            'eastern_seaboard',
+            'southern_beaches'
+        ],
+        'algorithm_version': algorithm.version
+    }
+
+
+# ===========================
+# 📋 REGISTRE DES PAYS
+# ===========================
+
+RESIDENTS_COUNTRIES: Dict[str, ResidentsCountry] = {country.code: country for country in (
+    ResidentsCountry('usa', _usa_recommend, _usa_health, _usa_cities, _criteria_payload),
+    ResidentsCountry('france', _domestic_recommend('france', 'France', '🇫🇷', 'get_top_recommendations_france'),
+                     _domestic_health('France'), _domestic_cities('region'), _criteria_payload),
+    ResidentsCountry('canada', _domestic_recommend('canada', 'Canada', '🇨🇦', 'get_top_recommendations_canada'),
+                     _domestic_health('Canada'), _domestic_cities('province'), _criteria_payload),
+    ResidentsCountry('brazil', _brazil_recommend, _brazil_health, _brazil_cities, _brazil_criteria),
+    ResidentsCountry('uk', _versioned_recommend('UK'), _versioned_health('UK', 'villes_uk_residents.json'),
+                     _full_cities_payload, _criteria_payload),
+    ResidentsCountry('japan', _versioned_recommend('Japan', wrap=False),
+                     _versioned_health('Japan', 'villes_japan_residents.json'),
+                     _full_cities_payload, _criteria_payload),
+    ResidentsCountry('germany', _versioned_recommend('Germany'),
+                     _versioned_health('Germany', 'villes_germany_residents.json'),
+                     _full_cities_payload, _criteria_payload),
+    ResidentsCountry('australia', _hybrid_recommend('Australia', '🇦🇺'), _hybrid_health('Australia'),
+                     _hybrid_cities('Australia', 'state'), _score_criteria_payload),
+    ResidentsCountry('spain', _hybrid_recommend('Spain', '🇪🇸'), _hybrid_health('Spain'),
+                     _hybrid_cities('Spain', 'region'), _score_criteria_payload),
+    ResidentsCountry('mexico', _mexico_recommend, _mexico_health, _mexico_cities, _mexico_criteria),
+    ResidentsCountry('morocco',
+                     _zoned_recommend('Morocco', '🇲🇦', 'preferences', 'residents_and_expats',
+                                      'why_recommended', 0),
+                     _zoned_health('Morocco', 'residents_and_expats', {
+                         'morocco_region_preference': 'any_region',
+                         'morocco_main_priority': 'career_growth'
+                     }),
+                     _morocco_cities, _morocco_criteria),
+    ResidentsCountry('thailand',
+                     _zoned_recommend('Thailand', '🇹🇭', 'responses', 'residents_and_expats_inclusive',
+                                      'recommendation_reason', 30),
+                     _zoned_health('Thailand', 'residents_and_expats_inclusive', {
+                         'thailand_region_preference': 'any_region',
+                         'thailand_main_priority': 'career_growth'
+                     }),
+                     _thailand_cities, _thailand_criteria),
+)}
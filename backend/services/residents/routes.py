@@ -0,0 +1,127 @@
+"""
+🌐 RESIDENTS ROUTES - API ENDPOINTS GÉNÉRIQUES
+==============================================
+Une seule couche de routes pour tous les services résidents, pilotée par le
+registre des algorithmes pays (core.country_registry).
+
+Endpoints (pour chaque pays du registre):
+- POST /api/<pays>-residents/recommendations → Recommandations personnalisées
+- GET  /api/<pays>-residents/health          → Health check du service
+- GET  /api/<pays>-residents/cities          → Villes disponibles (pré-sérialisé, ETag/304)
+- GET  /api/<pays>-residents/criteria        → Critères de l'algorithme (pré-sérialisé, ETag/304)
+
+Les corps /cities et /criteria sont sérialisés au chargement du dataset
+(listener du registre) et reconstruits seulement si sa version change.
+"""
+
+import logging
+import threading
+from typing import Dict, Tuple
+
+from flask import Blueprint, current_app, jsonify
+
+from core.country_registry import CountryRegistry
+from core.http_cache import JsonSnapshot, snapshot_response
+from .countries import RESIDENTS_COUNTRIES
+
+logger = logging.getLogger(__name__)
+
+# Blueprint Residents
+residents_bp = Blueprint('residents', __name__, url_prefix='/api')
+
+SNAPSHOT_KINDS = ('cities', 'criteria')
+
+
+class ResidentsSnapshots:
+    """Corps /cities et /criteria pré-sérialisés par pays, indexés par version de dataset"""
+
+    def __init__(self):
+        self._snapshots: Dict[str, Tuple[str, Dict[str, JsonSnapshot]]] = {}
+        self._lock = threading.Lock()
+
+    def build(self, code: str, algorithm, version: str):
+        """Sérialise les payloads d'un pays (appelé au chargement du dataset)"""
+        country = RESIDENTS_COUNTRIES.get(code)
+        if country is None:
+            return
+        snapshots = {kind: JsonSnapshot(getattr(country, kind)(algorithm), version) for kind in SNAPSHOT_KINDS}
+        with self._lock:
+            self._snapshots[code] = (version, snapshots)
+        logger.info(f"📦 Residents snapshots ready: {code} (dataset {version or 'unknown'})")
+
+    def get(self, registry: CountryRegistry, code: str, kind: str) -> JsonSnapshot:
+        """Snapshot courant, reconstruit si la version du dataset a changé"""
+        algorithm = registry.get(code)
+        version = registry.dataset_version(code)
+        entry = self._snapshots.get(code)
+        if entry is None or entry[0] != version:
+            self.build(code, algorithm, version)
+            entry = self._snapshots[code]
+        return entry[1][kind]
+
+    def clear(self):
+        with self._lock:
+            self._snapshots.clear()
+
+
+# Instance globale des snapshots
+residents_snapshots = ResidentsSnapshots()
+
+
+def init_residents(registry: CountryRegistry):
+    """Branche la pré-sérialisation sur les (re)chargements du registre"""
+    registry.add_listener(residents_snapshots.build)
+    for code in registry.loaded():
+        residents_snapshots.build(code, registry.get(code), registry.dataset_version(code))
+    logger.info(f"🌍 Residents routes ready for {len(RESIDENTS_COUNTRIES)} countries")
+
+
+def _registry() -> CountryRegistry:
+    return current_app.extensions['country_registry']
+
+
+def _unknown_country(country: str):
+    return jsonify({
+        'error': f'Unknown residents service: {country}',
+        'available_countries': list(RESIDENTS_COUNTRIES)
+    }), 404
+
+
+@residents_bp.route('/<country>-residents/recommendations', methods=['POST'])
+def residents_recommendations(country: str):
+    """Recommandations personnalisées (format de réponse propre à chaque pays)"""
+    if country not in RESIDENTS_COUNTRIES:
+        return _unknown_country(country)
+    return RESIDENTS_COUNTRIES[country].recommend(_registry().get(country))
+
+
+@residents_bp.route('/<country>-residents/health', methods=['GET'])
+def residents_health(country: str):
+    """Health check du service résidents d'un pays"""
+    if country not in RESIDENTS_COUNTRIES:
+        return _unknown_country(country)
+    return RESIDENTS_COUNTRIES[country].health(_registry().get(country))
+
+
+@residents_bp.route('/<country>-residents/cities', methods=['GET'])
+def residents_cities(country: str):
+    """Villes disponibles (corps pré-sérialisé, ETag fort)"""
+    if country not in RESIDENTS_COUNTRIES:
+        return _unknown_country(country)
+    try:
+        return snapshot_response(residents_snapshots.get(_registry(), country, 'cities'))
+    except Exception as e:
+        logger.error(f"❌ {country} cities error: {str(e)}")
+        return jsonify({'error': 'Erreur récupération villes'}), 500
+
+
+@residents_bp.route('/<country>-residents/criteria', methods=['GET'])
+def residents_criteria(country: str):
+    """Critères de l'algorithme (corps pré-sérialisé, ETag fort)"""
+    if country not in RESIDENTS_COUNTRIES:
+        return _unknown_country(country)
+    try:
+        return snapshot_response(residents_snapshots.get(_registry(), country, 'criteria'))
+    except Exception as e:
+        logger.error(f"❌ {country} criteria error: {str(e)}")
+        return jsonify({'error': 'Erreur récupération critères'}), 500
@@ -13,10 +13,13 @@ Features:
 
 __version__ = "1.0.0"
 __service_name__ = "skillgraph"
-__endpoints__ = ["/api/career", "/api/sectors", "/api/markets"]
+__endpoints__ = ["/api/career", "/api/sectors", "/api/markets", "/api/jobs",
+                 "/api/skills/gap-analysis", "/api/skills/learning-path"]
 
 # Imports du service SkillGraph
 from .algorithm import SkillGraphAlgorithm
+from .job_catalog import JobCatalog
+from .skill_graph import SkillGraph
 from .routes import skillgraph_bp
 
-__all__ = ['SkillGraphAlgorithm', 'skillgraph_bp']
\ No newline at end of file
+__all__ = ['SkillGraphAlgorithm', 'JobCatalog', 'SkillGraph', 'skillgraph_bp']
\ No newline at end of file
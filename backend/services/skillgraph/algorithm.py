@@ -15,23 +15,68 @@ Basé sur: L'esprit ZScore adapté au monde professionnel
 Architecture: BaseAlgorithm + DataLoader pattern évolutif
 """
 
+import heapq
 import json
-import random
 import logging
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-# Import depuis la racine backend
-import sys
-from pathlib import Path
-backend_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_root))
-
 from core.base_algorithm import BaseAlgorithm
 from core.data_loader import DataLoader
+from core.http_cache import JsonSnapshot
+from core.keywords import KeywordClassifier, response_text
+from core.market_tables import CountryTable, thaw
+from core.tracing import span
+from .job_catalog import JobCatalog
+from .skill_graph import SkillGraph
 
 logger = logging.getLogger(__name__)
 
+# 🔤 Vocabulaires des réponses libres carrière (les secteurs sont ajoutés à l'init)
+CAREER_KEYWORDS = {
+    # Niveau d'expérience (profil)
+    'experience_junior': ['junior', 'débutant', 'entry'],
+    'experience_senior': ['senior', 'expert', 'lead', 'manager'],
+    # Priorités (profil)
+    'priority_compensation': ['salary', 'money', 'salaire', 'rémunération'],
+    'priority_flexibility': ['remote', 'télétravail', 'home', 'flexibility'],
+    'priority_development': ['growth', 'career', 'évolution']
+}
+
+# 🧠 Compétences supposées acquises selon le niveau d'expérience
+LEVEL_SKILLS = {
+    'junior': ['Communication', 'Basic Analytics', 'Learning'],
+    'intermediate': ['Project Management', 'Analytics', 'Leadership', 'Technical Skills'],
+    'senior': ['Strategic Planning', 'Team Management', 'Expert Technical', 'Mentoring']
+}
+
+QUICK_WIN_HOURS = 60  # Formation prioritaire si le parcours est court
+
+# 🧮 Poids des termes du vecteur profil (matching cosinus offres/profil)
+PROFILE_TERM_WEIGHTS = {
+    'skill': 1.0,
+    'sector': 1.5,
+    'experience': 1.0,
+    'country': 2.0,
+    'remote': 1.0,
+    'growth': 0.5,             # Bonus secteur en croissance, pour tous les profils
+    'growth_priority': 1.5,    # ... renforcé si priorité évolution
+    'salary': 1.0              # Priorité rémunération: offres au-dessus du marché du pays
+}
+
+_SALARY_AMOUNT = re.compile(r'(\d+(?:[.,]\d+)?)\s*([kK]?)')
+
+
+def _salary_midpoint(salary_range: Any) -> Optional[float]:
+    """Milieu d'une fourchette '65K-85K EUR' (None si illisible)"""
+    amounts = [
+        float(value.replace(',', '.')) * (1000 if suffix else 1)
+        for value, suffix in _SALARY_AMOUNT.findall(str(salary_range or ''))
+    ]
+    return sum(amounts[:2]) / len(amounts[:2]) if amounts else None
+
 
 class SkillGraphAlgorithm(BaseAlgorithm):
     """Algorithme SkillGraph moderne - Intelligence carrière et compétences"""
@@ -69,6 +114,24 @@ class SkillGraphAlgorithm(BaseAlgorithm):
             'singapore': {'currency': 'SGD', 'avg_salary_range': '50K-120K', 'visa_req': True}
         }
 
+        # 🔤 Classifieur mots-clés: vocabulaires carrière + code et mots du nom de chaque secteur
+        self.keyword_classifier = KeywordClassifier({
+            **CAREER_KEYWORDS,
+            **{
+                f'sector_{sector}': [sector] + info['name'].lower().split()
+                for sector, info in self.supported_sectors.items()
+            }
+        })
+
+        # 🗂️ Catalogue emplois indexé (data_v2/jobs_catalog.json), termes croissance / salaire dérivés
+        self.job_catalog = JobCatalog(self.data_loader, extra_terms=self._job_market_terms)
+
+        # 🧠 Graphe de compétences (data_v2/skills_graph.json) + parcours en cache LRU
+        self.skill_graph = SkillGraph(self.data_loader)
+
+        # 🗺️ Tables marché par pays (data_v2/market_insights.json), chargées une fois
+        self._load_market_tables()
+
         logger.info(f"✅ SkillGraph Algorithm v{self.version} initialized - {len(self.supported_sectors)} sectors")
 
     def get_specific_criteria(self) -> List[str]:
@@ -117,16 +180,20 @@ class SkillGraphAlgorithm(BaseAlgorithm):
                 return cached_result
 
             # 1. Analyser profil utilisateur
-            user_profile = self._analyze_user_profile(questionnaire)
+            with span('skillgraph.profile'):
+                user_profile = self._analyze_user_profile(questionnaire)
 
             # 2. Générer recommandations emplois (MVP avec données simulées)
-            job_recommendations = self._generate_job_recommendations(user_profile, country)
+            with span('skillgraph.job_matching'):
+                job_recommendations = self._generate_job_recommendations(user_profile, country)
 
             # 3. Analyser gaps compétences
-            skill_gaps = self._analyze_skill_gaps(user_profile, job_recommendations)
+            with span('skillgraph.skill_gaps'):
+                skill_gaps = self._analyze_skill_gaps(user_profile, job_recommendations)
 
             # 4. Recommandations formations
-            training_recommendations = self._recommend_training(skill_gaps)
+            with span('skillgraph.training'):
+                training_recommendations = self._recommend_training(skill_gaps, user_profile)
 
             # 5. Préparer résultat final
             result = {
@@ -160,34 +227,45 @@ class SkillGraphAlgorithm(BaseAlgorithm):
 
     def calculate_score(self, job_data: Dict, questionnaire: Dict) -> float:
         """
-        Calcule le score de compatibilité profil/emploi
+        Calcule le score de compatibilité profil/emploi (cosinus × 100)
         Implémentation de la méthode abstraite BaseAlgorithm
         """
-        # Calculer poids personnalisés
-        weights = self._calculate_career_weights(questionnaire)
-
-        # Score de compatibilité basé sur les critères
-        compatibility_scores = []
-
-        for criterion, weight in weights.items():
-            if criterion in job_data:
-                job_value = float(job_data[criterion])
-                weighted_score = job_value * weight
-                compatibility_scores.append(weighted_score)
-
-        # Score de base
-        if compatibility_scores:
-            base_score = self.calculate_weighted_average(compatibility_scores)
-        else:
-            base_score = 0.6  # Score neutre pour nouvelles opportunités
-
-        # Bonus secteur en croissance
-        sector_bonus = 0.05 if job_data.get('sector_growth') == 'high' else 0
-
-        # Score final normalisé (0-100)
-        final_score = self.normalize_score((base_score + sector_bonus) * 100, 0, 100)
-
-        return final_score
+        user_profile = self._analyze_user_profile(questionnaire)
+        query = self._profile_query(user_profile, questionnaire.get('country'))
+        return round(self.job_catalog.vectors.score_job(job_data, query) * 100, 1)
+
+    def _profile_query(self, user_profile: Dict, country: Optional[str] = None) -> Dict[str, float]:
+        """Vecteur creux du profil sur le vocabulaire des offres"""
+        query = {
+            f"skill:{skill.lower()}": PROFILE_TERM_WEIGHTS['skill']
+            for skill in self._user_skills(user_profile)
+        }
+        for sector in user_profile.get('preferred_sectors', []):
+            query[f"sector:{sector}"] = PROFILE_TERM_WEIGHTS['sector']
+        query[f"experience:{user_profile.get('experience_level', 'intermediate')}"] = PROFILE_TERM_WEIGHTS['experience']
+        if isinstance(country, str) and country:
+            query[f"country:{country.lower()}"] = PROFILE_TERM_WEIGHTS['country']
+        priorities = user_profile.get('priorities', [])
+        if 'flexibility' in priorities:
+            query['remote'] = PROFILE_TERM_WEIGHTS['remote']
+        query['growth:high'] = PROFILE_TERM_WEIGHTS['growth_priority' if 'development' in priorities else 'growth']
+        if 'compensation' in priorities:
+            query['salary:high'] = PROFILE_TERM_WEIGHTS['salary']
+        return query
+
+    def _job_market_terms(self, job: Dict) -> List[str]:
+        """Termes dérivés d'une offre: croissance du secteur, salaire vs marché du pays"""
+        terms = []
+        growth = job.get('sector_growth') or self.supported_sectors.get(job.get('sector'), {}).get('growth')
+        if growth:
+            terms.append(f"growth:{growth}")
+
+        market = self.job_markets.get(str(job.get('country', '')).lower())
+        job_salary = _salary_midpoint(job.get('salary_range'))
+        market_salary = _salary_midpoint(market.get('avg_salary_range')) if market else None
+        if job_salary is not None and market_salary is not None:
+            terms.append('salary:high' if job_salary >= market_salary else 'salary:standard')
+        return terms
 
     def _analyze_user_profile(self, questionnaire: Dict) -> Dict:
         """Analyse le profil utilisateur selon les réponses"""
@@ -201,26 +279,25 @@ class SkillGraphAlgorithm(BaseAlgorithm):
 
         # Analyse des réponses pour extraire profil
         for key, response in questionnaire.items():
-            response_text = str(response).lower() if not isinstance(response, dict) else str(response.get('value', '')).lower()
+            matched = self.keyword_classifier.classify(response_text(response))
 
             # Détection niveau d'expérience
-            if any(word in response_text for word in ['junior', 'débutant', 'entry']):
+            if 'experience_junior' in matched:
                 profile['experience_level'] = 'junior'
-            elif any(word in response_text for word in ['senior', 'expert', 'lead', 'manager']):
+            elif 'experience_senior' in matched:
                 profile['experience_level'] = 'senior'
 
             # Détection secteurs préférés
-            for sector, info in self.supported_sectors.items():
-                if sector in response_text or any(word in response_text for word in info['name'].lower().split()):
-                    if sector not in profile['preferred_sectors']:
-                        profile['preferred_sectors'].append(sector)
+            for sector in self.supported_sectors:
+                if f'sector_{sector}' in matched and sector not in profile['preferred_sectors']:
+                    profile['preferred_sectors'].append(sector)
 
             # Détection priorités
-            if any(word in response_text for word in ['salary', 'money', 'salaire']):
+            if 'priority_compensation' in matched:
                 profile['priorities'].append('compensation')
-            if any(word in response_text for word in ['remote', 'télétravail', 'home']):
+            if 'priority_flexibility' in matched:
                 profile['priorities'].append('flexibility')
-            if any(word in response_text for word in ['growth', 'career', 'évolution']):
+            if 'priority_development' in matched:
                 profile['priorities'].append('development')
 
         # Fallback secteurs si aucun détecté
@@ -237,177 +314,113 @@ class SkillGraphAlgorithm(BaseAlgorithm):
 
         return profile
 
-    def _generate_job_recommendations(self, user_profile: Dict, country: str) -> List[Dict]:
-        """Génère des recommandations d'emplois (MVP avec données simulées)"""
-        # Base de données emplois simulée (en attendant vraies données)
-        job_templates = [
-            {
-                'title': 'Senior Data Scientist',
-                'company': 'TechCorp Paris',
-                'sector': 'tech',
-                'location': 'Paris, France',
-                'remote_friendly': True,
-                'salary_range': '65K-85K EUR',
-                'experience_required': 'senior',
-                'key_skills': ['Python', 'Machine Learning', 'Statistics'],
-                'visa_support': True,
-                'company_size': 'medium'
-            },
-            {
-                'title': 'Product Manager',
-                'company': 'Startup Innovante',
-                'sector': 'tech',
-                'location': 'Lyon, France',
-                'remote_friendly': True,
-                'salary_range': '55K-75K EUR',
-                'experience_required': 'intermediate',
-                'key_skills': ['Product Strategy', 'Agile', 'Analytics'],
-                'visa_support': False,
-                'company_size': 'small'
-            },
-            {
-                'title': 'Consultant Strategy',
-                'company': 'Big Consulting',
-                'sector': 'consulting',
-                'location': 'Paris, France',
-                'remote_friendly': False,
-                'salary_range': '60K-90K EUR',
-                'experience_required': 'intermediate',
-                'key_skills': ['Strategic Analysis', 'Presentation', 'Client Management'],
-                'visa_support': True,
-                'company_size': 'large'
-            },
-            {
-                'title': 'UX Designer',
-                'company': 'Creative Agency',
-                'sector': 'design',
-                'location': 'Bordeaux, France',
-                'remote_friendly': True,
-                'salary_range': '40K-60K EUR',
-                'experience_required': 'intermediate',
-                'key_skills': ['Figma', 'User Research', 'Prototyping'],
-                'visa_support': False,
-                'company_size': 'medium'
-            },
+    def _generate_job_recommendations(self, user_profile: Dict, country: str, max_results: int = 10) -> List[Dict]:
+        """
+        Recommandations d'emplois: cosinus profil/offres sur tout le catalogue
+        (un produit matrice creuse × vecteur), top-k déterministe
+        """
+        query = self._profile_query(user_profile, country)
+        jobs = self.job_catalog.jobs
+
+        return [
             {
-                'title': 'Marketing Manager',
-                'company': 'Scale-up Marketing',
-                'sector': 'marketing',
-                'location': 'Nantes, France',
-                'remote_friendly': True,
-                'salary_range': '45K-65K EUR',
-                'experience_required': 'intermediate',
-                'key_skills': ['Digital Marketing', 'Analytics', 'Campaign Management'],
-                'visa_support': False,
-                'company_size': 'medium'
+                **jobs[job_id],
+                'compatibility_score': round(similarity * 100, 1),
+                'match_reasons': self._generate_match_reasons(jobs[job_id], user_profile)
             }
+            for job_id, similarity in self.job_catalog.vectors.top_k(query, max_results)
         ]
 
-        # Filtrer selon profil utilisateur
-        filtered_jobs = []
-        preferred_sectors = user_profile.get('preferred_sectors', ['tech'])
-
-        for job in job_templates:
-            # Compatibilité secteur
-            if job['sector'] in preferred_sectors:
-                # Calculer score de compatibilité
-                job['compatibility_score'] = self.calculate_score(job, {'priorities': user_profile.get('priorities', [])})
-                job['match_reasons'] = self._generate_match_reasons(job, user_profile)
-                filtered_jobs.append(job)
-
-        # Ajouter diversité si pas assez de résultats
-        if len(filtered_jobs) < 3:
-            for job in job_templates:
-                if job not in filtered_jobs:
-                    job['compatibility_score'] = random.randint(70, 85)
-                    job['match_reasons'] = ['Nouvelle opportunité', 'Secteur en croissance']
-                    filtered_jobs.append(job)
-                    if len(filtered_jobs) >= 5:
-                        break
-
-        # Trier par score de compatibilité
-        filtered_jobs.sort(key=lambda x: x['compatibility_score'], reverse=True)
-
-        return filtered_jobs
-
-    def _calculate_career_weights(self, questionnaire: Dict) -> Dict[str, float]:
-        """Calcule les poids selon les priorités carrière utilisateur"""
-        all_criteria = self.get_specific_criteria()
-        weights = {criterion: 1.0 for criterion in all_criteria}
-
-        # Amplification selon les réponses
-        for key, response in questionnaire.items():
-            response_text = str(response).lower() if not isinstance(response, dict) else str(response.get('value', '')).lower()
-
-            # Patterns de détection
-            if any(word in response_text for word in ['salary', 'money', 'rémunération']):
-                weights['salary_expectations'] *= 2.5
-                weights['bonus_structure'] *= 2.0
-
-            if any(word in response_text for word in ['remote', 'télétravail', 'flexibility']):
-                weights['remote_work'] *= 2.5
-                weights['flexible_hours'] *= 2.0
-
-            if any(word in response_text for word in ['growth', 'career', 'évolution']):
-                weights['career_growth'] *= 2.0
-                weights['promotion_speed'] *= 1.8
-
-            if any(word in response_text for word in ['startup', 'innovation', 'entrepreneur']):
-                weights['startup_vs_corporate'] *= 2.0
-                weights['innovation_level'] *= 1.8
+    def search_jobs(self, limit: int = 20, **filters) -> Dict:
+        """
+        Recherche catalogue par index inversés
+        Filtres: sector, experience, country, city, remote, skill (valeur ou liste)
+        Classement: nombre de compétences demandées couvertes, puis ordre catalogue
+        """
+        candidate_ids = self.job_catalog.query_ids(**filters)
+        jobs = self.job_catalog.jobs
+
+        skills = filters.get('skill')
+        if skills and not isinstance(skills, str) and len(skills) > 1:
+            wanted = {skill.strip().lower() for skill in skills}
+            overlap = {
+                job_id: len(wanted.intersection(skill.lower() for skill in jobs[job_id].get('key_skills', [])))
+                for job_id in candidate_ids
+            }
+            best_ids = heapq.nlargest(limit, candidate_ids, key=overlap.__getitem__)
+        else:
+            best_ids = candidate_ids[:limit]
 
-        # Normalisation
-        max_weight = max(weights.values()) if weights.values() else 1.0
-        if max_weight > 1.0:
-            weights = {k: v / max_weight for k, v in weights.items()}
+        return {
+            'total': len(candidate_ids),
+            'jobs': [jobs[job_id] for job_id in best_ids]
+        }
 
-        return weights
+    def _user_skills(self, user_profile: Dict) -> List[str]:
+        """Compétences supposées acquises selon le niveau du profil"""
+        return LEVEL_SKILLS.get(user_profile.get('experience_level', 'intermediate'), [])
 
     def _analyze_skill_gaps(self, user_profile: Dict, job_recommendations: List[Dict]) -> List[str]:
-        """Analyse les gaps de compétences pour les emplois recommandés"""
-        # Compétences courantes supposées selon niveau
-        current_skills = {
-            'junior': ['Communication', 'Basic Analytics', 'Learning'],
-            'intermediate': ['Project Management', 'Analytics', 'Leadership', 'Technical Skills'],
-            'senior': ['Strategic Planning', 'Team Management', 'Expert Technical', 'Mentoring']
-        }
+        """Analyse les gaps de compétences pour les emplois recommandés (effort croissant)"""
+        required_skills = [
+            skill
+            for job in job_recommendations[:3]  # TOP 3 emplois
+            for skill in job.get('key_skills', [])
+        ]
 
-        user_level = user_profile.get('experience_level', 'intermediate')
-        user_skills = current_skills.get(user_level, [])
-
-        # Identifier compétences manquantes
-        required_skills = set()
-        for job in job_recommendations[:3]:  # TOP 3 emplois
-            required_skills.update(job.get('key_skills', []))
-
-        # Gap analysis
-        skill_gaps = []
-        for skill in required_skills:
-            if not any(existing_skill.lower() in skill.lower() for existing_skill in user_skills):
-                skill_gaps.append(skill)
-
-        return skill_gaps[:5]  # TOP 5 gaps
-
-    def _recommend_training(self, skill_gaps: List[str]) -> List[Dict]:
-        """Recommande des formations pour combler les gaps"""
-        training_database = {
-            'Python': {'provider': 'Coursera', 'duration': '3 mois', 'level': 'intermediate'},
-            'Machine Learning': {'provider': 'edX', 'duration': '4 mois', 'level': 'advanced'},
-            'Product Strategy': {'provider': 'Product School', 'duration': '2 mois', 'level': 'intermediate'},
-            'Figma': {'provider': 'YouTube/Udemy', 'duration': '1 mois', 'level': 'beginner'},
-            'Digital Marketing': {'provider': 'Google Skillshop', 'duration': '2 mois', 'level': 'intermediate'}
-        }
+        gaps = self.skill_graph.gap_analysis(self._user_skills(user_profile), required_skills)
+        return [gap['skill'] for gap in gaps['missing'][:5]]  # TOP 5 gaps
+
+    def _recommend_training(self, skill_gaps: List[str], user_profile: Optional[Dict] = None) -> List[Dict]:
+        """Recommande des formations pour combler les gaps (parcours prérequis compris)"""
+        user_skills = self._user_skills(user_profile or {})
 
         recommendations = []
         for skill in skill_gaps[:3]:
-            if skill in training_database:
-                training = training_database[skill].copy()
-                training['skill'] = skill
-                training['priority'] = 'high' if skill in ['Python', 'Machine Learning'] else 'medium'
-                recommendations.append(training)
+            path = self.skill_graph.learning_path(user_skills, skill)
+            node = self.skill_graph.get_skill(skill) or {}
+            effort = path['effort_hours']
+
+            training = dict(node.get('training') or {
+                'provider': 'Auto-formation',
+                'duration': f"{max(1, round(effort / 40))} mois",
+                'level': 'intermediate'
+            })
+            training['skill'] = skill
+            training['priority'] = 'high' if effort <= QUICK_WIN_HOURS else 'medium'
+            training['effort_hours'] = effort
+            training['learning_path'] = [step['skill'] for step in path['path']]
+            recommendations.append(training)
 
         return recommendations
 
+    def analyze_job_gaps(self, skills: List[str], limit: int = 20, **filters) -> Dict:
+        """
+        Gap analysis d'un ensemble de compétences contre les offres du catalogue
+        Un seul parcours du graphe (cache LRU), puis lectures par offre
+        Classement: effort total croissant, puis ordre catalogue
+        """
+        candidate_ids = self.job_catalog.query_ids(**filters)
+        jobs = self.job_catalog.jobs
+
+        gaps = dict(zip(candidate_ids, self.skill_graph.gap_analyses(
+            skills, (jobs[job_id].get('key_skills', []) for job_id in candidate_ids)
+        )))
+        best_ids = heapq.nsmallest(limit, candidate_ids, key=lambda job_id: gaps[job_id]['total_effort_hours'])
+
+        return {
+            'total': len(candidate_ids),
+            'jobs': [
+                {
+                    'id': jobs[job_id].get('id'),
+                    'title': jobs[job_id].get('title'),
+                    'company': jobs[job_id].get('company'),
+                    **gaps[job_id]
+                }
+                for job_id in best_ids
+            ]
+        }
+
     def _generate_match_reasons(self, job: Dict, user_profile: Dict) -> List[str]:
         """Génère les raisons de compatibilité emploi/profil"""
         reasons = []
@@ -418,6 +431,13 @@ class SkillGraphAlgorithm(BaseAlgorithm):
         if job.get('remote_friendly') and 'flexibility' in user_profile.get('priorities', []):
             reasons.append("Télétravail possible")
 
+        market_terms = self._job_market_terms(job)
+        if 'compensation' in user_profile.get('priorities', []) and 'salary:high' in market_terms:
+            reasons.append("Rémunération au-dessus du marché")
+
+        if 'development' in user_profile.get('priorities', []) and 'growth:high' in market_terms:
+            reasons.append("Secteur en croissance")
+
         if job.get('experience_required') == user_profile.get('experience_level'):
             reasons.append("Niveau d'expérience parfait")
 
@@ -426,25 +446,42 @@ class SkillGraphAlgorithm(BaseAlgorithm):
 
         return reasons[:2]
 
+    def _load_market_tables(self):
+        """Tables immuables compétences/salaires + réponses /api/skills pré-sérialisées"""
+        insights = self.data_loader.load_market_insights() or {}
+        tables = insights.get('skillgraph', {})
+
+        self.market_version = self.data_loader.get_dataset_version('market_insights.json')
+        self.market_updated_at = insights.get('metadata', {}).get('last_updated')
+        self.trending_skills = CountryTable(tables.get('trending_skills'),
+                                            tables.get('default_trending_skills', []))
+        self.salary_trends = CountryTable(tables.get('salary_trends'),
+                                          tables.get('default_salary_trends', {}))
+
+        self._skills_snapshots = lru_cache(maxsize=128)(self._build_skills_snapshot)
+        for country in self.trending_skills.countries():
+            self._skills_snapshots(country)
+
     def _get_trending_skills(self, country: str) -> List[str]:
         """Retourne les compétences tendance par pays"""
-        trending_by_country = {
-            'france': ['Python', 'React', 'Data Analysis', 'Product Management'],
-            'usa': ['AI/ML', 'Cloud Architecture', 'DevOps', 'Product Strategy'],
-            'canada': ['Full-Stack Dev', 'Data Science', 'UX Design', 'Project Management']
-        }
-
-        return trending_by_country.get(country, ['Tech Skills', 'Analytics', 'Leadership'])
+        return list(self.trending_skills.get(country))
 
     def _get_salary_trends(self, country: str) -> Dict:
         """Retourne les tendances salariales par pays"""
-        trends = {
-            'france': {'growth': '+3%', 'hot_sectors': ['Tech', 'Finance'], 'avg_increase': '3-5%'},
-            'usa': {'growth': '+5%', 'hot_sectors': ['AI/ML', 'Crypto'], 'avg_increase': '5-7%'},
-            'canada': {'growth': '+4%', 'hot_sectors': ['Tech', 'Healthcare'], 'avg_increase': '4-6%'}
-        }
-
-        return trends.get(country, {'growth': '+3%', 'hot_sectors': ['Tech'], 'avg_increase': '3-5%'})
+        return thaw(self.salary_trends.get(country))
+
+    def _build_skills_snapshot(self, country: str) -> JsonSnapshot:
+        return JsonSnapshot({
+            'success': True,
+            'country': country,
+            'trending_skills': self._get_trending_skills(country),
+            'salary_trends': self._get_salary_trends(country),
+            'updated_at': self.market_updated_at
+        }, version=self.market_version)
+
+    def get_skills_snapshot(self, country: str) -> JsonSnapshot:
+        """Réponse /api/skills/<country> pré-sérialisée (ETag versionné par dataset)"""
+        return self._skills_snapshots(country)
 
     def get_supported_sectors(self) -> List[str]:
         """Retourne la liste des secteurs supportés"""
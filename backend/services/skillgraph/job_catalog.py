@@ -0,0 +1,133 @@
+"""
+🗂️ JOB CATALOG - CATALOGUE EMPLOIS INDEXÉ
+=========================================
+Catalogue d'offres SkillGraph chargé via DataLoader (data_v2/jobs_catalog.json)
+Index inversés construits une fois, requêtes par intersection de posting lists
+
+Champs indexés:
+- sector, experience_required, country, location (ville), remote_friendly
+- key_skills (normalisées en minuscules)
+
+Sémantique des requêtes: OU entre les valeurs d'un même champ, ET entre les
+champs. L'intersection part de la posting list la plus courte, seuls les
+candidats retenus sont ensuite scorés par l'appelant.
+
+Les vecteurs creux des offres (job_vectors.py) sont reconstruits avec les index.
+"""
+
+import logging
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+from core.data_loader import DataLoader
+from .job_vectors import ExtraTerms, JobVectorIndex
+
+logger = logging.getLogger(__name__)
+
+# Champ de requête → extraction des clés d'index depuis une offre
+INDEXED_FIELDS = {
+    'sector': lambda job: [job.get('sector')],
+    'experience': lambda job: [job.get('experience_required')],
+    'country': lambda job: [job.get('country')],
+    'city': lambda job: [job.get('location', '').split(',')[0]],
+    'remote': lambda job: [bool(job.get('remote_friendly'))],
+    'skill': lambda job: job.get('key_skills', []),
+}
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+def _index_key(value: Any) -> Any:
+    """Clé d'index normalisée (insensible à la casse pour les chaînes)"""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class JobCatalog:
+    """Catalogue d'offres avec index inversés par champ"""
+
+    def __init__(self, data_loader: Optional[DataLoader] = None, extra_terms: Optional[ExtraTerms] = None):
+        self.data_loader = data_loader or DataLoader()
+        self.extra_terms = extra_terms  # Termes dérivés des vecteurs (voir job_vectors)
+        self.jobs: List[Dict] = []
+        self.metadata: Dict = {}
+        self._postings: Dict[str, Dict[Any, FrozenSet[int]]] = {}
+        self._all_ids: FrozenSet[int] = _EMPTY
+        self.vectors = JobVectorIndex([])
+        self.reload()
+
+    def reload(self, force_reload: bool = False):
+        """(Re)charge le catalogue et reconstruit les index"""
+        catalog = self.data_loader.load_job_catalog(force_reload) or {}
+        self.metadata = catalog.get('metadata', {})
+        self.jobs = catalog.get('jobs', [])
+        self._build_indexes()
+        logger.info(f"🗂️ Job catalog indexed: {len(self.jobs)} jobs, "
+                     f"{sum(len(values) for values in self._postings.values())} index keys")
+
+    def _build_indexes(self):
+        postings: Dict[str, Dict[Any, set]] = {field: {} for field in INDEXED_FIELDS}
+
+        for job_id, job in enumerate(self.jobs):
+            for field, extract in INDEXED_FIELDS.items():
+                for value in extract(job):
+                    if value is not None and value != '':
+                        postings[field].setdefault(_index_key(value), set()).add(job_id)
+
+        self._postings = {
+            field: {value: frozenset(ids) for value, ids in values.items()}
+            for field, values in postings.items()
+        }
+        self._all_ids = frozenset(range(len(self.jobs)))
+        self.vectors = JobVectorIndex(self.jobs, self.extra_terms)
+
+    def _field_ids(self, field: str, values: Iterable[Any]) -> FrozenSet[int]:
+        """Union des posting lists d'un champ (OU entre valeurs)"""
+        index = self._postings[field]
+        matched = [index.get(_index_key(value), _EMPTY) for value in values]
+        if len(matched) == 1:
+            return matched[0]
+        return frozenset().union(*matched)
+
+    def query_ids(self, **filters) -> List[int]:
+        """
+        Identifiants des offres satisfaisant tous les filtres, dans l'ordre du catalogue
+        Filtres: sector, experience, country, city, remote, skill (valeur ou liste)
+        """
+        lists = []
+        for field, values in filters.items():
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"Unknown job filter: {field}")
+            if values is None:
+                continue
+            if not isinstance(values, (list, tuple, set, frozenset)):
+                values = [values]
+            lists.append(self._field_ids(field, values))
+
+        if not lists:
+            return sorted(self._all_ids)
+
+        # Intersection en partant de la posting list la plus courte
+        lists.sort(key=len)
+        candidates = lists[0]
+        for ids in lists[1:]:
+            if not candidates:
+                break
+            candidates = candidates.intersection(ids)
+
+        return sorted(candidates)
+
+    def query(self, **filters) -> List[Dict]:
+        """Offres satisfaisant les filtres (voir query_ids)"""
+        return [self.jobs[job_id] for job_id in self.query_ids(**filters)]
+
+    def get_facets(self, field: str) -> Dict[Any, int]:
+        """Nombre d'offres par valeur d'un champ indexé"""
+        return {value: len(ids) for value, ids in self._postings.get(field, {}).items()}
+
+    def get_catalog_stats(self) -> Dict:
+        """Statistiques du catalogue et des index"""
+        return {
+            'jobs': len(self.jobs),
+            'indexed_fields': list(INDEXED_FIELDS),
+            'index_keys': {field: len(values) for field, values in self._postings.items()},
+            'last_updated': self.metadata.get('last_updated')
+        }
@@ -0,0 +1,129 @@
+"""
+🧮 JOB VECTORS - MATCHING PAR VECTEURS CREUX
+============================================
+Offres et profils encodés en vecteurs creux sur un vocabulaire de termes:
+- skill:<compétence>, sector:<secteur>, experience:<niveau>,
+  country:<pays>, remote
+- termes dérivés fournis par l'appelant (extra_terms), ex: croissance du
+  secteur ou tranche de salaire par rapport au marché du pays
+
+Représentation:
+- Matrice CSR NumPy (indptr / indices / data), une ligne par offre
+- Poids IDF façon BM25: idf = ln(1 + (N - df + 0.5) / (df + 0.5)),
+  lignes normalisées L2 → le produit scalaire est une similarité cosinus
+
+Classement:
+- Un produit matrice creuse × vecteur requête pour tout le catalogue
+  (np.bincount sur les lignes, sans boucle Python par offre)
+- Top-k par partition puis tri (score décroissant, ordre catalogue):
+  résultat déterministe, égalités comprises
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+ExtraTerms = Callable[[Dict], Iterable[str]]
+
+
+def job_terms(job: Dict, extra_terms: Optional[ExtraTerms] = None) -> List[str]:
+    """Termes du vocabulaire présents dans une offre"""
+    terms = [f"skill:{skill.strip().lower()}" for skill in job.get('key_skills', [])]
+    for field, prefix in (('sector', 'sector'), ('experience_required', 'experience'), ('country', 'country')):
+        if job.get(field):
+            terms.append(f"{prefix}:{str(job[field]).strip().lower()}")
+    if job.get('remote_friendly'):
+        terms.append('remote')
+    if extra_terms is not None:
+        terms.extend(extra_terms(job))
+    return list(dict.fromkeys(terms))
+
+
+class JobVectorIndex:
+    """Matrice creuse TF-IDF des offres avec requêtes cosinus top-k"""
+
+    def __init__(self, jobs: List[Dict], extra_terms: Optional[ExtraTerms] = None):
+        self.size = len(jobs)
+        self.extra_terms = extra_terms
+        rows = [job_terms(job, extra_terms) for job in jobs]
+
+        self.vocabulary: Dict[str, int] = {}
+        for terms in rows:
+            for term in terms:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+
+        lengths = np.fromiter((len(terms) for terms in rows), dtype=np.int64, count=self.size)
+        self._indptr = np.concatenate(([0], np.cumsum(lengths)))
+        self._indices = np.fromiter((self.vocabulary[term] for terms in rows for term in terms),
+                                    dtype=np.int64, count=int(self._indptr[-1]))
+        self._rows = np.repeat(np.arange(self.size), lengths)
+
+        # IDF BM25 (toujours > 0), termes binaires par offre
+        document_frequency = np.bincount(self._indices, minlength=len(self.vocabulary))
+        self.idf = np.log1p((self.size - document_frequency + 0.5) / (document_frequency + 0.5))
+        data = self.idf[self._indices]
+
+        norms = np.sqrt(np.bincount(self._rows, weights=data * data, minlength=self.size))
+        self._data = data / np.where(norms > 0, norms, 1.0)[self._rows]
+
+        logger.info(f"🧮 Job vectors built: {self.size} jobs × {len(self.vocabulary)} terms")
+
+    def _query_vector(self, query: Dict[str, float]) -> np.ndarray:
+        """Vecteur requête normalisé L2 (termes hors vocabulaire ignorés)"""
+        vector = np.zeros(len(self.vocabulary))
+        for term, weight in query.items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def scores(self, query: Dict[str, float]) -> np.ndarray:
+        """Similarité cosinus requête / chaque offre (une passe vectorisée)"""
+        vector = self._query_vector(query)
+        return np.bincount(self._rows, weights=self._data * vector[self._indices], minlength=self.size)
+
+    def top_k(self, query: Dict[str, float], k: int,
+              candidates: Optional[Iterable[int]] = None) -> List[Tuple[int, float]]:
+        """
+        k meilleures offres (indice catalogue, cosinus), score décroissant puis ordre catalogue
+        candidates restreint le classement à un sous-ensemble d'indices
+        """
+        scores = self.scores(query)
+        ids = np.arange(self.size) if candidates is None else np.fromiter(candidates, dtype=np.int64)
+        if k <= 0 or ids.size == 0:
+            return []
+
+        values = scores[ids]
+        if k < ids.size:
+            # Seuil = k-ième meilleur score; égalités au seuil départagées par indice
+            threshold = np.partition(values, ids.size - k)[ids.size - k]
+            above = np.flatnonzero(values > threshold)
+            tied = np.flatnonzero(values == threshold)[:k - above.size]
+            selected = np.concatenate((above, tied))
+        else:
+            selected = np.arange(ids.size)
+
+        order = selected[np.lexsort((ids[selected], -values[selected]))]
+        return [(int(ids[i]), float(values[i])) for i in order]
+
+    def score_job(self, job: Dict, query: Dict[str, float]) -> float:
+        """Cosinus requête / offre hors catalogue (IDF du catalogue, df = 0 si terme inconnu)"""
+        terms = job_terms(job, self.extra_terms)
+        unseen_idf = float(np.log1p((self.size + 0.5) / 0.5))
+        weights = {
+            term: float(self.idf[self.vocabulary[term]]) if term in self.vocabulary else unseen_idf
+            for term in terms
+        }
+        job_norm = np.sqrt(sum(weight * weight for weight in weights.values()))
+        query_norm = np.sqrt(sum(
+            weight * weight for term, weight in query.items() if term in self.vocabulary or term in weights
+        ))
+        if not job_norm or not query_norm:
+            return 0.0
+        dot = sum(weight * query.get(term, 0.0) for term, weight in weights.items())
+        return float(dot / (job_norm * query_norm))
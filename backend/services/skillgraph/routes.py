@@ -9,11 +9,16 @@ Endpoints:
 - GET /api/sectors → Secteurs d'activité supportés
 - GET /api/markets → Marchés emploi internationaux
 - GET /api/skills → Compétences tendance
+- GET /api/jobs → Recherche catalogue emplois (index inversés)
+- POST /api/skills/gap-analysis → Gaps compétences vs offres du catalogue
+- POST /api/skills/learning-path → Parcours d'apprentissage vers une compétence
 """
 
 import logging
 from flask import Blueprint, request, jsonify, session
 from typing import Dict, Any
+from core.http_cache import snapshot_response
+from core.single_flight import analysis_flight, canonical_key
 from .algorithm import SkillGraphAlgorithm
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,14 @@ skillgraph_bp = Blueprint('skillgraph', __name__, url_prefix='/api')
 skillgraph_algorithm = SkillGraphAlgorithm()
 
 
+def run_career_analysis(questionnaire: Dict, country: str) -> Dict:
+    """Analyse SkillGraph, coalescée entre requêtes identiques concurrentes"""
+    return analysis_flight.do(
+        canonical_key('skillgraph', questionnaire, country),
+        lambda: skillgraph_algorithm.analyze(questionnaire, country)
+    )
+
+
 @skillgraph_bp.route('/career', methods=['POST'])
 def analyze_career():
     """
@@ -43,7 +56,7 @@ def analyze_career():
             return jsonify({'error': 'Questionnaire is required'}), 400
 
         # Analyse via algorithme moderne
-        results = skillgraph_algorithm.analyze(questionnaire, country)
+        results = run_career_analysis(questionnaire, country)
 
         if 'error' in results:
             logger.warning(f"SkillGraph analysis error: {results['error']}")
@@ -120,22 +133,114 @@ def get_job_markets():
 
 @skillgraph_bp.route('/skills/<country>', methods=['GET'])
 def get_trending_skills(country: str):
-    """Retourne les compétences tendance pour un pays"""
+    """Retourne les compétences tendance pour un pays (pré-sérialisé, ETag)"""
+    try:
+        return snapshot_response(skillgraph_algorithm.get_skills_snapshot(country))
+
+    except Exception as e:
+        logger.error(f"❌ Skills API error: {e}")
+        return jsonify({'error': 'Failed to load trending skills'}), 500
+
+
+@skillgraph_bp.route('/jobs', methods=['GET'])
+def search_jobs():
+    """
+    Recherche dans le catalogue emplois (index inversés)
+    Filtres répétables: sector, experience, country, city, skill + remote=true|false
+    """
     try:
-        trending_skills = skillgraph_algorithm._get_trending_skills(country)
-        salary_trends = skillgraph_algorithm._get_salary_trends(country)
+        filters = {}
+        for field in ('sector', 'experience', 'country', 'city', 'skill'):
+            values = request.args.getlist(field)
+            if values:
+                filters[field] = values
+
+        remote = request.args.get('remote')
+        if remote is not None:
+            filters['remote'] = remote.lower() in ('1', 'true', 'yes')
+
+        limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+        results = skillgraph_algorithm.search_jobs(limit=limit, **filters)
 
         return jsonify({
             'success': True,
-            'country': country,
-            'trending_skills': trending_skills,
-            'salary_trends': salary_trends,
-            'updated_at': '2025-08-19'
+            'filters': filters,
+            'total': results['total'],
+            'jobs': results['jobs'],
+            'count': len(results['jobs'])
         })
 
     except Exception as e:
-        logger.error(f"❌ Skills API error: {e}")
-        return jsonify({'error': 'Failed to load trending skills'}), 500
+        logger.error(f"❌ Job search error: {e}")
+        return jsonify({'error': 'Job search failed'}), 500
+
+
+def _skills_payload(data: Dict) -> list:
+    """Liste de compétences de la requête (liste de chaînes non vides)"""
+    skills = data.get('skills', [])
+    if isinstance(skills, str) or not isinstance(skills, list):
+        raise ValueError("'skills' must be a list of skill names")
+    return [str(skill) for skill in skills if str(skill).strip()]
+
+
+@skillgraph_bp.route('/skills/gap-analysis', methods=['POST'])
+def analyze_skill_gaps():
+    """
+    Gap analysis d'un ensemble de compétences contre le catalogue emplois
+    Body: {"skills": [...], "sector"/"experience"/"country"/"city"/"skill": filtres, "limit": 20}
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        skills = _skills_payload(data)
+        filters = {field: data[field] for field in ('sector', 'experience', 'country', 'city', 'skill', 'remote')
+                   if data.get(field) is not None}
+        limit = max(1, min(int(data.get('limit', 20)), 100))
+
+        results = skillgraph_algorithm.analyze_job_gaps(skills, limit=limit, **filters)
+
+        return jsonify({
+            'success': True,
+            'skills': skills,
+            'filters': filters,
+            'total': results['total'],
+            'jobs': results['jobs'],
+            'count': len(results['jobs'])
+        })
+
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"❌ Skill gap analysis error: {e}")
+        return jsonify({'error': 'Skill gap analysis failed'}), 500
+
+
+@skillgraph_bp.route('/skills/learning-path', methods=['POST'])
+def get_learning_path():
+    """
+    Parcours d'apprentissage le moins coûteux vers une compétence
+    Body: {"skills": [...compétences acquises], "target": "Machine Learning"}
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        target = str(data.get('target', '')).strip()
+        if not target:
+            return jsonify({'error': 'Target skill is required'}), 400
+
+        path = skillgraph_algorithm.skill_graph.learning_path(_skills_payload(data), target)
+
+        return jsonify({'success': True, **path})
+
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"❌ Learning path error: {e}")
+        return jsonify({'error': 'Learning path computation failed'}), 500
 
 
 @skillgraph_bp.route('/profile-analysis', methods=['POST'])
@@ -186,7 +291,7 @@ def get_skillgraph_stats():
         return jsonify({'error': 'Failed to get stats'}), 500
 
 
-@skillgraph_bp.route('/health', methods=['GET'])
+@skillgraph_bp.route('/skillgraph/health', methods=['GET'])
 def skillgraph_health():
     """Health check spécifique au service SkillGraph"""
     try:
@@ -0,0 +1,232 @@
+"""
+🧠 SKILL GRAPH - GRAPHE DE COMPÉTENCES ET PARCOURS D'APPRENTISSAGE
+==================================================================
+Graphe de compétences SkillGraph chargé via DataLoader (data_v2/skills_graph.json)
+Noeuds = compétences, arêtes pondérées par l'effort d'apprentissage (heures)
+
+Représentation:
+- Tableaux d'adjacence compacts (CSR): offsets / targets / weights
+- Noeud virtuel "depuis zéro" relié à chaque compétence apprenable sans
+  prérequis (poids = effort du noeud); les compétences à effort null ne
+  s'atteignent que via leurs prérequis
+- Arêtes "prerequisite" orientées, arêtes "adjacent" dans les deux sens
+
+Requêtes:
+- Dijkstra multi-sources depuis les compétences acquises (distance 0) et le
+  noeud virtuel: un seul parcours donne l'effort minimal et le chemin vers
+  TOUTES les compétences
+- Arbre des plus courts chemins mis en cache LRU par ensemble de compétences:
+  la gap analysis sur des centaines d'offres se réduit à des lectures
+"""
+
+import heapq
+import logging
+from array import array
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from core.data_loader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 256      # Ensembles de compétences distincts en cache
+UNKNOWN_SKILL_EFFORT = 60.0   # Effort supposé pour une compétence hors graphe
+
+ShortestPaths = Tuple[Tuple[float, ...], Tuple[int, ...]]
+
+
+def _skill_key(name: str) -> str:
+    """Clé de recherche normalisée d'une compétence"""
+    return name.strip().lower()
+
+
+class SkillGraph:
+    """Graphe de compétences pondéré avec requêtes de parcours en cache LRU"""
+
+    def __init__(self, data_loader: Optional[DataLoader] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.data_loader = data_loader or DataLoader()
+        self.cache_size = cache_size
+        self.skills: List[Dict] = []
+        self.metadata: Dict = {}
+        self._lookup: Dict[str, int] = {}
+        self._offsets = array('l')
+        self._targets = array('l')
+        self._weights = array('d')
+        self.reload()
+
+    def reload(self, force_reload: bool = False):
+        """(Re)charge le graphe, reconstruit les tableaux d'adjacence et vide le cache"""
+        graph = self.data_loader.load_skill_graph(force_reload) or {}
+        self.metadata = graph.get('metadata', {})
+        self.skills = graph.get('skills', [])
+        self._build(graph.get('edges', []))
+        self._shortest_paths = lru_cache(maxsize=self.cache_size)(self._compute_shortest_paths)
+        logger.info(f"🧠 Skill graph built: {len(self.skills)} skills, {len(self._targets)} arcs")
+
+    def _build(self, edges: List[Dict]):
+        self._lookup = {}
+        for index, skill in enumerate(self.skills):
+            for name in [skill['id'], skill['name'], *skill.get('aliases', [])]:
+                self._lookup.setdefault(_skill_key(name), index)
+
+        # Noeud virtuel "depuis zéro" = dernier indice
+        root = len(self.skills)
+        adjacency: List[List[Tuple[int, float]]] = [[] for _ in range(root + 1)]
+        for index, skill in enumerate(self.skills):
+            if skill.get('effort') is not None:
+                adjacency[root].append((index, float(skill['effort'])))
+
+        for edge in edges:
+            source, target = self._lookup.get(_skill_key(edge['from'])), self._lookup.get(_skill_key(edge['to']))
+            if source is None or target is None:
+                logger.warning(f"⚠️ Skill graph edge ignored: {edge['from']} → {edge['to']}")
+                continue
+            adjacency[source].append((target, float(edge['effort'])))
+            if edge.get('type') == 'adjacent':
+                adjacency[target].append((source, float(edge['effort'])))
+
+        self._offsets = array('l', [0])
+        self._targets = array('l')
+        self._weights = array('d')
+        for arcs in adjacency:
+            for target, weight in arcs:
+                self._targets.append(target)
+                self._weights.append(weight)
+            self._offsets.append(len(self._targets))
+
+    @property
+    def _root(self) -> int:
+        return len(self.skills)
+
+    def resolve(self, skill: str) -> Optional[int]:
+        """Indice d'une compétence (id, nom ou alias, insensible à la casse)"""
+        return self._lookup.get(_skill_key(skill))
+
+    def _sources(self, owned: Iterable[str]) -> FrozenSet[int]:
+        return frozenset(index for index in map(self.resolve, owned) if index is not None)
+
+    def _compute_shortest_paths(self, sources: FrozenSet[int]) -> ShortestPaths:
+        """Dijkstra multi-sources sur les tableaux CSR → (distances, parents)"""
+        root = self._root
+        offsets, targets, weights = self._offsets, self._targets, self._weights
+        distances = [float('inf')] * (root + 1)
+        parents = [-1] * (root + 1)
+
+        heap = []
+        for source in (*sources, root):
+            distances[source] = 0.0
+            heap.append((0.0, source))
+        heapq.heapify(heap)
+
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            for arc in range(offsets[node], offsets[node + 1]):
+                target = targets[arc]
+                candidate = distance + weights[arc]
+                if candidate < distances[target]:
+                    distances[target] = candidate
+                    parents[target] = node
+                    heapq.heappush(heap, (candidate, target))
+
+        return tuple(distances), tuple(parents)
+
+    def _path_steps(self, paths: ShortestPaths, target: int) -> List[Tuple[int, float]]:
+        """Étapes (compétence, effort) du chemin vers target, prérequis d'abord"""
+        distances, parents = paths
+        steps = []
+        node = target
+        while distances[node] > 0:
+            parent = parents[node]
+            steps.append((node, distances[node] - distances[parent]))
+            node = parent
+        steps.reverse()
+        return steps
+
+    def _step_dict(self, index: int, effort: float) -> Dict:
+        return {'skill': self.skills[index]['name'], 'effort_hours': round(effort, 1)}
+
+    def learning_path(self, owned: Iterable[str], target: str) -> Dict:
+        """Parcours d'apprentissage le moins coûteux vers une compétence"""
+        index = self.resolve(target)
+        if index is None:
+            return {
+                'skill': target,
+                'known': False,
+                'effort_hours': UNKNOWN_SKILL_EFFORT,
+                'path': [{'skill': target, 'effort_hours': UNKNOWN_SKILL_EFFORT}]
+            }
+
+        paths = self._shortest_paths(self._sources(owned))
+        return {
+            'skill': self.skills[index]['name'],
+            'known': True,
+            'effort_hours': round(paths[0][index], 1),
+            'path': [self._step_dict(*step) for step in self._path_steps(paths, index)]
+        }
+
+    def gap_analysis(self, owned: Iterable[str], required: Iterable[str]) -> Dict:
+        """
+        Compétences manquantes pour un ensemble requis, triées par effort croissant
+
+        total_effort_hours additionne chaque étape une seule fois: les chemins
+        partagent l'arbre des plus courts chemins (prérequis communs).
+        """
+        return self.gap_analyses(owned, [required])[0]
+
+    def gap_analyses(self, owned: Iterable[str], requirements: Iterable[Iterable[str]]) -> List[Dict]:
+        """Gap analysis d'un même profil contre plusieurs ensembles requis (un seul parcours)"""
+        paths = self._shortest_paths(self._sources(owned))
+        distances = paths[0]
+        steps_cache: Dict[int, List[Tuple[int, float]]] = {}
+
+        results = []
+        for required in requirements:
+            acquired, missing, plan = [], [], {}
+            for skill in dict.fromkeys(required):
+                index = self.resolve(skill)
+                if index is None:
+                    missing.append({'skill': skill, 'known': False, 'effort_hours': UNKNOWN_SKILL_EFFORT,
+                                    'path': [skill]})
+                    plan[skill] = UNKNOWN_SKILL_EFFORT
+                elif distances[index] == 0:
+                    acquired.append(self.skills[index]['name'])
+                else:
+                    steps = steps_cache.get(index)
+                    if steps is None:
+                        steps = steps_cache[index] = self._path_steps(paths, index)
+                    plan.update(steps)
+                    missing.append({'skill': skill, 'known': True, 'effort_hours': round(distances[index], 1),
+                                    'path': [self.skills[step]['name'] for step, _ in steps]})
+
+            missing.sort(key=lambda gap: (gap['effort_hours'], gap['skill']))
+            total_required = len(acquired) + len(missing)
+            results.append({
+                'acquired': acquired,
+                'missing': missing,
+                'total_effort_hours': round(sum(plan.values()), 1),
+                'coverage': round(len(acquired) / total_required, 3) if total_required else 1.0
+            })
+
+        return results
+
+    def get_skill(self, skill: str) -> Optional[Dict]:
+        """Noeud brut d'une compétence (id, name, category, effort, training...)"""
+        index = self.resolve(skill)
+        return self.skills[index] if index is not None else None
+
+    def cache_info(self) -> Dict:
+        """Statistiques du cache LRU des parcours"""
+        info = self._shortest_paths.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
+
+    def get_graph_stats(self) -> Dict:
+        """Statistiques du graphe et du cache"""
+        return {
+            'skills': len(self.skills),
+            'arcs': len(self._targets),
+            'cache': self.cache_info(),
+            'last_updated': self.metadata.get('last_updated')
+        }
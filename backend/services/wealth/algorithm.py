@@ -17,21 +17,37 @@ Architecture: BaseAlgorithm + Intelligence financière révolutionnaire
 
 import json
 import random
+import re
 import logging
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
-# Import depuis la racine backend
-import sys
-from pathlib import Path
-backend_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_root))
-
 from core.base_algorithm import BaseAlgorithm
 from core.data_loader import DataLoader
+from core.http_cache import JsonSnapshot
+from core.keywords import KeywordClassifier, response_text
+from core.market_tables import CountryTable, thaw
+from .pipeline import Stage, StagedPipeline
 
 logger = logging.getLogger(__name__)
 
+_NUMBER_PATTERN = re.compile(r'\d+')
+
+# 🔤 Vocabulaires des réponses libres patrimoine (compilés une fois)
+WEALTH_KEYWORDS = KeywordClassifier({
+    # Épargne (situation actuelle)
+    'savings': ['save', 'épargne', 'invest'],
+    'savings_high': ['high', 'much', 'beaucoup'],
+    'savings_low': ['little', 'peu', 'difficile'],
+    # Lifestyle cible
+    'lifestyle_luxury': ['luxury', 'luxe', 'premium'],
+    'lifestyle_modest': ['simple', 'modest', 'basic'],
+    # Âge de retraite visé
+    'retire_early': ['early', 'tôt'],
+    'retire_late': ['late', 'tard']
+})
+
 
 class WealthAlgorithm(BaseAlgorithm):
     """Algorithme Wealth moderne - Intelligence patrimoniale et liberté financière"""
@@ -143,6 +159,22 @@ class WealthAlgorithm(BaseAlgorithm):
             }
         }
 
+        # 🗺️ Tables marché par pays (data_v2/market_insights.json), chargées une fois
+        self._load_market_tables()
+
+        # 🧩 Pipeline d'analyse: étapes pures mémoïsées sur leurs seules entrées
+        self.pipeline = StagedPipeline([
+            Stage('income_signals', self._extract_income_signals, ('responses',)),
+            Stage('lifestyle_signals', self._extract_lifestyle_signals, ('responses',)),
+            Stage('current_wealth', self._analyze_current_wealth, ('income_signals',)),
+            Stage('freedom_targets', self._calculate_freedom_targets, ('lifestyle_signals', 'country')),
+            Stage('wealth_gaps', self._analyze_wealth_gaps, ('current_wealth', 'freedom_targets')),
+            Stage('strategies', self._recommend_wealth_strategies, ('wealth_gaps', 'current_wealth', 'country')),
+            Stage('timeline', self._calculate_freedom_timeline, ('wealth_gaps', 'strategies', 'current_wealth')),
+            Stage('tax_optimizations', self._recommend_tax_optimizations, ('country',)),
+            Stage('economic_outlook', self._get_economic_outlook, ('country',))
+        ], external_inputs=('responses', 'country'), trace_prefix='wealth')
+
         logger.info(f"✅ Wealth Algorithm v{self.version} initialized - {len(self.wealth_markets)} markets")
 
     def get_specific_criteria(self) -> List[str]:
@@ -183,30 +215,14 @@ class WealthAlgorithm(BaseAlgorithm):
             if not self.validate_questionnaire(questionnaire):
                 return {"error": "Invalid questionnaire", "recommendations": []}
 
-            # Cache check
-            cache_key = f"wealth_{country}_{len(questionnaire)}"
-            cached_result = self.get_cached_result(cache_key)
-            if cached_result:
-                logger.info("📦 Returning cached Wealth result")
-                return cached_result
-
-            # 1. Analyser situation financière actuelle
-            current_wealth = self._analyze_current_wealth(questionnaire)
-
-            # 2. Définir objectifs de liberté financière
-            freedom_targets = self._calculate_freedom_targets(questionnaire, country)
-
-            # 3. Gap analysis patrimoine
-            wealth_gaps = self._analyze_wealth_gaps(current_wealth, freedom_targets)
-
-            # 4. Recommandations stratégies personnalisées
-            strategies = self._recommend_wealth_strategies(wealth_gaps, current_wealth, country)
-
-            # 5. Calculer timeline réaliste
-            timeline = self._calculate_freedom_timeline(wealth_gaps, strategies, current_wealth)
-
-            # 6. Optimisations fiscales
-            tax_optimizations = self._recommend_tax_optimizations(country, current_wealth)
+            # 1-6. Pipeline mémoïsé: signaux → patrimoine actuel / objectifs → gaps
+            #      → stratégies → timeline, fiscalité (seules les étapes touchées sont recalculées)
+            stages = self.pipeline.run(responses=self._response_items(questionnaire), country=country)
+            current_wealth = stages['current_wealth']
+            freedom_targets = stages['freedom_targets']
+            strategies = stages['strategies']
+            timeline = stages['timeline']
+            tax_optimizations = stages['tax_optimizations']
 
             # 7. Préparer résultat final
             result = {
@@ -234,14 +250,13 @@ class WealthAlgorithm(BaseAlgorithm):
                 "market_insights": {
                     "country": country,
                     "market_data": self.wealth_markets.get(country, {}),
-                    "economic_outlook": self._get_economic_outlook(country)
+                    "economic_outlook": stages['economic_outlook']
                 },
                 "algorithm_version": f"Wealth {self.version}",
                 "analysis_date": datetime.now().strftime("%Y-%m-%d")
             }
 
-            # Cache et logs
-            self.cache_result(cache_key, result, ttl_minutes=120)  # Cache plus long pour wealth
+            # Logs
             self.log_calculation(len(questionnaire), len(strategies), country)
 
             return result
@@ -275,7 +290,55 @@ class WealthAlgorithm(BaseAlgorithm):
 
         return final_score
 
-    def _analyze_current_wealth(self, questionnaire: Dict) -> Dict:
+    @staticmethod
+    def _response_items(questionnaire: Dict) -> Tuple[Tuple[str, str], ...]:
+        """Entrée hashable du pipeline: (clé, texte de réponse) dans l'ordre du questionnaire"""
+        return tuple((key, response_text(response)) for key, response in questionnaire.items())
+
+    def _extract_income_signals(self, responses: Tuple[Tuple[str, str], ...]) -> Tuple[Optional[int], Optional[float]]:
+        """Signaux patrimoine actuel: (revenu mensuel déclaré, taux d'épargne détecté)"""
+        monthly_income, savings_rate = None, None
+
+        for key, text in responses:
+            # Détection revenus: extraire montant numérique
+            if 'income' in key or 'salary' in key or 'revenu' in key:
+                number = _NUMBER_PATTERN.search(text)
+                if number:
+                    monthly_income = int(number.group())
+
+            # Détection épargne
+            matched = WEALTH_KEYWORDS.classify(text)
+            if 'savings' in matched:
+                if 'savings_high' in matched:
+                    savings_rate = 0.25
+                elif 'savings_low' in matched:
+                    savings_rate = 0.05
+
+        return monthly_income, savings_rate
+
+    def _extract_lifestyle_signals(self, responses: Tuple[Tuple[str, str], ...]) -> Tuple[Tuple[str, ...], Optional[int]]:
+        """Signaux objectifs: (ajustements lifestyle successifs, âge cible déclaré)"""
+        adjustments, target_age = [], None
+
+        for key, text in responses:
+            matched = WEALTH_KEYWORDS.classify(text)
+
+            # Détection objectifs lifestyle
+            if 'lifestyle_luxury' in matched:
+                adjustments.append('luxury')
+            elif 'lifestyle_modest' in matched:
+                adjustments.append('modest')
+
+            # Détection âge cible
+            if 'retire' in key or 'retirement' in key or 'retraite' in key:
+                if 'retire_early' in matched:
+                    target_age = 45
+                elif 'retire_late' in matched:
+                    target_age = 65
+
+        return tuple(adjustments), target_age
+
+    def _analyze_current_wealth(self, income_signals: Tuple[Optional[int], Optional[float]]) -> Dict:
         """Analyse la situation financière actuelle"""
         wealth_profile = {
             'monthly_income': 3000,
@@ -288,27 +351,11 @@ class WealthAlgorithm(BaseAlgorithm):
             'health_status': 'developing'
         }
 
-        # Extraction des données du questionnaire
-        for key, response in questionnaire.items():
-            response_text = str(response).lower() if not isinstance(response, dict) else str(response.get('value', '')).lower()
-
-            # Détection revenus
-            if 'income' in key or 'salary' in key or 'revenu' in key:
-                try:
-                    # Extraire montant numérique
-                    import re
-                    numbers = re.findall(r'\d+', response_text)
-                    if numbers:
-                        wealth_profile['monthly_income'] = int(numbers[0])
-                except:
-                    pass
-
-            # Détection épargne
-            if any(word in response_text for word in ['save', 'épargne', 'invest']):
-                if any(word in response_text for word in ['high', 'much', 'beaucoup']):
-                    wealth_profile['savings_rate'] = 0.25
-                elif any(word in response_text for word in ['little', 'peu', 'difficile']):
-                    wealth_profile['savings_rate'] = 0.05
+        monthly_income, savings_rate = income_signals
+        if monthly_income is not None:
+            wealth_profile['monthly_income'] = monthly_income
+        if savings_rate is not None:
+            wealth_profile['savings_rate'] = savings_rate
 
         # Calculer métriques dérivées
         wealth_profile['monthly_expenses'] = wealth_profile['monthly_income'] * (1 - wealth_profile['savings_rate'])
@@ -330,7 +377,7 @@ class WealthAlgorithm(BaseAlgorithm):
 
         return wealth_profile
 
-    def _calculate_freedom_targets(self, questionnaire: Dict, country: str) -> Dict:
+    def _calculate_freedom_targets(self, lifestyle_signals: Tuple[Tuple[str, ...], Optional[int]], country: str) -> Dict:
         """Calcule les objectifs de liberté financière personnalisés"""
         market_data = self.wealth_markets.get(country, self.wealth_markets['france'])
 
@@ -345,24 +392,18 @@ class WealthAlgorithm(BaseAlgorithm):
             'target_age': 55
         }
 
-        # Ajustements selon les réponses
-        for key, response in questionnaire.items():
-            response_text = str(response).lower() if not isinstance(response, dict) else str(response.get('value', '')).lower()
-
-            # Détection objectifs lifestyle
-            if any(word in response_text for word in ['luxury', 'luxe', 'premium']):
+        # Ajustements selon les réponses (appliqués dans l'ordre du questionnaire)
+        adjustments, target_age = lifestyle_signals
+        for lifestyle in adjustments:
+            if lifestyle == 'luxury':
                 targets['monthly_target'] = int(targets['monthly_target'] * 1.5)
                 targets['lifestyle_cost'] = int(targets['lifestyle_cost'] * 1.8)
-            elif any(word in response_text for word in ['simple', 'modest', 'basic']):
+            else:
                 targets['monthly_target'] = int(targets['monthly_target'] * 0.8)
                 targets['lifestyle_cost'] = int(targets['lifestyle_cost'] * 0.7)
 
-            # Détection âge cible
-            if 'retire' in key or 'retirement' in key or 'retraite' in key:
-                if 'early' in response_text or 'tôt' in response_text:
-                    targets['target_age'] = 45
-                elif 'late' in response_text or 'tard' in response_text:
-                    targets['target_age'] = 65
+        if target_age is not None:
+            targets['target_age'] = target_age
 
         # Recalculer net worth nécessaire
         targets['net_worth_needed'] = targets['monthly_target'] * 12 * 25
@@ -506,42 +547,56 @@ class WealthAlgorithm(BaseAlgorithm):
 
         return timeline
 
-    def _recommend_tax_optimizations(self, country: str, current_wealth: Dict) -> List[Dict]:
-        """Recommande optimisations fiscales par pays"""
-        market_data = self.wealth_markets.get(country, {})
-        tax_tools = market_data.get('tax_optimization', ['compte standard'])
+    def _load_market_tables(self):
+        """Tables immuables fiscalité/perspectives + réponses /api/wealth/tax pré-sérialisées"""
+        insights = self.data_loader.load_market_insights() or {}
+        tables = insights.get('wealth', {})
 
-        optimizations = []
+        self.market_version = self.data_loader.get_dataset_version('market_insights.json')
+        outlooks = tables.get('economic_outlook', {})
+        self.economic_outlooks = CountryTable(outlooks, outlooks.get(tables.get('default_outlook_country', 'france'), {}))
+        self.tax_tools = CountryTable(tables.get('tax_tools'))
+        self.tax_general_tips = tuple(tables.get('tax_general_tips', []))
 
-        for tool in tax_tools[:3]:  # TOP 3 outils
-            optimizations.append({
-                'tool': tool,
-                'description': f'Optimisation fiscale via {tool}',
-                'annual_benefit': '1000-3000€',
-                'eligibility': 'selon revenus',
-                'complexity': 'medium'
-            })
+        # Recommandations fiscales précalculées: TOP 3 outils par marché
+        recommendation = tables.get('tax_recommendation', {})
 
-        return optimizations
+        def tax_recommendations(tools: List[str]) -> List[Dict]:
+            return [
+                {'tool': tool, 'description': f'Optimisation fiscale via {tool}', **recommendation}
+                for tool in tools[:3]
+            ]
+
+        self.tax_optimizations = CountryTable(
+            {country: tax_recommendations(market.get('tax_optimization', []))
+             for country, market in self.wealth_markets.items()},
+            tax_recommendations(tables.get('default_tax_tools', ['compte standard']))
+        )
+
+        self._tax_snapshots = lru_cache(maxsize=128)(self._build_tax_snapshot)
+        for country in self.wealth_markets:
+            self._tax_snapshots(country)
+
+    def _recommend_tax_optimizations(self, country: str) -> List[Dict]:
+        """Recommande optimisations fiscales par pays"""
+        return thaw(self.tax_optimizations.get(country))
 
     def _get_economic_outlook(self, country: str) -> Dict:
         """Perspectives économiques par pays"""
-        outlooks = {
-            'france': {
-                'inflation_forecast': '2-3%',
-                'interest_rates_trend': 'stable',
-                'real_estate_outlook': 'modéré',
-                'stock_market_outlook': 'positif'
-            },
-            'usa': {
-                'inflation_forecast': '2-4%',
-                'interest_rates_trend': 'rising',
-                'real_estate_outlook': 'mixed',
-                'stock_market_outlook': 'optimiste'
-            }
-        }
+        return thaw(self.economic_outlooks.get(country))
+
+    def _build_tax_snapshot(self, country: str) -> JsonSnapshot:
+        tools = self.wealth_markets.get(country, {}).get('tax_optimization', [])
+        return JsonSnapshot({
+            'success': True,
+            'country': country,
+            'tax_optimizations': [thaw(self.tax_tools.get(tool)) for tool in tools if tool in self.tax_tools],
+            'general_tips': list(self.tax_general_tips)
+        }, version=self.market_version)
 
-        return outlooks.get(country, outlooks['france'])
+    def get_tax_snapshot(self, country: str) -> JsonSnapshot:
+        """Réponse /api/wealth/tax/<country> pré-sérialisée (ETag versionné par dataset)"""
+        return self._tax_snapshots(country)
 
     def get_supported_markets(self) -> List[str]:
         """Retourne la liste des marchés financiers supportés"""
@@ -559,7 +614,8 @@ class WealthAlgorithm(BaseAlgorithm):
             'supported_markets': len(self.wealth_markets),
             'investment_strategies': len(self.investment_strategies),
             'wealth_criteria': len([c for c in self.get_specific_criteria() if c in ['current_monthly_income', 'target_monthly_expenses']]),
-            'specialization': 'Financial Freedom & Wealth Intelligence'
+            'specialization': 'Financial Freedom & Wealth Intelligence',
+            'pipeline_stages': self.pipeline.get_stats()
         }
 
         return {**base_stats, **wealth_stats}
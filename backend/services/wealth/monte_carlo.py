@@ -0,0 +1,170 @@
+"""
+🎲 WEALTH MONTE CARLO - PROJECTIONS STOCHASTIQUES DE PATRIMOINE
+===============================================================
+Alternative stochastique au 7% fixe du simulateur déterministe
+Des milliers de trajectoires de rendement, vectorisées trajectoires × années
+
+Modèle (même convention que timeline.py, versement en début d'année):
+    W(t+1) = (W(t) + S(t)) × (1 + R(t))
+    1 + R(t) ~ LogNormal, E[R] = mean_return, écart-type ≈ volatility
+    S(t) = épargne annuelle indexée sur l'inflation
+
+Forme cumulée (une passe NumPy, sans boucle sur les années):
+    G(t)  = Π(1 + R(k)), k ≤ t
+    W(t)  = G(t) × (W0 + Σ S(k) / G(k-1))
+
+Résultats en euros constants (déflatés par l'inflation) par défaut.
+Mémoire bornée: trajectoires générées par blocs de CHUNK_PATHS, seul le
+tableau final (trajectoires × années, float32) est conservé.
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .timeline import MAX_YEARS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATHS = 5000
+MAX_PATHS = 20_000
+CHUNK_PATHS = 2000            # Trajectoires simulées par bloc
+PERCENTILES = (10, 50, 90)
+DEFAULT_MILESTONES = (100_000, 250_000, 500_000, 1_000_000)
+MAX_MILESTONES = 20           # Chaque jalon = un parcours complet trajectoires × années
+
+
+def _simulate_chunk(rng: np.random.Generator, paths: int, years: int, current_wealth: float,
+                    annual_savings: float, mean_return: float, volatility: float,
+                    inflation: float, real_terms: bool) -> np.ndarray:
+    """Patrimoine en fin d'année pour un bloc de trajectoires (paths × years)"""
+    # Log-normale calibrée pour que le rendement arithmétique moyen vaille mean_return
+    sigma2 = np.log1p((volatility / (1.0 + mean_return)) ** 2)
+    log_growth = rng.normal(np.log1p(mean_return) - sigma2 / 2, np.sqrt(sigma2), size=(paths, years))
+
+    cumulative = np.cumsum(log_growth, axis=1)
+    growth = np.exp(cumulative)                                   # G(t)
+    growth_before = np.exp(cumulative - log_growth)               # G(t-1), G(-1) = 1
+
+    years_index = np.arange(years)
+    contributions = annual_savings * (1.0 + inflation) ** years_index
+    wealth = growth * (current_wealth + np.cumsum(contributions / growth_before, axis=1))
+
+    if real_terms:
+        wealth /= (1.0 + inflation) ** (years_index + 1)
+
+    return wealth.astype(np.float32)
+
+
+def _first_hit_years(wealth: np.ndarray, amount: float) -> np.ndarray:
+    """Année (1-based) où chaque trajectoire atteint `amount`, 0 si jamais"""
+    reached = wealth >= amount
+    return np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, 0)
+
+
+def _distribution(hit_years: np.ndarray, current_age: int) -> Dict[str, Any]:
+    """Probabilité d'atteinte + percentiles d'année parmi les trajectoires qui atteignent"""
+    hits = hit_years[hit_years > 0]
+    summary = {'probability': round(float(hits.size / hit_years.size), 4)}
+    if hits.size:
+        for p, year in zip(PERCENTILES, np.percentile(hits, PERCENTILES).tolist()):
+            summary[f'p{p}_year'] = int(np.ceil(year))
+            summary[f'p{p}_age'] = current_age + int(np.ceil(year))
+    return summary
+
+
+def run_projection(current_wealth: float = 0.0, monthly_savings: float = 1000.0,
+                   target_amount: float = 500_000.0, current_age: int = 30,
+                   years: int = 30, mean_return: float = 0.07, volatility: float = 0.15,
+                   inflation: float = 0.02, paths: int = DEFAULT_PATHS,
+                   target_age: Optional[int] = None, milestones: Optional[List[float]] = None,
+                   real_terms: bool = True, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Projection Monte Carlo: bandes P10/P50/P90, probabilité d'atteindre la cible
+    avant target_age et distribution des années d'atteinte des jalons
+    """
+    years = int(years)
+    paths = int(paths)
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+    if not 100 <= paths <= MAX_PATHS:
+        raise ValueError(f"paths must be between 100 and {MAX_PATHS}")
+    if milestones is not None and len(milestones) > MAX_MILESTONES:
+        raise ValueError(f"at most {MAX_MILESTONES} milestones")
+    amounts = {'current_wealth': current_wealth, 'monthly_savings': monthly_savings,
+               'target_amount': target_amount, 'expected_roi': mean_return,
+               'volatility': volatility, 'inflation': inflation}
+    for name, value in amounts.items():
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be a finite number")
+    if milestones and not all(math.isfinite(amount) for amount in milestones):
+        raise ValueError("milestones must be finite numbers")
+    if volatility < 0 or mean_return <= -1 or inflation <= -1:
+        raise ValueError("volatility must be >= 0, mean_return and inflation > -1")
+
+    rng = np.random.default_rng(seed)
+    wealth = np.empty((paths, years), dtype=np.float32)
+    for start in range(0, paths, CHUNK_PATHS):
+        stop = min(start + CHUNK_PATHS, paths)
+        wealth[start:stop] = _simulate_chunk(
+            rng, stop - start, years, current_wealth, monthly_savings * 12,
+            mean_return, volatility, inflation, real_terms
+        )
+
+    # 📊 Bandes de patrimoine par année
+    bands_matrix = np.percentile(wealth, PERCENTILES, axis=0)
+    bands = [
+        {
+            'year': year + 1,
+            'age': current_age + year + 1,
+            **{f'p{p}': int(bands_matrix[i, year]) for i, p in enumerate(PERCENTILES)}
+        }
+        for year in range(years)
+    ]
+
+    # 🎯 Cible: probabilité cumulée par année + probabilité avant l'âge visé
+    target_hits = _first_hit_years(wealth, target_amount)
+    reached_by_year = np.bincount(target_hits, minlength=years + 1)[1:].cumsum() / paths
+    if target_age is None:
+        target_age = current_age + years
+    horizon = int(np.clip(target_age - current_age, 0, years))
+    probability_by_age = float(reached_by_year[horizon - 1]) if horizon else 0.0
+
+    # 🏁 Jalons: distribution de l'année d'atteinte
+    milestone_amounts = sorted(set(milestones or DEFAULT_MILESTONES) | {target_amount})
+    milestone_stats = [
+        {'amount': int(amount), **_distribution(_first_hit_years(wealth, amount), current_age)}
+        for amount in milestone_amounts
+    ]
+
+    logger.info(f"🎲 Monte Carlo wealth projection: {paths} paths × {years} years")
+
+    return {
+        'parameters': {
+            'current_wealth': current_wealth,
+            'monthly_savings': monthly_savings,
+            'target_amount': target_amount,
+            'current_age': current_age,
+            'years': years,
+            'mean_return': mean_return,
+            'volatility': volatility,
+            'inflation': inflation,
+            'paths': paths,
+            'real_terms': real_terms,
+            'seed': seed
+        },
+        'bands': bands,
+        'target': {
+            'amount': target_amount,
+            'target_age': target_age,
+            'probability_by_target_age': round(probability_by_age, 4),
+            'probability_by_year': [round(float(p), 4) for p in reached_by_year],
+            **_distribution(target_hits, current_age)
+        },
+        'milestones': milestone_stats,
+        'final_wealth': {
+            f'p{p}': int(value) for p, value in zip(PERCENTILES, bands_matrix[:, -1].tolist())
+        }
+    }
@@ -0,0 +1,113 @@
+"""
+🧩 WEALTH PIPELINE - ÉTAPES PURES MÉMOÏSÉES
+===========================================
+Pipeline d'analyse déclaré étape par étape: chaque étape liste ses entrées
+(entrées externes ou sorties d'étapes précédentes) et possède son propre
+cache LRU borné.
+
+Clé de cache d'une étape:
+- entrée hashable (scalaires, tuples) → sa valeur
+- sortie non hashable (dict, list) → la clé de l'étape qui l'a produite
+
+Une modification partielle du questionnaire ne recalcule donc que les
+étapes dont les entrées ont réellement changé (ex: changer le lifestyle ne
+recalcule ni le patrimoine actuel ni la fiscalité).
+
+Les étapes doivent être pures et leurs sorties traitées en lecture seule:
+une même sortie est partagée entre toutes les requêtes qui la touchent.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+from core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGE_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class Stage:
+    """Étape du pipeline: fonction pure + noms de ses entrées"""
+    name: str
+    func: Callable[..., Any]
+    inputs: Tuple[str, ...]
+    cache_size: int = DEFAULT_STAGE_CACHE_SIZE
+
+
+def _cache_component(value: Any, producer_key: Hashable) -> Hashable:
+    """Composante de clé: la valeur si hashable, sinon la clé de son producteur"""
+    try:
+        hash(value)
+    except TypeError:
+        return ('key', producer_key)
+    return ('value', value)
+
+
+class StagedPipeline:
+    """Exécute des étapes ordonnées avec un cache LRU borné par étape"""
+
+    def __init__(self, stages: Sequence[Stage], external_inputs: Sequence[str], trace_prefix: str = 'pipeline'):
+        self.trace_prefix = trace_prefix
+        self.stages: List[Stage] = list(stages)
+        self.external_inputs = tuple(external_inputs)
+
+        known = set(self.external_inputs)
+        for stage in self.stages:
+            missing = [name for name in stage.inputs if name not in known]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown inputs: {missing}")
+            known.add(stage.name)
+
+        self._caches: Dict[str, OrderedDict] = {stage.name: OrderedDict() for stage in self.stages}
+        self._stats = {stage.name: {'hits': 0, 'misses': 0} for stage in self.stages}
+        self._lock = threading.Lock()
+
+    def run(self, **inputs) -> Dict[str, Any]:
+        """Exécute le pipeline et retourne {entrée/étape: valeur}"""
+        values = {name: inputs[name] for name in self.external_inputs}
+        keys: Dict[str, Hashable] = {name: values[name] for name in self.external_inputs}
+
+        for stage in self.stages:
+            key = tuple(_cache_component(values[name], keys[name]) for name in stage.inputs)
+            cache = self._caches[stage.name]
+
+            with self._lock:
+                cached = key in cache
+                if cached:
+                    cache.move_to_end(key)
+                    value = cache[key]
+                    self._stats[stage.name]['hits'] += 1
+
+            if not cached:
+                with span(f"{self.trace_prefix}.{stage.name}"):
+                    value = stage.func(*(values[name] for name in stage.inputs))
+                with self._lock:
+                    cache[key] = value
+                    if len(cache) > stage.cache_size:
+                        cache.popitem(last=False)
+                    self._stats[stage.name]['misses'] += 1
+
+            values[stage.name] = value
+            keys[stage.name] = key
+
+        return values
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hits/misses et taille du cache par étape"""
+        with self._lock:
+            return {
+                name: {**stats, 'size': len(self._caches[name])}
+                for name, stats in self._stats.items()
+            }
+
+    def clear(self):
+        """Vide les caches de toutes les étapes"""
+        with self._lock:
+            for cache in self._caches.values():
+                cache.clear()
+        logger.info("🗑️ Wealth pipeline caches cleared")
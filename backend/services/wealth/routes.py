@@ -9,13 +9,19 @@ Endpoints:
 - GET /api/wealth/markets → Marchés financiers supportés
 - GET /api/wealth/strategies → Stratégies d'investissement
 - POST /api/wealth/timeline → Simulateur timeline liberté
-- GET /api/wealth/tax → Optimisations fiscales par pays
+- POST /api/wealth/timeline/grid → Heatmap années-jusqu'à-liberté (grille de paramètres)
+- POST /api/wealth/timeline/monte-carlo → Projection stochastique (bandes P10/P50/P90)
+- GET /api/wealth/tax/<country> → Optimisations fiscales par pays (ETag)
 """
 
 import logging
 from flask import Blueprint, request, jsonify, session
 from typing import Dict, Any
+from core.http_cache import snapshot_response
+from core.single_flight import analysis_flight, canonical_key
 from .algorithm import WealthAlgorithm
+from . import monte_carlo
+from . import timeline as timeline_engine
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,14 @@ wealth_bp = Blueprint('wealth', __name__, url_prefix='/api')
 wealth_algorithm = WealthAlgorithm()
 
 
+def run_wealth_analysis(questionnaire: Dict, country: str) -> Dict:
+    """Analyse Wealth, coalescée entre requêtes identiques concurrentes"""
+    return analysis_flight.do(
+        canonical_key('wealth', questionnaire, country),
+        lambda: wealth_algorithm.analyze(questionnaire, country)
+    )
+
+
 @wealth_bp.route('/wealth', methods=['POST'])
 def analyze_wealth():
     """
@@ -44,7 +58,7 @@ def analyze_wealth():
             return jsonify({'error': 'Questionnaire is required'}), 400
 
         # Analyse via algorithme révolutionnaire
-        results = wealth_algorithm.analyze(questionnaire, country)
+        results = run_wealth_analysis(questionnaire, country)
 
         if 'error' in results:
             logger.warning(f"Wealth analysis error: {results['error']}")
@@ -142,36 +156,20 @@ def simulate_timeline():
         target_amount = data.get('target_amount', 500000)
         expected_roi = data.get('expected_roi', 0.07)
         current_age = data.get('current_age', 30)
+        current_wealth = data.get('current_wealth', 0)
 
-        # Calcul timeline avec croissance composée
-        years_needed = 0
-        current_amount = data.get('current_wealth', 0)
-
-        milestones = []
-        while current_amount < target_amount and years_needed < 50:
-            years_needed += 1
-            current_amount = (current_amount + monthly_savings * 12) * (1 + expected_roi)
-
-            # Milestones importantes
-            if years_needed in [5, 10, 15, 20] or current_amount >= target_amount:
-                milestones.append({
-                    'year': years_needed,
-                    'age': current_age + years_needed,
-                    'amount': int(current_amount),
-                    'milestone': f"Patrimoine {int(current_amount//1000)}K €" if current_amount < target_amount else "🎯 Liberté Financière!"
-                })
+        # Calcul timeline en forme fermée (capitalisation annuelle)
+        try:
+            timeline = timeline_engine.simulate_timeline(
+                monthly_savings, target_amount, expected_roi, current_age, current_wealth
+            )
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': str(e)}), 400
+        years_needed = timeline['years_to_freedom']
 
         return jsonify({
             'success': True,
-            'timeline_simulation': {
-                'years_to_freedom': years_needed,
-                'freedom_age': current_age + years_needed,
-                'final_amount': int(current_amount),
-                'total_invested': monthly_savings * 12 * years_needed,
-                'growth_earnings': int(current_amount - (monthly_savings * 12 * years_needed)),
-                'milestones': milestones,
-                'monthly_passive_income': int(current_amount * 0.04 / 12)  # Règle des 4%
-            },
+            'timeline_simulation': timeline,
             'recommendations': {
                 'optimize_savings': 'Augmentez vos économies de 10% pour gagner 2-3 ans',
                 'improve_roi': 'Diversifiez pour viser 8-9% de rendement',
@@ -184,61 +182,88 @@ def simulate_timeline():
         return jsonify({'error': 'Timeline simulation failed'}), 500
 
 
-@wealth_bp.route('/wealth/tax/<country>', methods=['GET'])
-def get_tax_optimizations(country: str):
-    """Optimisations fiscales spécifiques par pays"""
+@wealth_bp.route('/wealth/timeline/grid', methods=['POST'])
+def simulate_timeline_grid():
+    """
+    Heatmap années-jusqu'à-liberté sur une grille de paramètres
+    Chaque axe (monthly_savings, expected_roi, current_wealth) accepte une valeur,
+    une liste ou un range {"min", "max", "steps"}
+    """
     try:
-        market_data = wealth_algorithm.wealth_markets.get(country, {})
-        tax_tools = market_data.get('tax_optimization', [])
-
-        # Détails des outils fiscaux
-        tax_details = {
-            'PEA': {
-                'name': 'Plan Épargne en Actions',
-                'country': 'france',
-                'max_amount': '150,000€',
-                'tax_benefit': 'Exonération après 5 ans',
-                'eligibility': 'Résidents fiscaux français'
-            },
-            'Assurance-vie': {
-                'name': 'Assurance-vie',
-                'country': 'france',
-                'max_amount': 'Illimité',
-                'tax_benefit': 'Fiscalité progressive avantageuse',
-                'eligibility': 'Tous'
-            },
-            '401k': {
-                'name': '401(k) Plan',
-                'country': 'usa',
-                'max_amount': '$23,000/year',
-                'tax_benefit': 'Déduction fiscale immédiate',
-                'eligibility': 'Employés US'
-            },
-            'TFSA': {
-                'name': 'Tax-Free Savings Account',
-                'country': 'canada',
-                'max_amount': '$6,500/year',
-                'tax_benefit': 'Croissance libre d\'impôt',
-                'eligibility': 'Résidents canadiens'
-            }
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No simulation data provided'}), 400
+
+        axes = {
+            'monthly_savings': data.get('monthly_savings', 1000),
+            'expected_roi': data.get('expected_roi', 0.07),
+            'current_wealth': data.get('current_wealth', 0)
         }
+        target_amount = data.get('target_amount', 500000)
+        current_age = data.get('current_age', 30)
 
-        optimizations = []
-        for tool in tax_tools:
-            if tool in tax_details:
-                optimizations.append(tax_details[tool])
+        try:
+            grid = timeline_engine.simulate_timeline_grid(axes, float(target_amount), int(current_age))
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': str(e)}), 400
 
         return jsonify({
             'success': True,
-            'country': country,
-            'tax_optimizations': optimizations,
-            'general_tips': [
-                'Maximiser comptes défiscalisés en priorité',
-                'Étaler gains sur plusieurs années fiscales',
-                'Considérer résidence fiscale optimale'
-            ]
+            'target_amount': target_amount,
+            'grid': grid
+        })
+
+    except Exception as e:
+        logger.error(f"❌ Timeline grid error: {e}")
+        return jsonify({'error': 'Timeline grid simulation failed'}), 500
+
+
+@wealth_bp.route('/wealth/timeline/monte-carlo', methods=['POST'])
+def simulate_timeline_monte_carlo():
+    """
+    Projection stochastique: milliers de trajectoires de rendement
+    Bandes P10/P50/P90, probabilité d'atteindre la cible avant target_age, jalons
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'error': 'No simulation data provided'}), 400
+
+        try:
+            projection = monte_carlo.run_projection(
+                current_wealth=float(data.get('current_wealth', 0)),
+                monthly_savings=float(data.get('monthly_savings', 1000)),
+                target_amount=float(data.get('target_amount', 500000)),
+                current_age=int(data.get('current_age', 30)),
+                years=int(data.get('years', 30)),
+                mean_return=float(data.get('expected_roi', 0.07)),
+                volatility=float(data.get('volatility', 0.15)),
+                inflation=float(data.get('inflation', 0.02)),
+                paths=int(data.get('paths', monte_carlo.DEFAULT_PATHS)),
+                target_age=int(data['target_age']) if data.get('target_age') is not None else None,
+                milestones=[float(m) for m in data['milestones']] if data.get('milestones') else None,
+                real_terms=bool(data.get('real_terms', True)),
+                seed=int(data['seed']) if data.get('seed') is not None else None
+            )
+        except (TypeError, ValueError) as e:
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify({
+            'success': True,
+            'projection': projection
         })
 
+    except Exception as e:
+        logger.error(f"❌ Monte Carlo projection error: {e}")
+        return jsonify({'error': 'Monte Carlo projection failed'}), 500
+
+
+@wealth_bp.route('/wealth/tax/<country>', methods=['GET'])
+def get_tax_optimizations(country: str):
+    """Optimisations fiscales spécifiques par pays (pré-sérialisé, ETag)"""
+    try:
+        return snapshot_response(wealth_algorithm.get_tax_snapshot(country))
+
     except Exception as e:
         logger.error(f"❌ Tax optimization error: {e}")
         return jsonify({'error': 'Failed to load tax optimizations'}), 500
@@ -0,0 +1,195 @@
+"""
+📈 WEALTH TIMELINE - SOLVEUR FORME FERMÉE + GRILLES VECTORISÉES
+===============================================================
+Timeline vers la liberté financière sans boucle année par année
+Le frontend rappelle le simulateur à chaque mouvement de slider
+
+Modèle (capitalisation annuelle, versement en début d'année):
+    W(n+1) = (W(n) + S) × (1 + r)      avec S = épargne mensuelle × 12
+    W(n)   = W0·gⁿ + S·g·(gⁿ - 1)/r      avec g = 1 + r  (W0 + n·S si r = 0)
+
+Années jusqu'à la cible T (plus petit n tel que W(n) ≥ T):
+    n = ⌈ ln((T + c) / (W0 + c)) / ln g ⌉  avec c = S·g/r
+
+Toutes les fonctions acceptent scalaires ou tableaux NumPy (broadcasting):
+une grille 100×100 (épargne × ROI) se calcule en une seule passe.
+"""
+
+import logging
+import math
+from typing import Any, Dict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_YEARS = 50               # Horizon du simulateur (au-delà: non atteint)
+MILESTONE_YEARS = (5, 10, 15, 20)
+MAX_AXIS_STEPS = 200         # Points max par axe de grille
+MAX_GRID_CELLS = 250_000     # Cellules max par requête grille
+
+# Axes de grille, dans l'ordre des dimensions du tableau retourné
+GRID_AXES = ('monthly_savings', 'expected_roi', 'current_wealth')
+
+
+def wealth_after_years(current_wealth, annual_savings, roi, years):
+    """Patrimoine après `years` années (forme fermée, vectorisée)"""
+    current_wealth, annual_savings, roi, years = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (current_wealth, annual_savings, roi, years))
+    )
+    growth = 1.0 + roi
+    growth_n = growth ** years
+    zero_roi = roi == 0.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = np.where(zero_roi, years, growth * (growth_n - 1.0) / np.where(zero_roi, 1.0, roi))
+
+    return current_wealth * growth_n + annual_savings * annuity
+
+
+def years_to_target(current_wealth, annual_savings, roi, target, max_years: int = MAX_YEARS):
+    """
+    Années nécessaires pour atteindre `target` (entier, plafonné à max_years)
+
+    Retourne un tableau (ou un scalaire 0-d) d'entiers. Une cible non atteinte
+    dans l'horizon vaut max_years, comme l'ancien simulateur itératif.
+    """
+    current_wealth, annual_savings, roi, target = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in (current_wealth, annual_savings, roi, target))
+    )
+    growth = 1.0 + roi
+    zero_roi = roi == 0.0
+    safe_roi = np.where(zero_roi, 1.0, roi)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        offset = annual_savings * growth / safe_roi
+        ratio = (target + offset) / (current_wealth + offset)
+        compound_years = np.log(ratio) / np.log(growth)
+        linear_years = (target - current_wealth) / annual_savings
+        exact = np.where(zero_roi, linear_years, compound_years)
+
+    # Non atteignable (NaN, ±inf, négatif) → au-delà de l'horizon
+    exact = np.where(np.isfinite(exact) & (exact >= 0.0), exact, max_years + 1)
+    years = np.clip(np.ceil(exact - 1e-9), 1, max_years + 1)
+
+    # Correction d'arrondi flottant: n doit être le plus petit entier qui atteint la cible
+    reached = wealth_after_years(current_wealth, annual_savings, roi, years) >= target
+    years = np.where(reached | (years > max_years), years, years + 1)
+    previous = np.maximum(years - 1, 1)
+    years = np.where((years > 1) & (wealth_after_years(current_wealth, annual_savings, roi, previous) >= target),
+                     previous, years)
+
+    years = np.where(current_wealth >= target, 0, np.minimum(years, max_years))
+    return years.astype(int)
+
+
+def validate_scenario(**values: float):
+    """Valeurs finies et ROI > -100 % (domaine du modèle: g = 1 + r > 0)"""
+    for name, value in values.items():
+        if not math.isfinite(float(value)):
+            raise ValueError(f"{name} must be a finite number")
+    if float(values.get('expected_roi', 0.0)) <= -1:
+        raise ValueError("expected_roi must be greater than -1")
+
+
+def simulate_timeline(monthly_savings: float, target_amount: float, expected_roi: float,
+                      current_age: int, current_wealth: float = 0.0) -> Dict[str, Any]:
+    """Timeline d'un scénario: années, montants et jalons, sans itération annuelle"""
+    validate_scenario(monthly_savings=monthly_savings, target_amount=target_amount,
+                      expected_roi=expected_roi, current_wealth=current_wealth)
+
+    annual_savings = monthly_savings * 12
+    years_needed = int(years_to_target(current_wealth, annual_savings, expected_roi, target_amount))
+    exact_final = float(wealth_after_years(current_wealth, annual_savings, expected_roi, years_needed))
+    # Atteinte et libellés sur le montant exact; arrondi au micro-euro seulement pour l'affichage
+    reached = exact_final >= target_amount
+    final_amount = round(exact_final, 6)
+
+    milestone_years = [year for year in MILESTONE_YEARS if year < years_needed]
+    if years_needed in MILESTONE_YEARS or (reached and years_needed > 0):
+        milestone_years.append(years_needed)
+    exact_amounts = wealth_after_years(current_wealth, annual_savings, expected_roi,
+                                       np.array(milestone_years, dtype=float))
+
+    milestones = []
+    for year, exact in zip(milestone_years, exact_amounts.tolist()):
+        amount = round(exact, 6)
+        milestones.append({
+            'year': year,
+            'age': current_age + year,
+            'amount': int(amount),
+            'milestone': f"Patrimoine {int(amount//1000)}K €" if exact < target_amount else "🎯 Liberté Financière!"
+        })
+
+    return {
+        'years_to_freedom': years_needed,
+        'freedom_age': current_age + years_needed,
+        'final_amount': int(final_amount),
+        'total_invested': annual_savings * years_needed,
+        'growth_earnings': int(final_amount - (annual_savings * years_needed)),
+        'milestones': milestones,
+        'monthly_passive_income': int(final_amount * 0.04 / 12)  # Règle des 4%
+    }
+
+
+def parse_grid_axis(name: str, spec: Any) -> np.ndarray:
+    """
+    Axe de grille depuis la requête:
+    - nombre → valeur fixe
+    - liste → valeurs explicites
+    - {"min", "max", "steps"} → linspace inclusif
+    """
+    if isinstance(spec, dict):
+        try:
+            low, high = float(spec['min']), float(spec['max'])
+            steps = int(spec.get('steps', 50))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{name}: range requires numeric 'min', 'max' and 'steps'")
+        if not (np.isfinite(low) and np.isfinite(high)):
+            raise ValueError(f"{name}: range bounds must be finite")
+        if not 1 <= steps <= MAX_AXIS_STEPS:
+            raise ValueError(f"{name}: steps must be between 1 and {MAX_AXIS_STEPS}")
+        values = np.linspace(low, high, steps)
+    else:
+        try:
+            values = np.atleast_1d(np.asarray(spec, dtype=float))
+        except (TypeError, ValueError):
+            raise ValueError(f"{name}: values must be numeric")
+    if values.ndim != 1 or not 1 <= values.size <= MAX_AXIS_STEPS or not np.all(np.isfinite(values)):
+        raise ValueError(f"{name}: expected a number, a list of up to {MAX_AXIS_STEPS} values or a range")
+    if name == 'expected_roi' and np.any(values <= -1):
+        raise ValueError(f"{name}: values must be greater than -1")
+    return values
+
+
+def simulate_timeline_grid(axes: Dict[str, Any], target_amount: float,
+                           current_age: int, max_years: int = MAX_YEARS) -> Dict[str, Any]:
+    """
+    Heatmap années-jusqu'à-liberté sur une grille de paramètres (une passe vectorisée)
+
+    Dimensions dans l'ordre de GRID_AXES; les axes à une seule valeur sont
+    retirés du tableau retourné (ex: épargne × ROI → heatmap 2D).
+    """
+    validate_scenario(target_amount=target_amount)
+    values = {name: parse_grid_axis(name, axes[name]) for name in GRID_AXES}
+    cells = int(np.prod([axis.size for axis in values.values()]))
+    if cells > MAX_GRID_CELLS:
+        raise ValueError(f"Grid too large: {cells} cells (max {MAX_GRID_CELLS})")
+
+    savings, roi, wealth = np.meshgrid(values['monthly_savings'] * 12, values['expected_roi'],
+                                       values['current_wealth'], indexing='ij', sparse=True)
+    years = years_to_target(wealth, savings, roi, target_amount, max_years)
+    reached = wealth_after_years(wealth, savings, roi, years) >= target_amount
+
+    varying = [name for name in GRID_AXES if values[name].size > 1]
+    years = years.reshape([values[name].size for name in varying])
+
+    return {
+        'axes': [{'name': name, 'values': values[name].tolist()} for name in varying],
+        'fixed': {name: float(values[name][0]) for name in GRID_AXES if values[name].size == 1},
+        'shape': list(years.shape),
+        'years_to_freedom': years.tolist(),
+        'freedom_age': (years + current_age).tolist(),
+        'max_years': max_years,
+        'reached_share': round(float(np.mean(reached)), 4)
+    }
@@ -17,9 +17,6 @@ __service_name__ = "zscore"
 __endpoints__ = ["/api/calculate", "/api/countries", "/api/stats"]
 
 # Imports du service ZScore Révolutionnaire
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from algorithms_historical.algo_expat import AlgorithmeExpat
 from .routes import zscore_bp
 
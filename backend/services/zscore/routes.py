@@ -13,12 +13,14 @@ Endpoints:
 import logging
 from flask import Blueprint, request, jsonify, session
 from typing import Dict, Any
-import requests
-import sys
-import os
 # 🌍 Import de l'algorithme EXPAT INTERNATIONAL
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from algorithms_historical.algo_expat import AlgorithmeExpat
+from core.lazy_imports import lazy_import
+from core.sanitizer import sanitized_json
+from core.single_flight import analysis_flight, canonical_key
+
+# Client HTTP de la sauvegarde d'analyse (utilisateurs connectés seulement)
+requests = lazy_import('requests')
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,14 @@ zscore_bp = Blueprint('zscore', __name__, url_prefix='/api')
 zscore_algorithm = AlgorithmeExpat()
 
 
+def run_zscore_recommendations(questionnaire: Dict, country: str):
+    """Recommandations ZScore, coalescées entre requêtes identiques concurrentes"""
+    return analysis_flight.do(
+        canonical_key('zscore', questionnaire, country),
+        lambda: zscore_algorithm.calculer_recommandations(questionnaire, country)
+    )
+
+
 @zscore_bp.route('/calculate', methods=['POST'])
 def calculate_zscore():
     """
@@ -36,7 +46,7 @@ def calculate_zscore():
     Analyse villes/pays selon questionnaire utilisateur
     """
     try:
-        data = request.get_json()
+        data = sanitized_json()  # Champs nettoyés à la lecture
         if not data:
             return jsonify({'error': 'No JSON data provided', 'success': False}), 400
 
@@ -44,21 +54,16 @@ def calculate_zscore():
         country = data.get('country', data.get('pays', 'france'))
 
         if not questionnaire:
-            logger.error(f"❌ QUESTIONNAIRE VIDE: data={data}")
+            logger.error(f"❌ QUESTIONNAIRE VIDE: champs reçus={list(data)}")
             return jsonify({'error': 'Questionnaire is required', 'success': False}), 400
 
-        logger.info(f"🎯 ZScore SIMPLE - Questionnaire: {questionnaire}, Pays: {country}")
-        logger.info(f"🔍 DEBUG - Nombre de réponses: {len(questionnaire)}")
-        logger.info(f"🔍 DEBUG - Clés questionnaire: {list(questionnaire.keys())}")
+        logger.info(f"🎯 ZScore SIMPLE - {len(questionnaire)} réponses, Pays: {country}")
+        logger.debug("🔍 Clés questionnaire: %s", list(questionnaire))
 
         try:
-            # 🌍 UTILISER L'ALGORITHME EXPAT INTERNATIONAL
-            algorithm = AlgorithmeExpat()
-            logger.info(f"🧠 DEBUG - Algorithme expat créé")
-
-            # Utiliser la nouvelle méthode calculer_recommandations
-            recommendations = algorithm.calculer_recommandations(questionnaire, country)
-            logger.info(f"🧠 DEBUG - Analyse terminée, nombre de recommandations: {len(recommendations)}")
+            # 🌍 ALGORITHME EXPAT INTERNATIONAL (instance globale sans état, single-flight)
+            recommendations = run_zscore_recommendations(questionnaire, country)
+            logger.debug("🧠 Analyse terminée, nombre de recommandations: %d", len(recommendations))
 
             if recommendations:
                 # Formater pour compatibilité avec l'ancien format
@@ -182,7 +187,7 @@ def get_zscore_stats():
         return jsonify({'error': 'Failed to get stats'}), 500
 
 
-@zscore_bp.route('/health', methods=['GET'])
+@zscore_bp.route('/zscore/health', methods=['GET'])
 def zscore_health():
     """Health check spécifique au service ZScore"""
     try:
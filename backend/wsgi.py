@@ -0,0 +1,25 @@
+"""
+🚀 WSGI - POINT D'ENTRÉE PRODUCTION MULTI-PROCESS
+=================================================
+Application créée et préchargée à l'import: importé une fois par le master
+(gunicorn preload_app, uWSGI sans lazy-apps), les workers forkés héritent
+des datasets déjà chargés et gelés (core.serving).
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+    uwsgi --http :8000 --module wsgi:app --master --processes 4 --enable-threads
+
+main.py reste le serveur de développement (python main.py).
+"""
+
+from core.serving import serving
+from main import app
+
+serving.preload()
+
+try:
+    import uwsgi  # Présent uniquement sous uWSGI (fork en C: os.register_at_fork ne s'exécute pas)
+    uwsgi.post_fork_hook = serving.post_fork
+except ImportError:
+    pass
+
+application = app  # Nom par défaut attendu par uWSGI / mod_wsgi
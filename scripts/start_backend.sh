@@ -1,19 +1,27 @@
 #!/bin/bash
 
 # Script pour démarrer le backend en mode production stable
+# Gunicorn multi-process (backend/gunicorn.conf.py): un worker par cœur,
+# datasets préchargés une fois dans le master et partagés par les workers.
+# Rechargement gracieux sans coupure: kill -HUP $(cat /tmp/backend.pid)
 echo "🚀 Starting ZineInsight Backend..."
 
 cd /var/www/production-workspace/backend
 
-# Tuer les processus existants
+PIDFILE=/tmp/backend.pid
+
+# Tuer les processus existants (ancien serveur de dev inclus)
+if [ -f "$PIDFILE" ]; then
+    kill "$(cat "$PIDFILE")" 2>/dev/null
+fi
 pkill -f "python.*main.py" 2>/dev/null
 
 # Attendre un peu
 sleep 2
 
 # Démarrer le backend
-echo "🌍 Starting on port 8000..."
-python3 main.py > /tmp/backend.log 2>&1 &
+echo "🌍 Starting on port 8000 (${WEB_CONCURRENCY:-$(nproc)} workers)..."
+gunicorn -c gunicorn.conf.py wsgi:app --pid "$PIDFILE" --daemon --error-logfile /tmp/backend.log
 
 # Attendre que le serveur démarre
 sleep 5
@@ -22,7 +30,7 @@ sleep 5
 if netstat -tlnp | grep -q ":8000"; then
     echo "✅ Backend started successfully on port 8000"
     echo "📊 Processes:"
-    ps aux | grep -E "(python.*main.py)" | grep -v grep
+    ps aux | grep -E "(gunicorn.*wsgi:app)" | grep -v grep
 else
     echo "❌ Backend failed to start"
     echo "📋 Last logs:"